@@ -6,7 +6,6 @@ import asyncio
 import json
 import logging
 import time
-from pathlib import Path
 from typing import Optional
 
 import nest_asyncio
@@ -16,9 +15,13 @@ from langchain_openai import ChatOpenAI
 logging.getLogger("httpx").setLevel(logging.WARNING)
 from langchain_core.messages import HumanMessage, SystemMessage
 
-from redis_context_course import CourseManager
+from redis_context_course import CourseManager, count_tokens
+from redis_context_course.catalog import (
+    DEFAULT_CATALOG_PATH,
+    HierarchicalCatalog,
+    get_catalog,
+)
 from redis_context_course.hierarchical_context import RawContextAssembler
-from redis_context_course.hierarchical_models import HierarchicalCourse
 
 from .state import AgentState
 
@@ -27,7 +30,7 @@ logger = logging.getLogger("stage1-baseline")
 
 # Global course manager and hierarchical courses
 course_manager: Optional[CourseManager] = None
-hierarchical_courses = []
+hierarchical_catalog: Optional[HierarchicalCatalog] = None
 
 
 # System instructions hook
@@ -72,31 +75,18 @@ def initialize_nodes(manager: CourseManager):
     Args:
         manager: CourseManager instance for course search
     """
-    global course_manager, hierarchical_courses
+    global course_manager, hierarchical_catalog
     course_manager = manager
 
-    # Load hierarchical courses with full syllabi
+    # Shared catalog: parsed once per process, O(1) lookup by course code,
+    # CourseDetails validated only when a course is first used
     try:
-        data_path = (
-            Path(__file__).resolve().parents[3]
-            / "src"
-            / "redis_context_course"
-            / "data"
-            / "hierarchical"
-            / "hierarchical_courses.json"
+        hierarchical_catalog = get_catalog()
+        logger.info(
+            f"Loaded {len(hierarchical_catalog)} hierarchical courses with full syllabi"
         )
-        
-        if data_path.exists():
-            with open(data_path) as f:
-                data = json.load(f)
-                hierarchical_courses = [
-                    HierarchicalCourse(**course_data) for course_data in data["courses"]
-                ]
-            logger.info(
-                f"Loaded {len(hierarchical_courses)} hierarchical courses with full syllabi"
-            )
-        else:
-            logger.warning(f"Hierarchical courses not found at {data_path}")
+    except FileNotFoundError:
+        logger.warning(f"Hierarchical courses not found at {DEFAULT_CATALOG_PATH}")
     except Exception as e:
         logger.error(f"Failed to load hierarchical courses: {e}")
 
@@ -140,10 +130,13 @@ def research_node(state: AgentState) -> AgentState:
         detailed_courses = []
         for basic_course in basic_courses:
             # Find matching hierarchical course
-            for h_course in hierarchical_courses:
-                if h_course.summary.course_code == basic_course.course_code:
-                    detailed_courses.append(h_course.details)
-                    break
+            h_course = (
+                hierarchical_catalog.get(basic_course.course_code)
+                if hierarchical_catalog
+                else None
+            )
+            if h_course:
+                detailed_courses.append(h_course.details)
             else:
                 # Fallback: create CourseDetails from basic course (without syllabus)
                 logger.warning(f"No hierarchical data for {basic_course.course_code}")
@@ -158,11 +151,11 @@ def research_node(state: AgentState) -> AgentState:
             assembler = RawContextAssembler()
             raw_context = assembler.assemble_raw_context(detailed_courses, query)
 
-        # Calculate approximate token count (rough estimate: 1 token ≈ 4 chars)
-        token_estimate = len(raw_context) // 4
+        # Exact token count of the raw context
+        token_count = count_tokens(raw_context)
 
         logger.info(
-            f"📊 INFORMATION OVERLOAD: {len(raw_context)} chars (~{token_estimate} tokens)"
+            f"📊 INFORMATION OVERLOAD: {len(raw_context)} chars ({token_count} tokens)"
         )
         logger.warning(
             "⚠️  Returning FULL details (including syllabi) for all 5 courses!"
@@ -174,7 +167,7 @@ def research_node(state: AgentState) -> AgentState:
         state["courses_found"] = (
             len(detailed_courses) if detailed_courses else len(basic_courses)
         )
-        state["total_tokens"] = token_estimate
+        state["total_tokens"] = token_count
 
         research_time = (time.perf_counter() - start_time) * 1000
         logger.info(f"🔬 Research complete in {research_time:.2f}ms")
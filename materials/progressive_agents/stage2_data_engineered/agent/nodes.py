@@ -3,10 +3,8 @@ Workflow nodes for Stage 2 Data Engineered Agent.
 """
 
 import asyncio
-import json
 import logging
 import time
-from pathlib import Path
 from typing import Optional
 
 import nest_asyncio
@@ -16,8 +14,12 @@ from langchain_openai import ChatOpenAI
 # Suppress httpx INFO logs
 logging.getLogger("httpx").setLevel(logging.WARNING)
 
-from redis_context_course import CourseManager
-from redis_context_course.hierarchical_models import HierarchicalCourse
+from redis_context_course import CourseManager, count_tokens
+from redis_context_course.catalog import (
+    DEFAULT_CATALOG_PATH,
+    HierarchicalCatalog,
+    get_catalog,
+)
 
 from .data_engineering import format_courses_for_llm
 from .state import AgentState
@@ -26,7 +28,7 @@ from .state import AgentState
 logger = logging.getLogger("stage2-engineered")
 
 course_manager: Optional[CourseManager] = None
-hierarchical_courses = []
+hierarchical_catalog: Optional[HierarchicalCatalog] = None
 
 # Verbose mode flag
 _verbose = True
@@ -48,28 +50,16 @@ def initialize_nodes(manager: CourseManager):
     Args:
         manager: CourseManager instance for course search
     """
-    global course_manager, hierarchical_courses
+    global course_manager, hierarchical_catalog
     course_manager = manager
 
-    # Load hierarchical courses
+    # Shared catalog: parsed once per process, O(1) lookup by course code,
+    # CourseDetails validated only when a course is first used
     try:
-        data_path = (
-            Path(__file__).resolve().parents[3]
-            / "src"
-            / "redis_context_course"
-            / "data"
-            / "hierarchical"
-            / "hierarchical_courses.json"
-        )
-        if data_path.exists():
-            with open(data_path) as f:
-                data = json.load(f)
-                hierarchical_courses = [
-                    HierarchicalCourse(**course_data) for course_data in data["courses"]
-                ]
-            logger.info(f"Loaded {len(hierarchical_courses)} hierarchical courses")
-        else:
-            logger.warning(f"Hierarchical courses not found at {data_path}")
+        hierarchical_catalog = get_catalog()
+        logger.info(f"Loaded {len(hierarchical_catalog)} hierarchical courses")
+    except FileNotFoundError:
+        logger.warning(f"Hierarchical courses not found at {DEFAULT_CATALOG_PATH}")
     except Exception as e:
         logger.error(f"Failed to load hierarchical courses: {e}")
 
@@ -114,18 +104,18 @@ def research_node(state: AgentState) -> AgentState:
             use_compact=False,  # Use full format for better quality
         )
 
-        # Calculate approximate token count (rough estimate: 1 token ≈ 4 chars)
-        token_estimate = len(engineered_context) // 4
+        # Exact token count of the engineered context
+        token_count = count_tokens(engineered_context)
 
         logger.info(
-            f"📊 Engineered context: {len(engineered_context)} chars (~{token_estimate} tokens)"
+            f"📊 Engineered context: {len(engineered_context)} chars ({token_count} tokens)"
         )
         logger.info("✅ data engineering applied:")
         logger.info("   - Cleaned: Removed noise fields (id, timestamps, enrollment)")
         logger.info("   - Transformed: JSON → natural text format")
         state["engineered_context"] = engineered_context
         state["courses_found"] = len(basic_courses)
-        state["total_tokens"] = token_estimate
+        state["total_tokens"] = token_count
 
         research_time = (time.perf_counter() - start_time) * 1000
         logger.info(f"🔬 Research complete in {research_time:.2f}ms")
@@ -31,11 +31,11 @@ async def load_courses_if_needed(
         Number of courses loaded
     """
     # Check if courses already exist
-    existing_courses = await course_manager.get_all_courses()
+    existing_count = await course_manager.count_courses()
 
-    if existing_courses and not force_reload:
-        logger.info(f"📚 Found {len(existing_courses)} existing courses in Redis")
-        return len(existing_courses)
+    if existing_count and not force_reload:
+        logger.info(f"📚 Found {existing_count} existing courses in Redis")
+        return existing_count
 
     logger.info("📚 Generating sample courses...")
 
@@ -57,6 +57,15 @@ async def load_courses_if_needed(
 
     ingested_count = await ingestion.ingest_courses(courses_data)
 
+    # Bump the catalog version so caches of course-derived data move on;
+    # a partial load is not published
+    if ingested_count == len(courses_data):
+        ingestion.manifest.publish(courses_data, count=ingested_count, source="generated")
+    else:
+        logger.warning(
+            f"⚠️ {len(courses_data) - ingested_count} courses failed to load, catalog version not published"
+        )
+
     logger.info(f"✅ Successfully loaded {ingested_count} courses")
 
     return ingested_count
@@ -7,7 +7,13 @@ and context engineering techniques. This is Stage 3 of the progressive learning
 Adapted from the caching-agent architecture with CourseManager integration.
 """
 
-from .nodes import set_classify_intent_function, set_search_tool, set_evaluate_quality_function
+from .nodes import (
+    llm_classify_intent,
+    set_classify_intent_function,
+    set_evaluate_quality_function,
+    set_llm_cache,
+    set_search_tool,
+)
 from .setup import cleanup_courses, initialize_course_manager, setup_agent
 from .state import WorkflowMetrics, WorkflowState, initialize_metrics
 from .tools import optimize_course_text, search_courses, transform_course_to_text
@@ -31,8 +37,10 @@ __all__ = [
     "optimize_course_text",
     # Educational hooks
     "set_classify_intent_function",
+    "llm_classify_intent",
     "set_search_tool",
     "set_evaluate_quality_function",
+    "set_llm_cache",
 ]
 
 __version__ = "0.1.0"
@@ -5,10 +5,18 @@ Stage 3: Agentic workflow with LLM-controlled tool calling.
 """
 
 import logging
+import re
 import time
+from typing import Iterable, Optional
 
 from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 from langchain_openai import ChatOpenAI
+from redis_context_course.catalog import get_catalog
+from redis_context_course.catalog_manifest import CatalogManifest
+from redis_context_course.fast_path import TrivialTurnMatcher
+from redis_context_course.intent_classifier import IntentPrediction
+from redis_context_course.llm_cache import LLMResponseCache
+from redis_context_course.response_cache import ResponseCache
 
 from .state import WorkflowState
 from .tools import search_courses_sync, search_courses_tool
@@ -37,6 +45,36 @@ _search_tool = search_courses_tool
 # Global function for quality evaluation (injectable from notebook)
 _evaluate_quality_func = None
 
+# Rule-based matcher for turns answered without any LLM call
+_trivial_turn_matcher = TrivialTurnMatcher()
+
+# Exact-match response cache for verbatim repeats (created on first use)
+_response_cache = None
+
+# Words that make a query depend on earlier turns, so it must not hit the cache
+_CONTEXT_REFERENCE = re.compile(
+    r"\b(it|its|this|that|these|those|they|them|their|he|she|his|her)\b",
+    re.IGNORECASE,
+)
+
+# Responses produced by error handlers, never cached
+_ERROR_RESPONSE_PREFIXES = ("Error", "I encountered an error")
+
+# Analysis LLM settings (shared by the plain and memoized instances)
+_ANALYSIS_LLM_PARAMS = {
+    "model": "gpt-4o-mini",
+    "temperature": 0.1,
+    "max_tokens": 800,
+    "timeout": 30,
+    "max_retries": 2,
+}
+
+# Nodes whose deterministic analysis prompts are memoized in Redis (opt in
+# per node with set_llm_cache, e.g. set_llm_cache(["classify_intent"]))
+_llm_cache_nodes = set()
+_llm_cache_ttl = 24 * 60 * 60
+_cached_analysis_llms = {}
+
 # Verbose flag for controlling logging output
 _verbose = True
 
@@ -75,17 +113,50 @@ def initialize_nodes():
     pass
 
 
-def get_analysis_llm():
-    """Get the configured analysis LLM instance."""
+def set_llm_cache(nodes: Optional[Iterable[str]] = None, ttl: Optional[int] = None):
+    """
+    Choose which nodes memoize their analysis LLM calls in Redis.
+
+    Args:
+        nodes: Node names that opt in, e.g. "classify_intent",
+            "decompose_query", "extract_entities", "evaluate_quality"
+            (empty disables memoization, the default; None keeps the current set)
+        ttl: Seconds before a memoized response expires
+    """
+    global _llm_cache_nodes, _llm_cache_ttl
+    if nodes is not None:
+        _llm_cache_nodes = set(nodes)
+    if ttl is not None:
+        _llm_cache_ttl = ttl
+    _cached_analysis_llms.clear()
+
+
+def get_analysis_llm(node: Optional[str] = None):
+    """
+    Get the configured analysis LLM instance.
+
+    Nodes that opted into memoization (see set_llm_cache) get their own
+    instance whose responses are cached in Redis, so savings are reported
+    per node by llm_cache_stats().
+    """
     global _analysis_llm
+    if node is not None and node in _llm_cache_nodes:
+        llm = _cached_analysis_llms.get(node)
+        if llm is None:
+            llm = _cached_analysis_llms[node] = ChatOpenAI(
+                **_ANALYSIS_LLM_PARAMS,
+                cache=LLMResponseCache(
+                    model=_ANALYSIS_LLM_PARAMS["model"],
+                    temperature=_ANALYSIS_LLM_PARAMS["temperature"],
+                    max_tokens=_ANALYSIS_LLM_PARAMS["max_tokens"],
+                    node=node,
+                    ttl=_llm_cache_ttl,
+                    manifest=get_catalog_manifest(),
+                ),
+            )
+        return llm
     if _analysis_llm is None:
-        _analysis_llm = ChatOpenAI(
-            model="gpt-4o-mini",
-            temperature=0.1,
-            max_tokens=800,
-            timeout=30,
-            max_retries=2
-        )
+        _analysis_llm = ChatOpenAI(**_ANALYSIS_LLM_PARAMS)
     return _analysis_llm
 
 
@@ -121,41 +192,133 @@ def get_agent_llm():
     return _agent_llm
 
 
-async def classify_intent_node(state: WorkflowState) -> WorkflowState:
-    """Classify query intent and determine appropriate detail level."""
+def get_catalog_manifest() -> Optional[CatalogManifest]:
+    """Manifest of the course index the tools search (None before initialize_tools)."""
+    from . import tools
+
+    return getattr(tools.course_manager, "catalog_manifest", None)
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the exact-match response cache, scoped to the loaded catalog version."""
+    global _response_cache
+    if _response_cache is None:
+        try:
+            catalog_version = get_catalog().version
+        except Exception as e:
+            logger.warning(f"Catalog unavailable, response cache is unversioned: {e}")
+            catalog_version = None
+        _response_cache = ResponseCache(
+            catalog_version=catalog_version, manifest=get_catalog_manifest()
+        )
+    return _response_cache
+
+
+def set_response_cache(cache: Optional[ResponseCache]):
+    """Set the exact-match response cache (None recreates the default)."""
+    global _response_cache
+    _response_cache = cache
+
+
+def _is_context_free(state: WorkflowState) -> bool:
+    """True unless the query refers back to earlier turns ("its", "that course")."""
+    return not (
+        state.get("conversation_history")
+        and _CONTEXT_REFERENCE.search(state["original_query"])
+    )
+
+
+def response_cache_node(state: WorkflowState) -> WorkflowState:
+    """Answer verbatim repeats from the exact-match cache, before any embedding or LLM call."""
     query = state["original_query"]
-    
+    cache = get_response_cache()
+    context_free = _is_context_free(state)
+    entry = cache.get(query) if context_free else None
+    stats = cache.stats()
+
+    metrics = state.get("metrics", {}).copy()
+    metrics["response_cache_tier"] = (
+        entry["tier"] if entry else ("miss" if context_free else "skipped")
+    )
+    metrics["response_cache_l1_hit_rate"] = stats["l1_hit_rate"]
+    metrics["response_cache_l2_hit_rate"] = stats["l2_hit_rate"]
+
+    if entry is None:
+        return {**state, "metrics": metrics}
+
+    logger.info(
+        f"⚡ Response cache {entry['tier'].upper()} hit for '{query[:50]}' "
+        f"(intent {entry['intent']})"
+    )
+    return {
+        **state,
+        "query_intent": entry["intent"],
+        "final_response": entry["response"],
+        "execution_path": state.get("execution_path", []) + ["response_cache_hit"],
+        "metrics": metrics,
+    }
+
+
+def cache_response_node(state: WorkflowState) -> WorkflowState:
+    """Store the final response so verbatim repeats skip the whole workflow."""
+    response = state.get("final_response")
+    intent = state.get("query_intent")
+    if (
+        response
+        and intent
+        and intent != "GREETING"
+        and state.get("metrics", {}).get("response_cache_tier") == "miss"
+        and not response.startswith(_ERROR_RESPONSE_PREFIXES)
+        and state.get("quality_score", 1.0) >= 0.7
+    ):
+        get_response_cache().set(state["original_query"], response, intent)
+        return {
+            **state,
+            "execution_path": state.get("execution_path", []) + ["response_cached"],
+        }
+    return state
+
+
+async def fast_path_node(state: WorkflowState) -> WorkflowState:
+    """Answer greetings, thanks and acknowledgements from templates, with no LLM calls."""
+    query = state["original_query"]
+
     # Reset state for new run (since this is the entry point)
     # This prevents state leakage from previous runs
     state["execution_path"] = []
+    state["final_response"] = None
     state["llm_calls"] = {}
     state["metrics"] = {
         "token_usage": {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0},
         "total_latency": 0.0,
         "llm_calls": {},
+        "fast_path_hits": 0,
+        "response_cache_tier": "",
+        "response_cache_l1_hit_rate": 0.0,
+        "response_cache_l2_hit_rate": 0.0,
         "execution_path": ""
     }
 
-    logger.info(f"🎯 Classifying intent for: '{query[:50]}...'")
+    response = _trivial_turn_matcher.respond(query)
+    if response is None:
+        return state
 
-    try:
-        # Use injected function if provided (for educational exercises)
-        if _classify_intent_func is not None:
-            intent = await _classify_intent_func(query)
-            logger.info(f"🎯 Intent: {intent}")
-            
-            # Track LLM usage
-            llm_calls = state.get("llm_calls", {}).copy()
-            llm_calls["analysis_llm"] = llm_calls.get("analysis_llm", 0) + 1
-            
-            return {
-                **state,
-                "query_intent": intent,
-                "llm_calls": llm_calls,
-            }
-        
-        # Default implementation
-        intent_prompt = f"""You are a query intent classifier for a course information system.
+    logger.info(f"⚡ Fast path: answered '{query[:50]}' without the LLM")
+    metrics = state.get("metrics", {}).copy()
+    metrics["fast_path_hits"] = metrics.get("fast_path_hits", 0) + 1
+
+    return {
+        **state,
+        "query_intent": "GREETING",
+        "final_response": response,
+        "execution_path": state.get("execution_path", []) + ["fast_path"],
+        "metrics": metrics,
+    }
+
+
+def _build_intent_prompt(query: str) -> str:
+    """Build the LLM prompt for intent classification."""
+    return f"""You are a query intent classifier for a course information system.
 
 TASK: Analyze the query and return ONLY the most appropriate intent category.
 
@@ -200,7 +363,66 @@ OUTPUT FORMAT (respond with exactly this structure):
 INTENT: <category_name>
 """
 
-        response = await get_analysis_llm().ainvoke([HumanMessage(content=intent_prompt)])
+
+def _parse_intent(response_content: str) -> str:
+    """Extract the intent from an "INTENT: <category>" response."""
+    intent = "GENERAL"
+    for line in response_content.strip().split("\n"):
+        if line.startswith("INTENT:"):
+            intent = line.split(":", 1)[1].strip()
+    return intent
+
+
+async def llm_classify_intent(query: str) -> str:
+    """
+    Classify a query with the analysis LLM.
+
+    Used as the fallback of EmbeddingIntentClassifier for low-confidence queries.
+    """
+    response = await get_analysis_llm("classify_intent").ainvoke(
+        [HumanMessage(content=_build_intent_prompt(query))]
+    )
+    return _parse_intent(response.content)
+
+
+async def classify_intent_node(state: WorkflowState) -> WorkflowState:
+    """Classify query intent and determine appropriate detail level."""
+    query = state["original_query"]
+    
+    logger.info(f"🎯 Classifying intent for: '{query[:50]}...'")
+
+    try:
+        # Use injected function if provided (for educational exercises,
+        # or an EmbeddingIntentClassifier that only calls the LLM when unsure)
+        if _classify_intent_func is not None:
+            intent = await _classify_intent_func(query)
+            llm_calls = state.get("llm_calls", {}).copy()
+
+            if isinstance(intent, IntentPrediction):
+                logger.info(
+                    f"🎯 Intent: {intent.label} ({intent.source}, "
+                    f"confidence {intent.confidence:.2f}, {intent.latency_ms:.0f}ms)"
+                )
+                used_llm = intent.source == "llm"
+                intent = intent.label
+            else:
+                logger.info(f"🎯 Intent: {intent}")
+                used_llm = True
+
+            # Track LLM usage
+            if used_llm:
+                llm_calls["analysis_llm"] = llm_calls.get("analysis_llm", 0) + 1
+
+            return {
+                **state,
+                "query_intent": intent,
+                "llm_calls": llm_calls,
+            }
+
+        # Default implementation
+        intent_prompt = _build_intent_prompt(query)
+
+        response = await get_analysis_llm("classify_intent").ainvoke([HumanMessage(content=intent_prompt)])
 
         # Track LLM usage
         llm_calls = state.get("llm_calls", {}).copy()
@@ -216,12 +438,7 @@ INTENT: <category_name>
         metrics["token_usage"] = token_usage
 
         # Parse response
-        response_content = response.content.strip()
-        intent = "GENERAL"
-
-        for line in response_content.split("\n"):
-            if line.startswith("INTENT:"):
-                intent = line.split(":", 1)[1].strip()
+        intent = _parse_intent(response.content)
 
         logger.info(f"🎯 Intent: {intent}")
 
@@ -274,7 +491,7 @@ Criteria:
 Respond with ONLY a number between 0.0 and 1.0 (e.g., 0.85)
 """
 
-            response = await get_analysis_llm().ainvoke(
+            response = await get_analysis_llm("evaluate_quality").ainvoke(
                 [HumanMessage(content=evaluation_prompt)]
             )
             llm_calls["analysis_llm"] = llm_calls.get("analysis_llm", 0) + 1
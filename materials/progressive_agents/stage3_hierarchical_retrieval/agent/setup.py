@@ -41,20 +41,20 @@ async def load_courses_if_needed(
     Returns:
         Number of courses loaded
     """
-    existing_courses = await course_manager.get_all_courses()
+    existing_count = await course_manager.count_courses()
 
-    if existing_courses and not force_reload:
-        print(f"📚 Found {len(existing_courses)} existing courses in Redis")
-        return len(existing_courses)
+    if existing_count and not force_reload:
+        print(f"📚 Found {existing_count} existing courses in Redis")
+        return existing_count
 
-    if not existing_courses:
+    if not existing_count:
         print("📦 No courses found in Redis. Loading hierarchical courses...")
     else:
         print("🔄 Force reload requested. Reloading hierarchical courses...")
 
     try:
         # Clear existing data if needed
-        if force_reload or not existing_courses:
+        if force_reload or not existing_count:
             print("🧹 Clearing existing course data...")
             ingestion = CourseIngestionPipeline(config=course_manager._config)
             ingestion.clear_existing_data()
@@ -68,26 +68,28 @@ async def load_courses_if_needed(
         courses_data = data.get("courses", [])
         print(f"Found {len(courses_data)} courses in file")
         
-        # Convert hierarchical courses to Course objects and store
-        loaded = 0
+        # Convert hierarchical courses to Course objects
+        from redis_context_course.models import Course
+
+        courses = []
         for h_course in courses_data:
             try:
-                # Convert to Course format
-                course_dict = hierarchical_to_course(h_course)
-                
-                # Create Course object
-                from redis_context_course.models import Course
-                course = Course(**course_dict)
-                
-                # Store using CourseManager (uses configured embeddings)
-                await course_manager.store_course(course)
-                loaded += 1
-                
-                if loaded % 10 == 0:
-                    print(f"  Loaded {loaded}/{len(courses_data)} courses...")
+                courses.append(Course(**hierarchical_to_course(h_course)))
             except Exception as e:
                 print(f"⚠️ Failed to load course {h_course.get('id', 'unknown')}: {e}")
-                continue
+
+        # Store in batches: one embedding request and one Redis pipeline per batch
+        loaded = len(await course_manager.store_courses(courses))
+
+        # Bump the catalog version so caches of course-derived data move on;
+        # a partial load is not published
+        if loaded == len(courses_data):
+            manifest = course_manager.catalog_manifest.publish(
+                courses_data, count=loaded, source=str(HIERARCHICAL_DATA_PATH)
+            )
+            print(f"🏷️  Catalog version: {manifest.get('version')}")
+        else:
+            print(f"⚠️ {len(courses_data) - loaded} courses failed to load, catalog version not published")
 
         print(f"✅ Loaded {loaded} hierarchical courses into Redis")
         return loaded
@@ -137,8 +139,8 @@ async def initialize_course_manager(
             print(f"✅ CourseManager initialized with {course_count} courses")
         else:
             # Just verify connection
-            all_courses = await course_manager.get_all_courses()
-            print(f"✅ CourseManager initialized with {len(all_courses)} courses")
+            course_count = await course_manager.count_courses()
+            print(f"✅ CourseManager initialized with {course_count} courses")
 
         return course_manager
 
@@ -13,6 +13,10 @@ class WorkflowMetrics(TypedDict):
     total_latency: float
     llm_calls: Dict[str, int]
     token_usage: Dict[str, int]  # Tracks input_tokens, output_tokens, total_tokens
+    fast_path_hits: int  # Turns answered by the rule-based fast path (no LLM calls)
+    response_cache_tier: str  # "l1", "l2", "miss" or "skipped" (context-dependent query)
+    response_cache_l1_hit_rate: float  # Exact-match cache hit ratios (process-wide)
+    response_cache_l2_hit_rate: float
     execution_path: str
 
 
@@ -52,5 +56,9 @@ def initialize_metrics() -> WorkflowMetrics:
         "total_latency": 0.0,
         "llm_calls": {},
         "token_usage": {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0},
+        "fast_path_hits": 0,
+        "response_cache_tier": "",
+        "response_cache_l1_hit_rate": 0.0,
+        "response_cache_l2_hit_rate": 0.0,
         "execution_path": "",
     }
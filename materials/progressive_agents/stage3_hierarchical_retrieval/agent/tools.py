@@ -10,18 +10,20 @@ This demonstrates the transition from scripted to agentic workflows:
 - Hierarchical retrieval with progressive disclosure
 """
 
-import json
 import logging
-from pathlib import Path
 from typing import List, Optional
 
 from langchain_core.tools import tool
 from pydantic import BaseModel, Field
 from redis_context_course import CourseManager
+from redis_context_course.catalog import (
+    DEFAULT_CATALOG_PATH,
+    HierarchicalCatalog,
+    get_catalog,
+)
 from redis_context_course.hierarchical_context import HierarchicalContextAssembler
 from redis_context_course.hierarchical_models import (
     CourseSummary,
-    HierarchicalCourse,
 )
 from redis_context_course.models import Course
 
@@ -35,9 +37,12 @@ if not logger.handlers:
 
 # Global variables that will be set during initialization
 course_manager: Optional[CourseManager] = None
-hierarchical_courses = []
+hierarchical_catalog: Optional[HierarchicalCatalog] = None
 context_assembler = HierarchicalContextAssembler()
 
+# Token budget for assembled course context (keeps prompt sizes predictable)
+CONTEXT_TOKEN_BUDGET = 4000
+
 
 def initialize_tools(manager: CourseManager):
     """
@@ -46,30 +51,20 @@ def initialize_tools(manager: CourseManager):
     Args:
         manager: CourseManager instance for course search
     """
-    global course_manager, hierarchical_courses
+    global course_manager, hierarchical_catalog
     course_manager = manager
 
-    # Load hierarchical courses with full syllabi
+    # Shared catalog: parsed once per process, O(1) lookup by course code,
+    # CourseDetails validated only when a course is first used
     try:
-        data_path = (
-            Path(__file__).resolve().parents[3]
-            / "src"
-            / "redis_context_course"
-            / "data"
-            / "hierarchical"
-            / "hierarchical_courses.json"
+        hierarchical_catalog = get_catalog()
+        logger.info(
+            f"Loaded {len(hierarchical_catalog)} hierarchical courses for progressive disclosure"
         )
-        if data_path.exists():
-            with open(data_path) as f:
-                data = json.load(f)
-                hierarchical_courses = [
-                    HierarchicalCourse(**course_data) for course_data in data["courses"]
-                ]
-            logger.info(
-                f"Loaded {len(hierarchical_courses)} hierarchical courses for progressive disclosure"
-            )
-        else:
-            logger.warning(f"Hierarchical courses not found at {data_path}")
+        # Rendered course fragments are cached per catalog version
+        context_assembler.catalog_version = hierarchical_catalog.version
+    except FileNotFoundError:
+        logger.warning(f"Hierarchical courses not found at {DEFAULT_CATALOG_PATH}")
     except Exception as e:
         logger.error(f"Failed to load hierarchical courses: {e}")
 
@@ -203,11 +198,14 @@ def search_courses_sync(
 
         for basic_course in basic_results:
             # Find matching hierarchical course
-            for h_course in hierarchical_courses:
-                if h_course.summary.course_code == basic_course.course_code:
-                    summaries.append(h_course.summary)
-                    all_details.append(h_course.details)
-                    break
+            h_course = (
+                hierarchical_catalog.get(basic_course.course_code)
+                if hierarchical_catalog
+                else None
+            )
+            if h_course:
+                summaries.append(h_course.summary)
+                all_details.append(h_course.details)
             else:
                 # Fallback: create summary from basic course
                 logger.warning(
@@ -238,8 +236,10 @@ def search_courses_sync(
             hierarchical_context = context_assembler.assemble_summary_only_context(
                 summaries=summaries, query=query
             )
-            token_estimate = len(hierarchical_context) // 4
-            logger.info(f"📊 Summary-only context: ~{token_estimate} tokens")
+            token_count = context_assembler.count_tokens(
+                hierarchical_context, memoize=False
+            )
+            logger.info(f"📊 Summary-only context: {token_count} tokens")
             logger.info(f"   - Summaries for {len(summaries)} courses")
             logger.info("✅ Summary mode: overview only")
         else:
@@ -248,11 +248,15 @@ def search_courses_sync(
             detail_limit = min(3, len(all_details))
             top_details = all_details[:detail_limit]
 
-            hierarchical_context = context_assembler.assemble_hierarchical_context(
-                summaries=summaries, details=top_details, query=query
+            hierarchical_context, token_count = context_assembler.assemble_with_budget(
+                summaries=summaries,
+                details=top_details,
+                query=query,
+                max_tokens=CONTEXT_TOKEN_BUDGET,
+            )
+            logger.info(
+                f"📊 Hierarchical context: {token_count}/{CONTEXT_TOKEN_BUDGET} tokens"
             )
-            token_estimate = len(hierarchical_context) // 4
-            logger.info(f"📊 Hierarchical context: ~{token_estimate} tokens")
             logger.info(f"   - Summaries for {len(summaries)} courses")
             logger.info(
                 f"   - Full details for top {len(top_details)} courses (intent: {intent})"
@@ -306,11 +310,14 @@ async def search_courses(
         all_details = []
 
         for basic_course in basic_results:
-            for h_course in hierarchical_courses:
-                if h_course.summary.course_code == basic_course.course_code:
-                    summaries.append(h_course.summary)
-                    all_details.append(h_course.details)
-                    break
+            h_course = (
+                hierarchical_catalog.get(basic_course.course_code)
+                if hierarchical_catalog
+                else None
+            )
+            if h_course:
+                summaries.append(h_course.summary)
+                all_details.append(h_course.details)
             else:
                 # Fallback: create summary from basic course
                 logger.warning(f"No hierarchical data for {basic_course.course_code}")
@@ -336,14 +343,18 @@ async def search_courses(
         detail_limit = min(3, len(all_details))
         top_details = all_details[:detail_limit]
 
-        # Assemble hierarchical context
-        hierarchical_context = context_assembler.assemble_hierarchical_context(
-            summaries=summaries, details=top_details, query=query
+        # Assemble hierarchical context within the token budget
+        hierarchical_context, token_count = context_assembler.assemble_with_budget(
+            summaries=summaries,
+            details=top_details,
+            query=query,
+            max_tokens=CONTEXT_TOKEN_BUDGET,
         )
 
         # Log token efficiency
-        token_estimate = len(hierarchical_context) // 4
-        logger.info(f"📊 Hierarchical context: ~{token_estimate} tokens")
+        logger.info(
+            f"📊 Hierarchical context: {token_count}/{CONTEXT_TOKEN_BUDGET} tokens"
+        )
         logger.info(f"   - Summaries for {len(summaries)} courses")
         logger.info(
             f"   - Full details (with syllabi) for top {len(top_details)} courses"
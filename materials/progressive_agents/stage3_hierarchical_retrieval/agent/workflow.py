@@ -17,10 +17,13 @@ from .edges import (
 )
 from .nodes import (
     agent_node,
+    cache_response_node,
     classify_intent_node,
     evaluate_quality_node,
+    fast_path_node,
     handle_greeting_node,
     initialize_nodes,
+    response_cache_node,
     set_verbose,
 )
 from .state import WorkflowState, initialize_metrics
@@ -59,13 +62,24 @@ def create_workflow(course_manager, verbose: bool = True):
     workflow = StateGraph(WorkflowState)
 
     # Add nodes
+    workflow.add_node("fast_path", fast_path_node)
+    workflow.add_node("response_cache", response_cache_node)
     workflow.add_node("classify_intent", classify_intent_node)
     workflow.add_node("handle_greeting", handle_greeting_node)
     workflow.add_node("agent", agent_node)
     workflow.add_node("evaluate_quality", evaluate_quality_node)
+    workflow.add_node("cache_response", cache_response_node)
 
-    # Set entry point
-    workflow.set_entry_point("classify_intent")
+    # Set entry point: trivial turns are answered before any LLM call
+    workflow.set_entry_point("fast_path")
+
+    def route_after_fast_path(state: WorkflowState) -> str:
+        """End if the fast path answered the turn, otherwise check the response cache."""
+        return "end" if state.get("final_response") else "response_cache"
+
+    def route_after_response_cache(state: WorkflowState) -> str:
+        """End on an exact-match cache hit, otherwise classify intent."""
+        return "end" if state.get("final_response") else "classify_intent"
 
     # Add routing function for intent classification
     def route_after_intent(state: WorkflowState) -> str:
@@ -78,6 +92,22 @@ def create_workflow(course_manager, verbose: bool = True):
             return "agent"  # Route to agent for all non-greeting queries
 
     # Add edges
+    workflow.add_conditional_edges(
+        "fast_path",
+        route_after_fast_path,
+        {
+            "response_cache": "response_cache",
+            "end": END,
+        },
+    )
+    workflow.add_conditional_edges(
+        "response_cache",
+        route_after_response_cache,
+        {
+            "classify_intent": "classify_intent",
+            "end": END,
+        },
+    )
     workflow.add_conditional_edges(
         "classify_intent",
         route_after_intent,
@@ -95,9 +125,10 @@ def create_workflow(course_manager, verbose: bool = True):
         route_after_quality_evaluation,
         {
             "agent": "agent",  # Loop back if quality is low
-            "end": END,
+            "end": "cache_response",
         },
     )
+    workflow.add_edge("cache_response", END)
 
     # Compile and return
     return workflow.compile()
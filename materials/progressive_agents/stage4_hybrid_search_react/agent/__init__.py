@@ -9,6 +9,7 @@ A LangGraph-based agent for answering questions about courses using:
 This is an alternative to Stage 4 that adds ReAct capabilities.
 """
 
+from .react_agent import get_tool_cache, set_tool_cache
 from .setup import cleanup_courses, initialize_course_manager, setup_agent
 from .state import WorkflowMetrics, WorkflowState, initialize_metrics
 from .tools import optimize_course_text, search_courses_hybrid, transform_course_to_text
@@ -31,6 +32,9 @@ __all__ = [
     "search_courses_hybrid",
     "transform_course_to_text",
     "optimize_course_text",
+    # Tool result cache
+    "get_tool_cache",
+    "set_tool_cache",
 ]
 
 __version__ = "0.1.0"
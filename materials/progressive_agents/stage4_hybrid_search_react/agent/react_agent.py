@@ -7,10 +7,11 @@ This version uses hybrid search with NER (no memory capabilities).
 
 import logging
 import time
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from langchain_core.messages import AIMessage, HumanMessage
 from langchain_openai import ChatOpenAI
+from redis_context_course.tool_result_cache import ToolResultCache
 
 from .react_parser import (
     extract_final_answer,
@@ -27,6 +28,9 @@ logger = logging.getLogger("course-qa-workflow")
 # Global LLM for ReAct
 _react_llm = None
 
+# Tool results cached per session (created on first use)
+_tool_cache = None
+
 # Verbose flag for controlling logging output
 _verbose = True
 
@@ -52,6 +56,25 @@ def get_react_llm() -> ChatOpenAI:
     return _react_llm
 
 
+def get_tool_cache() -> ToolResultCache:
+    """Get the per-session tool result cache (created on first use)."""
+    global _tool_cache
+    if _tool_cache is None:
+        from . import tools
+
+        # Scoped by the manifest of the index the tools search
+        _tool_cache = ToolResultCache(
+            manifest=getattr(tools.course_manager, "catalog_manifest", None)
+        )
+    return _tool_cache
+
+
+def set_tool_cache(cache: Optional[ToolResultCache]):
+    """Set the tool result cache (None recreates the default)."""
+    global _tool_cache
+    _tool_cache = cache
+
+
 async def execute_react_tool(tool_name: str, tool_input: Dict[str, Any]) -> str:
     """
     Execute a tool based on ReAct action.
@@ -95,6 +118,7 @@ async def react_agent_node(state: WorkflowState) -> WorkflowState:
     start_time = time.perf_counter()
 
     query = state["original_query"]
+    session_id = state["session_id"]
 
     logger.info(f"🤖 ReAct Agent: Processing query with explicit reasoning")
 
@@ -170,8 +194,15 @@ async def react_agent_node(state: WorkflowState) -> WorkflowState:
                     observation = format_react_error(f"Invalid JSON: {action_input_str[:100]}")
                 else:
                     # Execute tool
-                    tool_result = await execute_react_tool(action, action_input)
+                    tool_result, cached = await get_tool_cache().call(
+                        session_id,
+                        action,
+                        action_input,
+                        lambda: execute_react_tool(action, action_input),
+                    )
                     observation = format_observation(tool_result, max_length=8000)
+                    if cached:
+                        logger.info("      💾 Observation from tool cache")
                     logger.info(f"      👁️  Observation: {tool_result[:100]}...")
 
                     reasoning_trace.append({
@@ -179,6 +210,7 @@ async def react_agent_node(state: WorkflowState) -> WorkflowState:
                         "action": action,
                         "input": action_input,
                         "observation": tool_result,
+                        "cached": cached,
                         "iteration": iteration,
                     })
 
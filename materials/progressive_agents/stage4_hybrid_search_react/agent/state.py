@@ -33,6 +33,7 @@ class WorkflowState(TypedDict):
 
     # Core query management
     original_query: str
+    session_id: str  # Scopes the per-session tool result cache
     sub_questions: List[str]
     sub_answers: Dict[str, str]
     final_response: Optional[str]
@@ -4,34 +4,31 @@ Tools for the Stage 4 ReAct Course Q&A Agent workflow.
 This version includes:
 - Hybrid search with NER
 - Correct hierarchical data path
-- FilterQuery for exact course code matching
+- Batched tag-union lookup for exact course code matching
 """
 
 import asyncio
-import json
 import logging
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from langchain_core.tools import tool
 from pydantic import BaseModel, Field
 from redis_context_course import CourseManager
-from redis_context_course.hierarchical_context import HierarchicalContextAssembler
-from redis_context_course.hierarchical_models import (
-    CourseDetails,
-    CourseSummary,
-    HierarchicalCourse,
+from redis_context_course.catalog import (
+    DEFAULT_CATALOG_PATH,
+    HierarchicalCatalog,
+    get_catalog,
 )
+from redis_context_course.hierarchical_context import HierarchicalContextAssembler
+from redis_context_course.hierarchical_models import CourseSummary
 from redis_context_course.models import Course
-from redisvl.query import FilterQuery
-from redisvl.query.filter import Tag
 
 # Configure logger
 logger = logging.getLogger("course-qa-workflow")
 
 # Global variables that will be set during initialization
 course_manager: Optional[CourseManager] = None
-hierarchical_courses: List[HierarchicalCourse] = []
+hierarchical_catalog: Optional[HierarchicalCatalog] = None
 context_assembler = HierarchicalContextAssembler()
 
 
@@ -42,31 +39,20 @@ def initialize_tools(manager: CourseManager):
     Args:
         manager: CourseManager instance for course search
     """
-    global course_manager, hierarchical_courses
+    global course_manager, hierarchical_catalog
     course_manager = manager
 
-    # Load hierarchical courses with full syllabi
-    # FIX: Correct path - go up 4 levels from tools.py to reach project root
+    # Shared catalog: parsed once per process, O(1) lookup by course code,
+    # CourseDetails validated only when a course is first used
     try:
-        data_path = (
-            Path(__file__).resolve().parents[3]
-            / "src"
-            / "redis_context_course"
-            / "data"
-            / "hierarchical"
-            / "hierarchical_courses.json"
+        hierarchical_catalog = get_catalog()
+        logger.info(
+            f"Loaded {len(hierarchical_catalog)} hierarchical courses for progressive disclosure"
         )
-        if data_path.exists():
-            with open(data_path) as f:
-                data = json.load(f)
-                hierarchical_courses = [
-                    HierarchicalCourse(**course_data) for course_data in data["courses"]
-                ]
-            logger.info(
-                f"Loaded {len(hierarchical_courses)} hierarchical courses for progressive disclosure"
-            )
-        else:
-            logger.warning(f"Hierarchical courses not found at {data_path}")
+        # Rendered course fragments are cached per catalog version
+        context_assembler.catalog_version = hierarchical_catalog.version
+    except FileNotFoundError:
+        logger.warning(f"Hierarchical courses not found at {DEFAULT_CATALOG_PATH}")
     except Exception as e:
         logger.error(f"Failed to load hierarchical courses: {e}")
 
@@ -123,57 +109,6 @@ def optimize_course_text(course: Course) -> str:
     )
 
 
-def _filter_course_details(
-    details: List[CourseDetails], info_types: List[str]
-) -> List[CourseDetails]:
-    """
-    Filter course details to include only requested information.
-
-    Args:
-        details: List of CourseDetails objects
-        info_types: Types of information requested
-
-    Returns:
-        Filtered CourseDetails with only requested information
-    """
-    if not info_types:
-        return details
-
-    filtered = []
-    for detail in details:
-        filtered_detail = CourseDetails(
-            course_code=detail.course_code,
-            title=detail.title,
-            department=detail.department,
-            credits=detail.credits,
-            difficulty_level=detail.difficulty_level,
-            format=detail.format,
-            instructor=detail.instructor,
-            semester=detail.semester,
-            year=detail.year,
-            max_enrollment=detail.max_enrollment,
-            full_description=detail.full_description
-            if "overview" in info_types or "description" in info_types
-            else "",
-            prerequisites=detail.prerequisites
-            if "prerequisites" in info_types or "prerequisite" in info_types
-            else [],
-            learning_objectives=detail.learning_objectives
-            if "syllabus" in info_types
-            or "learning_objectives" in info_types
-            or "objectives" in info_types
-            else [],
-            syllabus=detail.syllabus if "syllabus" in info_types else detail.syllabus,
-            assignments=detail.assignments
-            if "assignments" in info_types or "assignment" in info_types
-            else [],
-            tags=detail.tags,
-        )
-        filtered.append(filtered_detail)
-
-    return filtered
-
-
 class SearchCoursesInput(BaseModel):
     """Input schema for search_courses tool."""
     query: str = Field(description="Search query")
@@ -194,9 +129,9 @@ async def search_courses_async(
     """
     Async search for courses using hybrid search with NER.
 
-    Uses FilterQuery for exact course code matching.
+    Uses a single tag-union query for exact course code matching.
     """
-    global course_manager, hierarchical_courses
+    global course_manager
 
     if course_manager is None:
         return "Error: Course search not initialized."
@@ -206,31 +141,17 @@ async def search_courses_async(
     basic_results = []
     extracted_entities = extracted_entities or {}
 
-    # Handle exact match strategy with FilterQuery
+    # Handle exact match strategy with a batched course code lookup
     if search_strategy == "exact_match" and extracted_entities.get("course_codes"):
         logger.info(f"   Using exact match for course codes: {extracted_entities['course_codes']}")
-        for course_code in extracted_entities["course_codes"]:
-            # Use FilterQuery for exact course code matching
-            filter_query = FilterQuery(
-                filter_expression=Tag("course_code") == course_code,
-                return_fields=[
-                    "id", "course_code", "title", "description", "department",
-                    "major", "difficulty_level", "format", "semester", "year",
-                    "credits", "tags", "instructor", "max_enrollment",
-                    "current_enrollment", "learning_objectives", "prerequisites",
-                    "schedule", "created_at", "updated_at",
-                ],
-            )
-            results = course_manager.vector_index.query(filter_query)
-            result_list = results if isinstance(results, list) else results.docs
-
-            if result_list:
-                first_result = result_list[0]
-                course_dict = first_result if isinstance(first_result, dict) else first_result.__dict__
-                course = course_manager._dict_to_course(course_dict)
-                if course:
-                    basic_results.append(course)
-                    logger.info(f"   Found exact match: {course_code}")
+        # One tag-union query for all codes instead of one query per code
+        basic_results, missing = await course_manager.get_courses_by_codes(
+            extracted_entities["course_codes"]
+        )
+        for course in basic_results:
+            logger.info(f"   Found exact match: {course.course_code}")
+        if missing:
+            logger.info(f"   No exact match for: {missing}")
     else:
         # Fall back to semantic search
         logger.info(f"   Using semantic search")
@@ -244,9 +165,9 @@ async def search_courses_async(
 
     # Get hierarchical details
     course_codes_list = [c.course_code for c in basic_results]
-    hierarchical_map = {hc.summary.course_code: hc for hc in hierarchical_courses}
-
-    matched_courses = [hierarchical_map[code] for code in course_codes_list if code in hierarchical_map]
+    matched_courses = (
+        hierarchical_catalog.get_many(course_codes_list) if hierarchical_catalog else []
+    )
     logger.info(f"   Hierarchical data for {len(matched_courses)} courses")
 
     # Build context with progressive disclosure
@@ -256,16 +177,15 @@ async def search_courses_async(
         summaries = [c.summary for c in matched_courses]
         details = [c.details for c in matched_courses]
 
-        if info_types:
-            details = _filter_course_details(details, info_types)
-
         # Limit details to top 3 courses
         top_details = details[:min(3, len(details))]
 
+        # Render only the requested sections (cached per course and section set)
         context = context_assembler.assemble_hierarchical_context(
             summaries=summaries,
             details=top_details,
             query=query,
+            detail_sections=context_assembler.sections_for(info_types),
         )
     else:
         # Fallback to basic format
@@ -273,6 +193,15 @@ async def search_courses_async(
         for course in basic_results[:top_k]:
             context += transform_course_to_text(course) + "\n\n"
 
+    # Prerequisite questions get the full chain and unlocks from the graph
+    if intent == "PREREQUISITES":
+        graph = await course_manager.get_prerequisite_graph()
+        graph_lines = [
+            graph.describe(code) for code in course_codes_list[:3] if code in graph
+        ]
+        if graph_lines:
+            context += "\n\n## Prerequisite Graph\n" + "\n".join(graph_lines)
+
     logger.info(f"   Context: {len(context)} chars")
     return context
 
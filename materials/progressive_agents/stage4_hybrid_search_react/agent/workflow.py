@@ -6,8 +6,9 @@ Implements ReAct (Reasoning + Acting) loop with hybrid search.
 
 import logging
 import time
+import uuid
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from langgraph.graph import END, StateGraph
 
@@ -58,7 +59,9 @@ def create_workflow(course_manager, verbose: bool = True):
     return workflow.compile()
 
 
-def run_agent(agent, query: str, enable_caching: bool = False) -> Dict[str, Any]:
+def run_agent(
+    agent, query: str, enable_caching: bool = False, session_id: Optional[str] = None
+) -> Dict[str, Any]:
     """
     Run the Stage 4 ReAct Course Q&A agent on a query (synchronous).
 
@@ -66,16 +69,18 @@ def run_agent(agent, query: str, enable_caching: bool = False) -> Dict[str, Any]
         agent: Compiled LangGraph workflow
         query: User query about courses
         enable_caching: Whether to use semantic caching (currently disabled)
+        session_id: Session the query belongs to; tool results are cached per
+            session (a new session per call if None)
 
     Returns:
         Dictionary with results and metrics
     """
     import asyncio
-    return asyncio.run(run_agent_async(agent, query, enable_caching))
+    return asyncio.run(run_agent_async(agent, query, enable_caching, session_id))
 
 
 async def run_agent_async(
-    agent, query: str, enable_caching: bool = False
+    agent, query: str, enable_caching: bool = False, session_id: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Run the Stage 4 ReAct Course Q&A agent on a query (async).
@@ -84,6 +89,8 @@ async def run_agent_async(
         agent: Compiled LangGraph workflow
         query: User query about courses
         enable_caching: Whether to use semantic caching (currently disabled)
+        session_id: Session the query belongs to; tool results are cached per
+            session (a new session per call if None)
 
     Returns:
         Dictionary with results and metrics
@@ -93,6 +100,7 @@ async def run_agent_async(
     # Initialize state for the workflow
     initial_state: WorkflowState = {
         "original_query": query,
+        "session_id": session_id or f"session_{uuid.uuid4().hex[:8]}",
         "sub_questions": [],
         "sub_answers": {},
         "query_intent": None,
@@ -7,6 +7,7 @@ Usage:
     python cli.py --show-reasoning "your question"   # Show reasoning trace
     python cli.py --simulate                         # Simulate with example queries
     python cli.py --quiet "your question"            # Suppress intermediate logging
+    python cli.py --session-id sess_001              # Reuse a session's tool cache
 """
 
 import asyncio
@@ -14,6 +15,7 @@ import atexit
 import logging
 import os
 import sys
+import uuid
 from pathlib import Path
 
 # Check for quiet mode early, before any logging or imports happen
@@ -62,6 +64,7 @@ class ReActCLI:
         debug: bool = False,
         show_reasoning: bool = False,
         verbose: bool = True,
+        session_id: str = None,
     ):
         self.agent = None
         self.course_manager = None
@@ -69,6 +72,8 @@ class ReActCLI:
         self.debug = debug
         self.show_reasoning = show_reasoning
         self.verbose = verbose
+        # One session per CLI run, so tool results are cached per user session
+        self.session_id = session_id or f"session_{uuid.uuid4().hex[:8]}"
 
         if cleanup_on_exit:
             atexit.register(self._cleanup)
@@ -134,7 +139,9 @@ class ReActCLI:
             print("=" * 80)
             print()
 
-        result = await run_agent_async(self.agent, query, enable_caching=False)
+        result = await run_agent_async(
+            self.agent, query, enable_caching=False, session_id=self.session_id
+        )
 
         # Show reasoning trace if enabled and verbose
         if self.show_reasoning and self.verbose and result.get("reasoning_trace"):
@@ -144,7 +151,8 @@ class ReActCLI:
                 if step["type"] == "thought":
                     print(f"💭 Thought: {step['content']}")
                 elif step["type"] == "action":
-                    print(f"🔧 Action: {step['action']}")
+                    cached = " (cached)" if step.get("cached") else ""
+                    print(f"🔧 Action: {step['action']}{cached}")
                     print(f"   Input: {step['input']}")
                     obs_preview = step['observation'][:200] if len(step['observation']) > 200 else step['observation']
                     print(f"👁️  Observation: {obs_preview}...")
@@ -217,6 +225,10 @@ async def main():
     parser.add_argument("--cleanup", action="store_true", help="Remove courses on exit")
     parser.add_argument("--debug", action="store_true", help="Show detailed errors")
     parser.add_argument("--show-reasoning", action="store_true", help="Show reasoning trace")
+    parser.add_argument(
+        "--session-id",
+        help="Session identifier (auto-generated if not provided)",
+    )
     parser.add_argument(
         "--quiet",
         "-q",
@@ -234,6 +246,7 @@ async def main():
         debug=args.debug,
         show_reasoning=args.show_reasoning,
         verbose=verbose,
+        session_id=args.session_id,
     )
     await cli.initialize()
 
@@ -7,7 +7,12 @@ for multi-turn conversations. This is Stage 5 of the progressive learning path.
 Extends Stage 4 with Agent Memory Server integration.
 """
 
-from .nodes import get_memory_client
+from .nodes import (
+    get_memory_client,
+    llm_classify_intent,
+    set_classify_intent_function,
+    set_llm_cache,
+)
 from .setup import cleanup_courses, initialize_course_manager, setup_agent
 from .state import WorkflowMetrics, WorkflowState, initialize_metrics, initialize_state
 from .tools import optimize_course_text, search_courses, transform_course_to_text, initialize_tools
@@ -37,6 +42,11 @@ __all__ = [
     "search_courses",
     "transform_course_to_text",
     "optimize_course_text",
+    # Intent classification
+    "set_classify_intent_function",
+    "llm_classify_intent",
+    # LLM call memoization
+    "set_llm_cache",
     # Memory
     "get_memory_client",
     "MemoryMessage",
@@ -5,13 +5,23 @@ Stage 5: Agentic workflow with LLM-controlled tool calling.
 """
 
 import logging
+import re
 import os
 import time
+from typing import Iterable, Optional
 
 from agent_memory_client import MemoryAPIClient, MemoryClientConfig
 from agent_memory_client.models import MemoryMessage, WorkingMemory
 from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 from langchain_openai import ChatOpenAI
+from redis_context_course.catalog import get_catalog
+from redis_context_course.catalog_manifest import CatalogManifest
+from redis_context_course.fast_path import TrivialTurnMatcher
+from redis_context_course.intent_classifier import IntentPrediction
+from redis_context_course.llm_cache import LLMResponseCache
+from redis_context_course.response_cache import ResponseCache
+from redis_context_course.semantic_cache import create_semantic_cache
+from redisvl.extensions.cache.llm import SemanticCache
 
 from .state import WorkflowState
 from .tools import search_courses_sync, search_courses_tool
@@ -22,9 +32,8 @@ logging.getLogger("httpx").setLevel(logging.WARNING)
 # Configure logger
 logger = logging.getLogger("course-qa-workflow")
 
-# Global cache variable - COMMENTED OUT FOR NOW
-# Will be added in future stages
-# semantic_cache = None
+# Global semantic cache for course search results (default created on first use)
+semantic_cache = None
 
 # Global LLMs
 _analysis_llm = None
@@ -34,6 +43,39 @@ _agent_llm = None  # NEW: LLM for agent node
 # Global memory client
 _memory_client = None
 
+# Global function for intent classification (injectable, e.g. a local classifier)
+_classify_intent_func = None
+
+# Rule-based matcher for turns answered without any LLM call
+_trivial_turn_matcher = TrivialTurnMatcher()
+
+# Exact-match response cache for verbatim repeats (created on first use)
+_response_cache = None
+
+# Words that make a query depend on earlier turns, so it must not hit the cache
+_CONTEXT_REFERENCE = re.compile(
+    r"\b(it|its|this|that|these|those|they|them|their|he|she|his|her)\b",
+    re.IGNORECASE,
+)
+
+# Responses produced by error handlers, never cached
+_ERROR_RESPONSE_PREFIXES = ("Error", "I encountered an error")
+
+# Analysis LLM settings (shared by the plain and memoized instances)
+_ANALYSIS_LLM_PARAMS = {
+    "model": "gpt-4o-mini",
+    "temperature": 0.1,
+    "max_tokens": 800,
+    "timeout": 30,
+    "max_retries": 2,
+}
+
+# Nodes whose deterministic analysis prompts are memoized in Redis (opt in
+# per node with set_llm_cache, e.g. set_llm_cache(["classify_intent"]))
+_llm_cache_nodes = set()
+_llm_cache_ttl = 24 * 60 * 60
+_cached_analysis_llms = {}
+
 # Verbose flag for controlling logging output
 _verbose = True
 
@@ -44,12 +86,30 @@ def set_verbose(verbose: bool):
     _verbose = verbose
 
 
-def initialize_nodes():
+def set_classify_intent_function(func):
+    """
+    Set a custom intent classification function.
+
+    ``func`` is an async callable taking the query and returning the intent,
+    e.g. an EmbeddingIntentClassifier with ``llm_classify_intent`` as fallback.
+    """
+    global _classify_intent_func
+    _classify_intent_func = func
+
+
+def initialize_nodes(cache: Optional[SemanticCache] = None):
     """Initialize the nodes with required dependencies."""
-    # NOTE: Semantic cache initialization commented out
-    # global semantic_cache
-    # semantic_cache = cache
-    pass
+    global semantic_cache
+    if cache is not None:
+        semantic_cache = cache
+
+
+def get_semantic_cache() -> SemanticCache:
+    """Get the semantic answer cache, creating the default one on first use."""
+    global semantic_cache
+    if semantic_cache is None:
+        semantic_cache = create_semantic_cache(manifest=get_catalog_manifest())
+    return semantic_cache
 
 
 def get_memory_client() -> MemoryAPIClient:
@@ -64,17 +124,50 @@ def get_memory_client() -> MemoryAPIClient:
     return _memory_client
 
 
-def get_analysis_llm():
-    """Get the configured analysis LLM instance."""
+def set_llm_cache(nodes: Optional[Iterable[str]] = None, ttl: Optional[int] = None):
+    """
+    Choose which nodes memoize their analysis LLM calls in Redis.
+
+    Args:
+        nodes: Node names that opt in, e.g. "classify_intent",
+            "decompose_query", "extract_entities", "evaluate_quality"
+            (empty disables memoization, the default; None keeps the current set)
+        ttl: Seconds before a memoized response expires
+    """
+    global _llm_cache_nodes, _llm_cache_ttl
+    if nodes is not None:
+        _llm_cache_nodes = set(nodes)
+    if ttl is not None:
+        _llm_cache_ttl = ttl
+    _cached_analysis_llms.clear()
+
+
+def get_analysis_llm(node: Optional[str] = None):
+    """
+    Get the configured analysis LLM instance.
+
+    Nodes that opted into memoization (see set_llm_cache) get their own
+    instance whose responses are cached in Redis, so savings are reported
+    per node by llm_cache_stats().
+    """
     global _analysis_llm
+    if node is not None and node in _llm_cache_nodes:
+        llm = _cached_analysis_llms.get(node)
+        if llm is None:
+            llm = _cached_analysis_llms[node] = ChatOpenAI(
+                **_ANALYSIS_LLM_PARAMS,
+                cache=LLMResponseCache(
+                    model=_ANALYSIS_LLM_PARAMS["model"],
+                    temperature=_ANALYSIS_LLM_PARAMS["temperature"],
+                    max_tokens=_ANALYSIS_LLM_PARAMS["max_tokens"],
+                    node=node,
+                    ttl=_llm_cache_ttl,
+                    manifest=get_catalog_manifest(),
+                ),
+            )
+        return llm
     if _analysis_llm is None:
-        _analysis_llm = ChatOpenAI(
-            model="gpt-4o-mini",
-            temperature=0.1,
-            max_tokens=800,
-            timeout=30,
-            max_retries=2
-        )
+        _analysis_llm = ChatOpenAI(**_ANALYSIS_LLM_PARAMS)
     return _analysis_llm
 
 
@@ -236,15 +329,128 @@ async def save_working_memory_node(state: WorkflowState) -> WorkflowState:
     return state
 
 
-async def classify_intent_node(state: WorkflowState) -> WorkflowState:
-    """Classify query intent and determine appropriate detail level."""
-    start_time = time.perf_counter()
+def get_catalog_manifest() -> Optional[CatalogManifest]:
+    """Manifest of the course index the tools search (None before initialize_tools)."""
+    from . import tools
+
+    return getattr(tools.course_manager, "catalog_manifest", None)
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the exact-match response cache, scoped to the loaded catalog version."""
+    global _response_cache
+    if _response_cache is None:
+        try:
+            catalog_version = get_catalog().version
+        except Exception as e:
+            logger.warning(f"Catalog unavailable, response cache is unversioned: {e}")
+            catalog_version = None
+        _response_cache = ResponseCache(
+            catalog_version=catalog_version, manifest=get_catalog_manifest()
+        )
+    return _response_cache
+
+
+def set_response_cache(cache: Optional[ResponseCache]):
+    """Set the exact-match response cache (None recreates the default)."""
+    global _response_cache
+    _response_cache = cache
+
+
+def _is_context_free(state: WorkflowState) -> bool:
+    """True unless the query refers back to earlier turns ("its", "that course")."""
+    return not (
+        state.get("conversation_history")
+        and _CONTEXT_REFERENCE.search(state["original_query"])
+    )
+
+
+def response_cache_node(state: WorkflowState) -> WorkflowState:
+    """Answer verbatim repeats from the exact-match cache, before any embedding or LLM call."""
     query = state["original_query"]
+    cache = get_response_cache()
+    context_free = _is_context_free(state)
+    # Answers may draw on the student's history, so entries are per student
+    entry = cache.get(query, scope=state["student_id"]) if context_free else None
+    stats = cache.stats()
+
+    metrics = state.get("metrics", {}).copy()
+    metrics["response_cache_tier"] = (
+        entry["tier"] if entry else ("miss" if context_free else "skipped")
+    )
+    metrics["response_cache_l1_hit_rate"] = stats["l1_hit_rate"]
+    metrics["response_cache_l2_hit_rate"] = stats["l2_hit_rate"]
 
-    logger.info(f"🎯 Classifying intent for: '{query[:50]}...'")
+    if entry is None:
+        return {**state, "metrics": metrics}
 
-    try:
-        intent_prompt = f"""You are a query intent classifier for a course information system.
+    logger.info(
+        f"⚡ Response cache {entry['tier'].upper()} hit for '{query[:50]}' "
+        f"(intent {entry['intent']})"
+    )
+    return {
+        **state,
+        "query_intent": entry["intent"],
+        "final_response": entry["response"],
+        "execution_path": state.get("execution_path", []) + ["response_cache_hit"],
+        "metrics": metrics,
+    }
+
+
+def cache_response_node(state: WorkflowState) -> WorkflowState:
+    """Store the final response so verbatim repeats skip the whole workflow."""
+    response = state.get("final_response")
+    intent = state.get("query_intent")
+    if (
+        response
+        and intent
+        and intent != "GREETING"
+        and state.get("metrics", {}).get("response_cache_tier") == "miss"
+        and not response.startswith(_ERROR_RESPONSE_PREFIXES)
+        and state.get("quality_score", 1.0) >= 0.7
+    ):
+        get_response_cache().set(
+            state["original_query"], response, intent, scope=state["student_id"]
+        )
+        return {
+            **state,
+            "execution_path": state.get("execution_path", []) + ["response_cached"],
+        }
+    return state
+
+
+async def fast_path_node(state: WorkflowState) -> WorkflowState:
+    """Answer greetings, thanks and acknowledgements from templates, with no LLM calls."""
+    query = state["original_query"]
+    # "sure" / "ok" after a question or offer is a follow-up, not small talk
+    previous_response = next(
+        (
+            msg["content"]
+            for msg in reversed(state.get("conversation_history", []))
+            if msg.get("role") == "assistant"
+        ),
+        None,
+    )
+    response = _trivial_turn_matcher.respond(query, previous_response=previous_response)
+    if response is None:
+        return state
+
+    logger.info(f"⚡ Fast path: answered '{query[:50]}' without the LLM")
+    metrics = state.get("metrics", {}).copy()
+    metrics["fast_path_hits"] = metrics.get("fast_path_hits", 0) + 1
+
+    return {
+        **state,
+        "query_intent": "GREETING",
+        "final_response": response,
+        "execution_path": state.get("execution_path", []) + ["fast_path"],
+        "metrics": metrics,
+    }
+
+
+def _build_intent_prompt(query: str) -> str:
+    """Build the LLM prompt for intent classification."""
+    return f"""You are a query intent classifier for a course information system.
 
 TASK: Analyze the query and return ONLY the most appropriate intent category.
 
@@ -289,19 +495,73 @@ OUTPUT FORMAT (respond with exactly this structure):
 INTENT: <category_name>
 """
 
-        response = await get_analysis_llm().ainvoke([HumanMessage(content=intent_prompt)])
+
+def _parse_intent(response_content: str) -> str:
+    """Extract the intent from an "INTENT: <category>" response."""
+    intent = "GENERAL"
+    for line in response_content.strip().split("\n"):
+        if line.startswith("INTENT:"):
+            intent = line.split(":", 1)[1].strip()
+    return intent
+
+
+async def llm_classify_intent(query: str) -> str:
+    """
+    Classify a query with the analysis LLM.
+
+    Used as the fallback of EmbeddingIntentClassifier for low-confidence queries.
+    """
+    response = await get_analysis_llm("classify_intent").ainvoke(
+        [HumanMessage(content=_build_intent_prompt(query))]
+    )
+    return _parse_intent(response.content)
+
+
+async def classify_intent_node(state: WorkflowState) -> WorkflowState:
+    """Classify query intent and determine appropriate detail level."""
+    start_time = time.perf_counter()
+    query = state["original_query"]
+
+    logger.info(f"🎯 Classifying intent for: '{query[:50]}...'")
+
+    try:
+        # Use injected function if provided (e.g. an EmbeddingIntentClassifier
+        # that only calls the LLM when unsure)
+        if _classify_intent_func is not None:
+            intent = await _classify_intent_func(query)
+            llm_calls = state.get("llm_calls", {}).copy()
+
+            if isinstance(intent, IntentPrediction):
+                logger.info(
+                    f"🎯 Intent: {intent.label} ({intent.source}, "
+                    f"confidence {intent.confidence:.2f}, {intent.latency_ms:.0f}ms)"
+                )
+                used_llm = intent.source == "llm"
+                intent = intent.label
+            else:
+                logger.info(f"🎯 Intent: {intent}")
+                used_llm = True
+
+            # Track LLM usage
+            if used_llm:
+                llm_calls["analysis_llm"] = llm_calls.get("analysis_llm", 0) + 1
+
+            return {
+                **state,
+                "query_intent": intent,
+                "llm_calls": llm_calls,
+            }
+
+        intent_prompt = _build_intent_prompt(query)
+
+        response = await get_analysis_llm("classify_intent").ainvoke([HumanMessage(content=intent_prompt)])
 
         # Track LLM usage
         llm_calls = state.get("llm_calls", {}).copy()
         llm_calls["analysis_llm"] = llm_calls.get("analysis_llm", 0) + 1
 
         # Parse response
-        response_content = response.content.strip()
-        intent = "GENERAL"
-
-        for line in response_content.split("\n"):
-            if line.startswith("INTENT:"):
-                intent = line.split(":", 1)[1].strip()
+        intent = _parse_intent(response.content)
 
         logger.info(f"🎯 Intent: {intent}")
 
@@ -367,7 +627,7 @@ def decompose_query_node(state: WorkflowState) -> WorkflowState:
         If keeping as single question, respond with exactly: SINGLE_QUESTION
         """
 
-        response = get_analysis_llm().invoke(
+        response = get_analysis_llm("decompose_query").invoke(
             [HumanMessage(content=decomposition_prompt)]
         )
 
@@ -515,7 +775,7 @@ def extract_entities_node(state: WorkflowState) -> WorkflowState:
         INFO_TYPE: syllabus, assignments
         """
 
-        response = get_analysis_llm().invoke([HumanMessage(content=ner_prompt)])
+        response = get_analysis_llm("extract_entities").invoke([HumanMessage(content=ner_prompt)])
 
         # Track LLM usage
         llm_calls = state.get("llm_calls", {}).copy()
@@ -628,97 +888,6 @@ def extract_entities_node(state: WorkflowState) -> WorkflowState:
         }
 
 
-def check_cache_node(state: WorkflowState) -> WorkflowState:
-    """
-    Check semantic cache for existing answers to sub-questions.
-
-    NOTE: Semantic caching is COMMENTED OUT for now.
-    This node currently just marks all questions as cache misses.
-    Will be implemented in future stages.
-    """
-    start_time = time.perf_counter()
-    sub_questions = state["sub_questions"]
-
-    logger.info(
-        f"🔍 Checking cache for {len(sub_questions)} sub-questions (CACHE DISABLED)"
-    )
-
-    # SEMANTIC CACHING COMMENTED OUT - Will be added later
-    # Original implementation preserved below for reference
-
-    cache_hits = 0
-    for question in sub_questions:
-        # For now, all questions are cache misses
-        state["cache_hits"][question] = False
-        state["cache_confidences"][question] = 0.0
-        logger.info(f"   ❌ Cache MISS (disabled): '{question[:40]}...'")
-
-    # Update metrics
-    cache_time = (time.perf_counter() - start_time) * 1000
-    hit_rate = 0.0  # Always 0 since caching is disabled
-
-    state["metrics"]["cache_latency"] = cache_time
-    state["metrics"]["cache_hit_rate"] = hit_rate
-    state["metrics"]["cache_hits_count"] = cache_hits
-    state["execution_path"].append("cache_checked")
-
-    logger.info(
-        f"🔍 Cache check complete: {cache_hits}/{len(sub_questions)} hits ({hit_rate:.1f}%) in {cache_time:.2f}ms"
-    )
-
-    return state
-
-
-# ORIGINAL SEMANTIC CACHE IMPLEMENTATION (COMMENTED OUT):
-# """
-# def check_cache_node(state: WorkflowState) -> WorkflowState:
-#     start_time = time.perf_counter()
-#     sub_questions = state["sub_questions"]
-#
-#     logger.info(f"🔍 Checking cache for {len(sub_questions)} sub-questions")
-#
-#     cache_hits = 0
-#     for question in sub_questions:
-#         if state["cache_enabled"]:
-#             try:
-#                 cache_results = semantic_cache.check(question, num_results=1)
-#
-#                 if cache_results:
-#                     cached_entry = cache_results[0]
-#                     confidence = 1.0 - cached_entry.get("vector_distance", 1.0)
-#
-#                     state["cache_hits"][question] = True
-#                     state["cache_confidences"][question] = confidence
-#                     state["sub_answers"][question] = cached_entry["response"]
-#                     cache_hits += 1
-#
-#                     logger.info(f"   ✅ Cache HIT: '{question[:40]}...' (confidence: {confidence:.3f})")
-#                 else:
-#                     state["cache_hits"][question] = False
-#                     state["cache_confidences"][question] = 0.0
-#                     logger.info(f"   ❌ Cache MISS: '{question[:40]}...'")
-#             except Exception as e:
-#                 logger.warning(f"Cache check failed for '{question[:40]}...': {e}")
-#                 state["cache_hits"][question] = False
-#                 state["cache_confidences"][question] = 0.0
-#         else:
-#             state["cache_hits"][question] = False
-#             state["cache_confidences"][question] = 0.0
-#
-#     cache_time = (time.perf_counter() - start_time) * 1000
-#     hit_rate = (cache_hits / len(sub_questions)) * 100 if sub_questions else 0
-#
-#     state["metrics"]["cache_latency"] = cache_time
-#     state["metrics"]["cache_hit_rate"] = hit_rate
-#     state["metrics"]["cache_hits_count"] = cache_hits
-#     state["execution_path"].append("cache_checked")
-#
-#     logger.info(f"🔍 Cache check complete: {cache_hits}/{len(sub_questions)} hits ({hit_rate:.1f}%) in {cache_time:.2f}ms")
-#
-#     return state
-# """
-
-
 def research_node(state: WorkflowState) -> WorkflowState:
     """
     Research sub-questions using hybrid search.
@@ -851,7 +1020,7 @@ def evaluate_quality_node(state: WorkflowState) -> WorkflowState:
             Respond with only a number between 0.0 and 1.0 (e.g., 0.85)
             """
 
-            response = get_analysis_llm().invoke(
+            response = get_analysis_llm("evaluate_quality").invoke(
                 [HumanMessage(content=evaluation_prompt)]
             )
             llm_calls["analysis_llm"] = llm_calls.get("analysis_llm", 0) + 1
@@ -914,9 +1083,6 @@ def synthesize_response_node(state: WorkflowState) -> WorkflowState:
     llm_calls = state.get("llm_calls", {}).copy()
 
     try:
-        # NOTE: Semantic cache storage commented out for now
-        # Will be added in future stages
-
         # Create synthesis prompt
         if len(sub_questions) == 1:
             # Single question - adapt based on search strategy
@@ -1266,7 +1432,12 @@ async def react_agent_node(state: WorkflowState) -> WorkflowState:
     try:
         # Create ReAct agent with base LLM (no tool binding)
         llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.1, max_tokens=2000)
-        react_agent = ReActAgent(llm=llm, max_iterations=10)
+        # Course searches consult the semantic cache when caching is enabled
+        react_agent = ReActAgent(
+            llm=llm,
+            max_iterations=10,
+            semantic_cache=get_semantic_cache() if state.get("cache_enabled", False) else None,
+        )
 
         # Run the ReAct loop
         result = await react_agent.run(
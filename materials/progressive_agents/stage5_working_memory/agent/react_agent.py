@@ -13,6 +13,7 @@ from typing import Any, Dict, List, Optional
 
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from redisvl.extensions.cache.llm import SemanticCache
 
 from .react_parser import parse_react_output
 from .react_prompts import REACT_SYSTEM_PROMPT
@@ -41,16 +42,24 @@ class ReActAgent:
     - Single tool: search_courses
     """
     
-    def __init__(self, llm: BaseChatModel, max_iterations: int = 10):
+    def __init__(
+        self,
+        llm: BaseChatModel,
+        max_iterations: int = 10,
+        semantic_cache: Optional[SemanticCache] = None,
+    ):
         """
         Initialize ReAct agent.
         
         Args:
             llm: Language model for reasoning and action selection
             max_iterations: Maximum number of reasoning steps
+            semantic_cache: Semantic cache course searches consult (None disables it)
         """
         self.llm = llm
         self.max_iterations = max_iterations
+        # Passed per call so concurrent agents never share cache settings
+        self.tool_config = {"configurable": {"semantic_cache": semantic_cache}}
 
         # Available tools
         self.tools = {
@@ -173,7 +182,7 @@ class ReActAgent:
             
             # Execute the tool
             tool = self.tools[action]
-            result = await tool.ainvoke(action_input)
+            result = await tool.ainvoke(action_input, config=self.tool_config)
             
             return str(result)
             
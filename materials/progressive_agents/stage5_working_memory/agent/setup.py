@@ -85,15 +85,15 @@ async def load_courses_if_needed(
         Number of courses loaded
     """
     # Check if courses already exist
-    existing_courses = await course_manager.get_all_courses()
+    existing_count = await course_manager.count_courses()
 
     # If courses exist and we're not forcing reload, just return the count
-    if existing_courses and not force_reload:
-        logger.info(f"📚 Found {len(existing_courses)} existing courses in Redis")
-        return len(existing_courses)
+    if existing_count and not force_reload:
+        logger.info(f"📚 Found {existing_count} existing courses in Redis")
+        return existing_count
 
     # If we get here, either no courses exist OR force_reload is True
-    if not existing_courses:
+    if not existing_count:
         logger.info(
             "📦 No courses found in Redis. Loading courses from hierarchical data..."
         )
@@ -103,7 +103,7 @@ async def load_courses_if_needed(
     try:
         # Clear existing data if force_reload (or if empty, to be safe)
         ingestion = CourseIngestionPipeline(config=course_manager._config)
-        if force_reload or not existing_courses:
+        if force_reload or not existing_count:
             logger.info("🧹 Clearing existing course data...")
             ingestion.clear_existing_data()
         
@@ -116,28 +116,31 @@ async def load_courses_if_needed(
         courses_data = data.get("courses", [])
         logger.info(f"Found {len(courses_data)} courses in file")
         
-        # Convert hierarchical courses to Course objects and store
-        loaded = 0
+        # Convert hierarchical courses to Course objects
+        from redis_context_course.models import Course
+
+        courses = []
         for h_course in courses_data:
             try:
-                # Convert to Course format
-                course_dict = hierarchical_to_course(h_course)
-                
-                # Create Course object
-                from redis_context_course.models import Course
-                course = Course(**course_dict)
-                
-                # Store using CourseManager (uses configured embeddings)
-                await course_manager.store_course(course)
-                loaded += 1
-                
-                if loaded % 10 == 0:
-                    logger.info(f"  Loaded {loaded}/{len(courses_data)} courses...")
-                    
+                courses.append(Course(**hierarchical_to_course(h_course)))
             except Exception as e:
                 logger.warning(f"  Failed to load course {h_course.get('id', 'unknown')}: {e}")
-                continue
-        
+
+        # Store in batches: one embedding request and one Redis pipeline per batch
+        loaded = len(await course_manager.store_courses(courses))
+
+        # Bump the catalog version so caches of course-derived data move on;
+        # a partial load is not published
+        if loaded == len(courses_data):
+            manifest = course_manager.catalog_manifest.publish(
+                courses_data, count=loaded, source=str(HIERARCHICAL_DATA_PATH)
+            )
+            logger.info(f"🏷️  Catalog version: {manifest.get('version')}")
+        else:
+            logger.warning(
+                f"⚠️ {len(courses_data) - loaded} courses failed to load, catalog version not published"
+            )
+
         logger.info(f"✅ Successfully loaded {loaded}/{len(courses_data)} courses into Redis")
         return loaded
 
@@ -184,8 +187,8 @@ async def initialize_course_manager(
             logger.info(f"✅ CourseManager initialized with {course_count} courses")
         else:
             # Just verify connection
-            all_courses = await course_manager.get_all_courses()
-            logger.info(f"✅ CourseManager initialized with {len(all_courses)} courses")
+            course_count = await course_manager.count_courses()
+            logger.info(f"✅ CourseManager initialized with {course_count} courses")
 
         return course_manager
 
@@ -9,31 +9,34 @@ This demonstrates the transition from scripted to agentic workflows:
 - Replaces hardcoded nodes with tool-based decision making
 """
 
-import json
 import logging
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import tool
 from pydantic import BaseModel, Field
 from redis_context_course import CourseManager
+from redis_context_course.catalog import (
+    DEFAULT_CATALOG_PATH,
+    HierarchicalCatalog,
+    get_catalog,
+)
 from redis_context_course.hierarchical_context import HierarchicalContextAssembler
 from redis_context_course.hierarchical_models import (
     CourseDetails,
     CourseSummary,
     CourseSyllabus,
-    HierarchicalCourse,
 )
 from redis_context_course.models import Course
-from redisvl.query import FilterQuery
-from redisvl.query.filter import Tag
+from redis_context_course.tool_result_cache import canonical_args
+from redisvl.extensions.cache.llm import SemanticCache
 
 # Configure logger
 logger = logging.getLogger("course-qa-workflow")
 
 # Global variables that will be set during initialization
 course_manager: Optional[CourseManager] = None
-hierarchical_courses = []
+hierarchical_catalog: Optional[HierarchicalCatalog] = None
 context_assembler = HierarchicalContextAssembler()
 
 
@@ -44,30 +47,20 @@ def initialize_tools(manager: CourseManager):
     Args:
         manager: CourseManager instance for course search
     """
-    global course_manager, hierarchical_courses
+    global course_manager, hierarchical_catalog
     course_manager = manager
 
-    # Load hierarchical courses with full syllabi
+    # Shared catalog: parsed once per process, O(1) lookup by course code,
+    # CourseDetails validated only when a course is first used
     try:
-        data_path = (
-            Path(__file__).resolve().parents[3]
-            / "src"
-            / "redis_context_course"
-            / "data"
-            / "hierarchical"
-            / "hierarchical_courses.json"
+        hierarchical_catalog = get_catalog()
+        logger.info(
+            f"Loaded {len(hierarchical_catalog)} hierarchical courses for progressive disclosure"
         )
-        if data_path.exists():
-            with open(data_path) as f:
-                data = json.load(f)
-                hierarchical_courses = [
-                    HierarchicalCourse(**course_data) for course_data in data["courses"]
-                ]
-            logger.info(
-                f"Loaded {len(hierarchical_courses)} hierarchical courses for progressive disclosure"
-            )
-        else:
-            logger.warning(f"Hierarchical courses not found at {data_path}")
+        # Rendered course fragments are cached per catalog version
+        context_assembler.catalog_version = hierarchical_catalog.version
+    except FileNotFoundError:
+        logger.warning(f"Hierarchical courses not found at {DEFAULT_CATALOG_PATH}")
     except Exception as e:
         logger.error(f"Failed to load hierarchical courses: {e}")
 
@@ -134,62 +127,6 @@ def optimize_course_text(course: Course) -> str:
     )
 
 
-def _filter_course_details(
-    details: List[CourseDetails], info_types: List[str]
-) -> List[CourseDetails]:
-    """
-    Filter course details to include only requested information.
-
-    NEW in Stage 4: Targeted information extraction for specific requests.
-
-    Args:
-        details: List of CourseDetails objects
-        info_types: Types of information requested (assignments, syllabus, prerequisites, etc.)
-
-    Returns:
-        Filtered CourseDetails with only requested information
-    """
-    if not info_types:
-        return details
-
-    filtered = []
-    for detail in details:
-        # Create a copy with selective information based on the new simplified model
-        filtered_detail = CourseDetails(
-            course_code=detail.course_code,
-            title=detail.title,
-            department=detail.department,
-            credits=detail.credits,
-            difficulty_level=detail.difficulty_level,
-            format=detail.format,
-            instructor=detail.instructor,
-            semester=detail.semester,
-            year=detail.year,
-            max_enrollment=detail.max_enrollment,
-            full_description=detail.full_description
-            if "overview" in info_types or "description" in info_types
-            else "",
-            prerequisites=detail.prerequisites
-            if "prerequisites" in info_types or "prerequisite" in info_types
-            else [],
-            learning_objectives=detail.learning_objectives
-            if "syllabus" in info_types
-            or "learning_objectives" in info_types
-            or "objectives" in info_types
-            else [],
-            syllabus=detail.syllabus
-            if "syllabus" in info_types
-            else detail.syllabus,  # Always include syllabus structure
-            assignments=detail.assignments
-            if "assignments" in info_types or "assignment" in info_types
-            else [],
-            tags=detail.tags,
-        )
-        filtered.append(filtered_detail)
-
-    return filtered
-
-
 def search_courses_sync(
     query: str,
     top_k: int = 5,
@@ -260,46 +197,10 @@ def search_courses_sync(
                 f"🎯 Exact match search for codes: {extracted_entities['course_codes']}"
             )
 
-            for course_code in extracted_entities["course_codes"]:
-                # Use FilterQuery for exact course code matching (text query, not vector)
-                filter_query = FilterQuery(
-                    filter_expression=Tag("course_code") == course_code,
-                    return_fields=[
-                        "id",
-                        "course_code",
-                        "title",
-                        "description",
-                        "department",
-                        "major",
-                        "difficulty_level",
-                        "format",
-                        "semester",
-                        "year",
-                        "credits",
-                        "tags",
-                        "instructor",
-                        "max_enrollment",
-                        "current_enrollment",
-                        "learning_objectives",
-                        "prerequisites",
-                        "schedule",
-                        "created_at",
-                        "updated_at",
-                    ],
-                )
-                results = course_manager.vector_index.query(filter_query)
-
-                # Handle both list and object with .docs attribute
-                result_list = results if isinstance(results, list) else results.docs
-
-                if result_list:
-                    # Convert result to Course object using CourseManager's method
-                    # Result can be dict or object with __dict__
-                    first_result = result_list[0]
-                    course_dict = first_result if isinstance(first_result, dict) else first_result.__dict__
-                    course = course_manager._dict_to_course(course_dict)
-                    if course:
-                        basic_results.append(course)
+            # Resolve all codes with a single tag-union query
+            basic_results, _ = loop.run_until_complete(
+                course_manager.get_courses_by_codes(extracted_entities["course_codes"])
+            )
 
             # If we found exact matches, we're done
             if basic_results:
@@ -315,17 +216,12 @@ def search_courses_sync(
 
             # First, try exact matches for course codes
             if extracted_entities and extracted_entities.get("course_codes"):
-                for course_code in extracted_entities["course_codes"]:
-                    results = loop.run_until_complete(
-                        course_manager.search_courses(
-                            query=course_code,
-                            filters=None,
-                            limit=1,
-                            similarity_threshold=0.9,
-                        )
+                exact_results, _ = loop.run_until_complete(
+                    course_manager.get_courses_by_codes(
+                        extracted_entities["course_codes"]
                     )
-                    if results:
-                        basic_results.extend(results)
+                )
+                basic_results.extend(exact_results)
 
             # Then, semantic search with metadata filters
             semantic_query = query
@@ -374,11 +270,14 @@ def search_courses_sync(
 
         for basic_course in basic_results:
             # Find matching hierarchical course
-            for h_course in hierarchical_courses:
-                if h_course.summary.course_code == basic_course.course_code:
-                    summaries.append(h_course.summary)
-                    all_details.append(h_course.details)
-                    break
+            h_course = (
+                hierarchical_catalog.get(basic_course.course_code)
+                if hierarchical_catalog
+                else None
+            )
+            if h_course:
+                summaries.append(h_course.summary)
+                all_details.append(h_course.details)
             else:
                 # Fallback: create summary AND details from basic course
                 logger.warning(
@@ -428,14 +327,13 @@ def search_courses_sync(
                 all_details.append(details)
 
         # NEW in Stage 4: Filter details based on requested information type
+        detail_sections = None
         if extracted_entities and extracted_entities.get("information_type"):
             info_types = extracted_entities["information_type"]
             logger.info(f"📋 Filtering for specific information: {info_types}")
 
-            # If specific info requested (assignments, syllabus, etc.), use specialized extraction
-            filtered_details = _filter_course_details(all_details, info_types)
-            if filtered_details:
-                all_details = filtered_details
+            # If specific info requested (assignments, syllabus, etc.), render only those sections
+            detail_sections = context_assembler.sections_for(info_types)
 
         # PROGRESSIVE DISCLOSURE: Adapt based on intent
         if intent == "GENERAL":
@@ -443,8 +341,10 @@ def search_courses_sync(
             hierarchical_context = context_assembler.assemble_summary_only_context(
                 summaries=summaries, query=query
             )
-            token_estimate = len(hierarchical_context) // 4
-            logger.info(f"📊 Summary-only context: ~{token_estimate} tokens")
+            token_count = context_assembler.count_tokens(
+                hierarchical_context, memoize=False
+            )
+            logger.info(f"📊 Summary-only context: {token_count} tokens")
             logger.info(f"   - Summaries for {len(summaries)} courses")
             logger.info("✅ Summary mode: overview only")
         else:
@@ -454,10 +354,15 @@ def search_courses_sync(
             top_details = all_details[:detail_limit]
 
             hierarchical_context = context_assembler.assemble_hierarchical_context(
-                summaries=summaries, details=top_details, query=query
+                summaries=summaries,
+                details=top_details,
+                query=query,
+                detail_sections=detail_sections,
             )
-            token_estimate = len(hierarchical_context) // 4
-            logger.info(f"📊 Hierarchical context: ~{token_estimate} tokens")
+            token_count = context_assembler.count_tokens(
+                hierarchical_context, memoize=False
+            )
+            logger.info(f"📊 Hierarchical context: {token_count} tokens")
             logger.info(f"   - Summaries for {len(summaries)} courses")
             logger.info(
                 f"   - Full details for top {len(top_details)} courses (intent: {intent})"
@@ -466,6 +371,19 @@ def search_courses_sync(
                 "✅ Progressive disclosure: targeted information based on intent!"
             )
 
+        # Prerequisite questions get the full chain and unlocks from the graph
+        if intent == "PREREQUISITES":
+            graph = loop.run_until_complete(course_manager.get_prerequisite_graph())
+            graph_lines = [
+                graph.describe(course.course_code)
+                for course in basic_results[:3]
+                if course.course_code in graph
+            ]
+            if graph_lines:
+                hierarchical_context += "\n\n## Prerequisite Graph\n" + "\n".join(
+                    graph_lines
+                )
+
         return hierarchical_context
 
     except Exception as e:
@@ -511,11 +429,14 @@ async def search_courses(
         all_details = []
 
         for basic_course in basic_results:
-            for h_course in hierarchical_courses:
-                if h_course.summary.course_code == basic_course.course_code:
-                    summaries.append(h_course.summary)
-                    all_details.append(h_course.details)
-                    break
+            h_course = (
+                hierarchical_catalog.get(basic_course.course_code)
+                if hierarchical_catalog
+                else None
+            )
+            if h_course:
+                summaries.append(h_course.summary)
+                all_details.append(h_course.details)
             else:
                 # Fallback: create summary AND details from basic course
                 logger.warning(f"No hierarchical data for {basic_course.course_code}")
@@ -572,8 +493,10 @@ async def search_courses(
         )
 
         # Log token efficiency
-        token_estimate = len(hierarchical_context) // 4
-        logger.info(f"📊 Hierarchical context: ~{token_estimate} tokens")
+        token_count = context_assembler.count_tokens(
+            hierarchical_context, memoize=False
+        )
+        logger.info(f"📊 Hierarchical context: {token_count} tokens")
         logger.info(f"   - Summaries for {len(summaries)} courses")
         logger.info(
             f"   - Full details (with syllabi) for top {len(top_details)} courses"
@@ -621,6 +544,37 @@ class SearchCoursesInput(BaseModel):
     )
 
 
+def _check_search_cache(
+    semantic_cache: SemanticCache, query: str, search_params: str
+) -> Optional[str]:
+    """Result of an earlier search with a similar query and the same parameters."""
+    try:
+        cache_results = semantic_cache.check(prompt=query, num_results=3)
+    except Exception as e:
+        logger.warning(f"Cache check failed for '{query[:40]}...': {e}")
+        return None
+
+    for cached_entry in cache_results:
+        metadata = cached_entry.get("metadata") or {}
+        if metadata.get("search_params") == search_params:
+            return cached_entry["response"]
+    return None
+
+
+def _store_search_result(
+    semantic_cache: SemanticCache, query: str, search_params: str, result: str
+):
+    """Store a search result so paraphrased searches skip course search."""
+    try:
+        semantic_cache.store(
+            prompt=query,
+            response=result,
+            metadata={"tool": "search_courses", "search_params": search_params},
+        )
+    except Exception as e:
+        logger.warning(f"Cache store failed for '{query[:40]}...': {e}")
+
+
 @tool("search_courses", args_schema=SearchCoursesInput)
 async def search_courses_tool(
     query: str,
@@ -630,6 +584,7 @@ async def search_courses_tool(
     information_type: List[str] = [],
     departments: List[str] = [],
     difficulty_level: Optional[str] = None,
+    config: RunnableConfig = None,
 ) -> str:
     """
     Search for courses with flexible parameters controlled by the LLM.
@@ -650,6 +605,8 @@ async def search_courses_tool(
         information_type: Specific info types needed (e.g., ["prerequisites", "syllabus"])
         departments: Filter by departments
         difficulty_level: Filter by difficulty level
+        config: Runnable config; ``configurable["semantic_cache"]`` enables
+            the semantic cache for this call (injected, not set by the LLM)
 
     Returns:
         Formatted course information based on intent and search strategy
@@ -664,6 +621,24 @@ async def search_courses_tool(
     logger.info(f"   Course codes: {course_codes}")
     logger.info(f"   Info types: {information_type}")
 
+    # Paraphrases of an earlier search with the same parameters hit the cache
+    search_params = canonical_args(
+        {
+            "intent": intent,
+            "search_strategy": search_strategy,
+            "course_codes": course_codes,
+            "information_type": information_type,
+            "departments": departments,
+            "difficulty_level": difficulty_level,
+        }
+    )
+    semantic_cache = ((config or {}).get("configurable") or {}).get("semantic_cache")
+    if semantic_cache is not None:
+        cached_result = _check_search_cache(semantic_cache, query, search_params)
+        if cached_result is not None:
+            logger.info(f"   ✅ Cache HIT: '{query[:40]}...'")
+            return cached_result
+
     # Build extracted_entities from tool parameters
     extracted_entities = {
         "course_codes": course_codes,
@@ -689,6 +664,8 @@ async def search_courses_tool(
             metadata_filters=metadata_filters,
         )
         logger.info(f"   ✅ Search completed: {len(result)} chars returned")
+        if semantic_cache is not None and result != "No relevant courses found":
+            _store_search_result(semantic_cache, query, search_params, result)
         return result
     except Exception as e:
         logger.error(f"   ❌ Search failed: {e}")
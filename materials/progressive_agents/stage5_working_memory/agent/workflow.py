@@ -18,16 +18,18 @@ from .edges import (
 )
 from .nodes import (
     agent_node,
-    check_cache_node,
+    cache_response_node,
     classify_intent_node,
     decompose_query_node,
     evaluate_quality_node,
     extract_entities_node,
+    fast_path_node,
     handle_greeting_node,
     initialize_nodes,
     load_working_memory_node,
     react_agent_node,  # NEW: ReAct agent node
     research_node,
+    response_cache_node,
     save_working_memory_node,
     set_verbose,
     synthesize_response_node,
@@ -39,13 +41,15 @@ from .tools import initialize_tools
 logger = logging.getLogger("course-qa-workflow")
 
 
-def create_workflow(course_manager, verbose: bool = True):
+def create_workflow(course_manager, verbose: bool = True, semantic_cache=None):
     """
     Create and compile the complete Memory-Augmented Course Q&A agent workflow.
 
     Args:
         course_manager: CourseManager instance for course search
         verbose: If True, show detailed logging. If False, suppress intermediate logs.
+        semantic_cache: RedisVL SemanticCache for course search results (a default
+            cache is created on first use when caching is enabled)
 
     Returns:
         Compiled LangGraph workflow
@@ -60,7 +64,7 @@ def create_workflow(course_manager, verbose: bool = True):
         logger.setLevel(logging.INFO)
 
     # Initialize all components
-    initialize_nodes()
+    initialize_nodes(semantic_cache)
     initialize_edges()
     initialize_tools(course_manager)
 
@@ -69,14 +73,26 @@ def create_workflow(course_manager, verbose: bool = True):
 
     # Add nodes
     workflow.add_node("load_memory", load_working_memory_node)  # Load working memory
+    workflow.add_node("fast_path", fast_path_node)  # Template replies, no LLM calls
+    workflow.add_node("response_cache", response_cache_node)  # Exact-match cache, no LLM calls
     workflow.add_node("classify_intent", classify_intent_node)  # Classify intent
     workflow.add_node("handle_greeting", handle_greeting_node)  # Handle greetings
     workflow.add_node("react_agent", react_agent_node)  # ReAct agent with explicit reasoning
+    workflow.add_node("cache_response", cache_response_node)  # Store for verbatim repeats
     workflow.add_node("save_memory", save_working_memory_node)  # Save working memory
 
     # Set entry point to load memory first
     workflow.set_entry_point("load_memory")
 
+    # Trivial turns (greetings, thanks) are answered before any LLM call
+    def route_after_fast_path(state: WorkflowState) -> str:
+        """Save memory if the fast path answered the turn, otherwise check the response cache."""
+        return "save_memory" if state.get("final_response") else "response_cache"
+
+    def route_after_response_cache(state: WorkflowState) -> str:
+        """Save memory on an exact-match cache hit, otherwise classify intent."""
+        return "save_memory" if state.get("final_response") else "classify_intent"
+
     # Add routing function for intent classification
     def route_after_intent(state: WorkflowState) -> str:
         """Route based on query intent."""
@@ -88,7 +104,23 @@ def create_workflow(course_manager, verbose: bool = True):
             return "react_agent"  # Route to ReAct agent for all non-greeting queries
 
     # Add edges
-    workflow.add_edge("load_memory", "classify_intent")  # Load memory first
+    workflow.add_edge("load_memory", "fast_path")  # Load memory first
+    workflow.add_conditional_edges(
+        "fast_path",
+        route_after_fast_path,
+        {
+            "response_cache": "response_cache",
+            "save_memory": "save_memory",
+        },
+    )
+    workflow.add_conditional_edges(
+        "response_cache",
+        route_after_response_cache,
+        {
+            "classify_intent": "classify_intent",
+            "save_memory": "save_memory",
+        },
+    )
     workflow.add_conditional_edges(
         "classify_intent",
         route_after_intent,
@@ -98,7 +130,8 @@ def create_workflow(course_manager, verbose: bool = True):
         },
     )
     workflow.add_edge("handle_greeting", "save_memory")  # Save even for greetings
-    workflow.add_edge("react_agent", "save_memory")  # ReAct agent → save memory
+    workflow.add_edge("react_agent", "cache_response")  # ReAct agent → cache response → save memory
+    workflow.add_edge("cache_response", "save_memory")
     workflow.add_edge("save_memory", END)  # End after saving
 
     # Compile and return
@@ -120,7 +153,8 @@ async def run_agent_async(
         query: User query about courses
         session_id: Session identifier for conversation continuity
         student_id: User identifier
-        enable_caching: Whether to use semantic caching (currently disabled)
+        enable_caching: Look up course searches in the semantic cache before
+            searching (the agent still runs with memory and conversation history)
 
     Returns:
         Dictionary with results and metrics
@@ -187,7 +221,8 @@ def run_agent(
         query: User query about courses
         session_id: Session identifier for conversation continuity
         student_id: User identifier
-        enable_caching: Whether to use semantic caching (currently disabled)
+        enable_caching: Look up course searches in the semantic cache before
+            searching (the agent still runs with memory and conversation history)
 
     Returns:
         Dictionary with results and metrics
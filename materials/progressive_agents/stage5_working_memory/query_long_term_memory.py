@@ -4,9 +4,9 @@ Helper module for querying long-term memories from RAMS.
 This demonstrates how RAMS automatically extracts facts from conversations.
 """
 
-import tiktoken
 from typing import List
 from agent_memory_client.filters import UserId
+from redis_context_course.token_counter import get_token_counter
 from agent.nodes import get_memory_client
 
 
@@ -149,7 +149,7 @@ async def analyze_compression(session_ids: List[str], student_id: str = "test_us
     print("=" * 70 + "\n")
     
     memory_client = get_memory_client()
-    encoding = tiktoken.encoding_for_model("gpt-4o")
+    token_counter = get_token_counter("gpt-4o")
     
     total_ltm_tokens = 0
     total_wm_tokens = 0
@@ -166,7 +166,7 @@ async def analyze_compression(session_ids: List[str], student_id: str = "test_us
             if working_memory and working_memory.messages:
                 # Count tokens in working memory (full conversation history)
                 wm_text = "\n".join([f"{msg.role}: {msg.content}" for msg in working_memory.messages])
-                wm_tokens = len(encoding.encode(wm_text))
+                wm_tokens = token_counter.count(wm_text, memoize=False)
                 total_wm_tokens += wm_tokens
                 
                 print(f"Session: {session_id}")
@@ -184,7 +184,7 @@ async def analyze_compression(session_ids: List[str], student_id: str = "test_us
         
         if search_results.memories and len(search_results.memories) > 0:
             ltm_text = "\n".join([mem.text for mem in search_results.memories])
-            total_ltm_tokens = len(encoding.encode(ltm_text))
+            total_ltm_tokens = token_counter.count(ltm_text, memoize=False)
             print(f"\nLong-Term Memory: {len(search_results.memories)} facts, {total_ltm_tokens:,} tokens")
         else:
             print("\n⚠️ No long-term memories found yet")
@@ -4,7 +4,13 @@ Course Q&A Agent - Stage 6 (Full Memory Agent)
 A LangGraph-based agent for answering questions about courses with working memory and long-term memory for cross-session conversations. This is Stage 6 of the progressive learning path.
 """
 
-from .nodes import get_memory_client
+from .nodes import (
+    get_memory_client,
+    llm_classify_intent,
+    set_classify_intent_function,
+    set_llm_cache,
+)
+from .react_agent import get_tool_cache, set_tool_cache
 from .setup import cleanup_courses, initialize_course_manager, setup_agent
 from .state import WorkflowMetrics, WorkflowState, initialize_metrics, initialize_state
 from .tools import optimize_course_text, search_courses, transform_course_to_text, initialize_tools
@@ -30,6 +36,14 @@ __all__ = [
     "search_courses",
     "transform_course_to_text",
     "optimize_course_text",
+    # Intent classification
+    "set_classify_intent_function",
+    "llm_classify_intent",
+    # LLM call memoization
+    "set_llm_cache",
+    # Tool result cache
+    "get_tool_cache",
+    "set_tool_cache",
     # Memory
     "get_memory_client",
     "MemoryMessage",
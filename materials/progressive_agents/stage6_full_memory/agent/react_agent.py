@@ -7,10 +7,12 @@ Implements the Thought → Action → Observation loop with explicit reasoning.
 import json
 import logging
 import time
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from langchain_core.messages import AIMessage, HumanMessage
 from langchain_openai import ChatOpenAI
+from redis_context_course.tool_result_cache import ToolResultCache
+from redisvl.extensions.cache.llm import SemanticCache
 
 from .react_parser import (
     extract_final_answer,
@@ -28,6 +30,9 @@ logger = logging.getLogger("course-qa-workflow")
 # Global LLM for ReAct
 _react_llm = None
 
+# Tool results cached per session (created on first use)
+_tool_cache = None
+
 
 def get_react_llm() -> ChatOpenAI:
     """Get the configured ReAct LLM instance (NO tool binding for ReAct)."""
@@ -44,8 +49,27 @@ def get_react_llm() -> ChatOpenAI:
     return _react_llm
 
 
+def get_tool_cache() -> ToolResultCache:
+    """Get the per-session tool result cache (created on first use)."""
+    global _tool_cache
+    if _tool_cache is None:
+        from .nodes import get_catalog_manifest
+
+        _tool_cache = ToolResultCache(manifest=get_catalog_manifest())
+    return _tool_cache
+
+
+def set_tool_cache(cache: Optional[ToolResultCache]):
+    """Set the tool result cache (None recreates the default)."""
+    global _tool_cache
+    _tool_cache = cache
+
+
 async def execute_react_tool(
-    tool_name: str, tool_input: Dict[str, Any], student_id: str
+    tool_name: str,
+    tool_input: Dict[str, Any],
+    student_id: str,
+    semantic_cache: Optional[SemanticCache] = None,
 ) -> str:
     """
     Execute a tool based on ReAct action.
@@ -54,6 +78,7 @@ async def execute_react_tool(
         tool_name: Name of the tool to execute
         tool_input: Parsed JSON input for the tool
         student_id: Student ID for memory tools
+        semantic_cache: Semantic cache course searches consult (None disables it)
 
     Returns:
         Tool result as string
@@ -62,7 +87,9 @@ async def execute_react_tool(
         if tool_name == "search_courses":
             from .tools import search_courses_tool
 
-            result = await search_courses_tool.ainvoke(tool_input)
+            result = await search_courses_tool.ainvoke(
+                tool_input, config={"configurable": {"semantic_cache": semantic_cache}}
+            )
             return result
 
         elif tool_name == "search_memories":
@@ -115,6 +142,12 @@ async def react_agent_node(state: WorkflowState) -> WorkflowState:
     query = state["original_query"]
     conversation_history = state.get("conversation_history", [])
     student_id = state["student_id"]
+    session_id = state["session_id"]
+
+    # Course searches consult the semantic cache when caching is enabled
+    from .nodes import get_semantic_cache
+
+    semantic_cache = get_semantic_cache() if state.get("cache_enabled", False) else None
 
     logger.info(f"🤖 ReAct Agent: Processing query with explicit reasoning")
 
@@ -210,10 +243,19 @@ async def react_agent_node(state: WorkflowState) -> WorkflowState:
                     logger.error(f"      ❌ Invalid JSON")
                 else:
                     # Execute tool
-                    tool_result = await execute_react_tool(action, action_input, student_id)
+                    tool_result, cached = await get_tool_cache().call(
+                        session_id,
+                        action,
+                        action_input,
+                        lambda: execute_react_tool(
+                            action, action_input, student_id, semantic_cache
+                        ),
+                    )
                     # Use larger max_length to avoid truncating syllabus/detailed course data
                     # 8000 chars ≈ 2000 tokens, sufficient for hierarchical course info
                     observation = format_observation(tool_result, max_length=8000)
+                    if cached:
+                        logger.info("      💾 Observation from tool cache")
                     logger.info(f"      👁️  Observation: {tool_result[:100]}...")
 
                     # Log to reasoning trace
@@ -223,6 +265,7 @@ async def react_agent_node(state: WorkflowState) -> WorkflowState:
                             "action": action,
                             "input": action_input,
                             "observation": tool_result,
+                            "cached": cached,
                             "iteration": iteration,
                         }
                     )
@@ -19,6 +19,10 @@ class WorkflowMetrics(TypedDict):
     memory_save_latency: float  # NEW: Time to save working memory
     cache_hit_rate: float
     cache_hits_count: int
+    fast_path_hits: int  # Turns answered by the rule-based fast path (no LLM calls)
+    response_cache_tier: str  # "l1", "l2", "miss" or "skipped" (context-dependent query)
+    response_cache_l1_hit_rate: float  # Exact-match cache hit ratios (process-wide)
+    response_cache_l2_hit_rate: float
     questions_researched: int
     total_research_iterations: int
     llm_calls: Dict[str, int]
@@ -105,6 +109,10 @@ def initialize_metrics() -> WorkflowMetrics:
         "memory_save_latency": 0.0,
         "cache_hit_rate": 0.0,
         "cache_hits_count": 0,
+        "fast_path_hits": 0,
+        "response_cache_tier": "",
+        "response_cache_l1_hit_rate": 0.0,
+        "response_cache_l2_hit_rate": 0.0,
         "questions_researched": 0,
         "total_research_iterations": 0,
         "llm_calls": {},
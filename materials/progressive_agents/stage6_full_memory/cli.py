@@ -180,7 +180,8 @@ class ReActCLI:
                 if step["type"] == "thought":
                     print(f"💭 Thought: {step['content']}")
                 elif step["type"] == "action":
-                    print(f"🔧 Action: {step['action']}")
+                    cached = " (cached)" if step.get("cached") else ""
+                    print(f"🔧 Action: {step['action']}{cached}")
                     print(f"   Input: {step['input']}")
                     print(f"👁️  Observation: {step['observation'][:200]}...")
                 elif step["type"] == "finish":
@@ -16,6 +16,8 @@ Main Components:
 - memory_client: Interface to Redis Agent Memory Server
 - course_manager: Course storage and recommendation engine
 - redis_config: Redis configuration and connections
+- embedding_cache: Content-addressed cache in front of the embeddings model
+- token_counter: Shared, memoized tiktoken token counting
 - tools: Tool definitions for building agents
 
 Installation:
@@ -42,11 +44,18 @@ from agent_memory_client import MemoryAPIClient as MemoryClient
 from agent_memory_client import MemoryClientConfig
 
 # Import course manager
+from .catalog import HierarchicalCatalog, get_catalog
+from .catalog_manifest import CatalogManifest
 from .course_manager import CourseManager
+from .embedding_cache import CachedEmbeddings, EmbeddingCache
+from .fast_path import TrivialTurnMatcher
+from .intent_classifier import EmbeddingIntentClassifier, IntentPrediction
+from .llm_cache import LLMResponseCache, llm_cache_stats
 from .models import (
     AgentResponse,
     Course,
     CourseFormat,
+    CourseOverview,
     CourseRecommendation,
     CourseSchedule,
     DayOfWeek,
@@ -69,7 +78,12 @@ from .optimization_helpers import (
     format_context_for_llm,
     hybrid_retrieval,
 )
+from .prerequisite_graph import PrerequisiteGraph
 from .redis_config import RedisConfig, redis_config
+from .response_cache import ResponseCache
+from .semantic_cache import create_semantic_cache
+from .token_counter import TokenCounter, get_token_counter
+from .tool_result_cache import ToolResultCache
 
 # Import tools (used in notebooks and for building agents)
 from .tools import (
@@ -94,8 +108,21 @@ __all__ = [
     "CourseManager",
     "RedisConfig",
     "redis_config",
+    "PrerequisiteGraph",
+    "HierarchicalCatalog",
+    "get_catalog",
+    "CatalogManifest",
+    # Caching
+    "EmbeddingCache",
+    "CachedEmbeddings",
+    "create_semantic_cache",
+    "ResponseCache",
+    "LLMResponseCache",
+    "llm_cache_stats",
+    "ToolResultCache",
     # Data models
     "Course",
+    "CourseOverview",
     "Major",
     "StudentProfile",
     "CourseRecommendation",
@@ -113,6 +140,8 @@ __all__ = [
     "create_memory_tools",
     "select_tools_by_keywords",
     # Optimization helpers (Section 4)
+    "TokenCounter",
+    "get_token_counter",
     "count_tokens",
     "estimate_token_budget",
     "hybrid_retrieval",
@@ -120,6 +149,9 @@ __all__ = [
     "create_user_profile_view",
     "filter_tools_by_intent",
     "classify_intent_with_llm",
+    "EmbeddingIntentClassifier",
+    "IntentPrediction",
+    "TrivialTurnMatcher",
     "extract_references",
     "format_context_for_llm",
 ]
@@ -0,0 +1,402 @@
+"""
+Shared in-process hierarchical course catalog.
+
+Every progressive agent stage needs the hierarchical catalog
+(data/hierarchical/hierarchical_courses.json) to turn search hits into
+summaries and full details. Parsing the file and validating every
+HierarchicalCourse in each stage, then scanning the list for every hit,
+wastes startup time and makes each lookup O(catalog).
+
+``get_catalog()`` loads the file once per process and returns a shared
+``HierarchicalCatalog`` with:
+- O(1) lookup by course code, department and tag
+- lazy validation of CourseSummary/CourseDetails on first access
+
+Pre-parsed snapshots:
+    When ``msgpack`` is installed, the parsed catalog is also written to a
+    binary snapshot next to the JSON file (``<name>.snapshot``). The
+    snapshot records the JSON file's mtime, size and sha256; a fresh
+    process memory-maps it, reads only the small header (codes, offsets,
+    department/tag index) and decodes individual courses when they are
+    first requested. A stale or unreadable snapshot is ignored and rebuilt.
+
+    Layout: MAGIC | uint32 header length | msgpack header | course records,
+    where each record is one msgpack-encoded course dict.
+
+Usage:
+    from redis_context_course.catalog import get_catalog
+
+    catalog = get_catalog()
+    course = catalog.get("CS001")           # HierarchicalCourse or None
+    summaries = catalog.by_department("Computer Science")
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+from .hierarchical_models import CourseDetails, CourseSummary, HierarchicalCourse
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - snapshots are optional
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CATALOG_PATH = (
+    Path(__file__).resolve().parent / "data" / "hierarchical" / "hierarchical_courses.json"
+)
+
+SNAPSHOT_MAGIC = b"RCCSNAP1"
+SNAPSHOT_VERSION = 1
+_HEADER_LENGTH = struct.Struct("<I")
+
+# course_code -> (department, tags), enough to build the lookup indexes
+CatalogIndex = Dict[str, Tuple[str, List[str]]]
+
+
+class HierarchicalCatalog:
+    """
+    Indexed, lazily validated view of the hierarchical course catalog.
+
+    ``records`` maps course codes to raw course dicts; it may be a plain dict
+    or a lazily decoding snapshot. ``CourseSummary``, ``CourseDetails`` and
+    ``HierarchicalCourse`` objects are built the first time a course is
+    requested and then reused.
+
+    ``version`` is the sha256 of the source file when loaded from disk; caches
+    of derived data (e.g. rendered context fragments) key on it.
+    """
+
+    def __init__(
+        self,
+        records: Mapping[str, Dict[str, Any]],
+        index: CatalogIndex,
+        version: Optional[str] = None,
+    ):
+        """
+        Build the catalog indexes.
+
+        Args:
+            records: Course code -> raw course dict (as in the JSON file)
+            index: Course code -> (department, tags)
+            version: Content version of the catalog (None if unknown)
+        """
+        self._records = records
+        self.version = version
+        self._summaries: Dict[str, CourseSummary] = {}
+        self._details: Dict[str, CourseDetails] = {}
+        self._courses: Dict[str, HierarchicalCourse] = {}
+        self._by_department: Dict[str, List[str]] = defaultdict(list)
+        self._by_tag: Dict[str, List[str]] = defaultdict(list)
+
+        self._codes = list(index)
+        for code, (department, tags) in index.items():
+            self._by_department[department.lower()].append(code)
+            for tag in tags:
+                self._by_tag[tag.lower()].append(code)
+
+    @classmethod
+    def from_courses_data(
+        cls, courses_data: List[Dict[str, Any]], version: Optional[str] = None
+    ) -> "HierarchicalCatalog":
+        """Build a catalog from raw course dicts, skipping invalid summaries."""
+        records: Dict[str, Dict[str, Any]] = {}
+        index: CatalogIndex = {}
+        summaries: Dict[str, CourseSummary] = {}
+        for course_data in courses_data:
+            try:
+                summary = CourseSummary(**course_data["summary"])
+            except Exception as e:
+                logger.warning(
+                    f"Skipping course {course_data.get('id', 'unknown')}: {e}"
+                )
+                continue
+            code = summary.course_code
+            records[code] = course_data
+            index[code] = (summary.department, summary.tags)
+            summaries[code] = summary
+
+        catalog = cls(records, index, version)
+        catalog._summaries.update(summaries)
+        return catalog
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> "HierarchicalCatalog":
+        """Load a catalog from a hierarchical courses JSON file."""
+        with open(path, "rb") as f:
+            raw = f.read()
+        data = json.loads(raw)
+        return cls.from_courses_data(
+            data.get("courses", []), version=hashlib.sha256(raw).hexdigest()
+        )
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __contains__(self, course_code: str) -> bool:
+        return course_code in self._records
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._codes)
+
+    @property
+    def course_codes(self) -> List[str]:
+        """All course codes, in file order."""
+        return list(self._codes)
+
+    def get_summary(self, course_code: str) -> Optional[CourseSummary]:
+        """Summary for a course code, validated on first access."""
+        summary = self._summaries.get(course_code)
+        if summary is None and course_code in self._records:
+            summary = CourseSummary(**self._records[course_code]["summary"])
+            self._summaries[course_code] = summary
+        return summary
+
+    def get_details(self, course_code: str) -> Optional[CourseDetails]:
+        """Full details for a course code, validated on first access."""
+        details = self._details.get(course_code)
+        if details is None and course_code in self._records:
+            details = CourseDetails(**self._records[course_code]["details"])
+            self._details[course_code] = details
+        return details
+
+    def get(self, course_code: str) -> Optional[HierarchicalCourse]:
+        """HierarchicalCourse for a course code, built on first access."""
+        course = self._courses.get(course_code)
+        if course is None and course_code in self._records:
+            # Already-validated summary/details instances are reused as-is
+            course = HierarchicalCourse(
+                **{
+                    **self._records[course_code],
+                    "summary": self.get_summary(course_code),
+                    "details": self.get_details(course_code),
+                }
+            )
+            self._courses[course_code] = course
+        return course
+
+    def get_many(self, course_codes: List[str]) -> List[HierarchicalCourse]:
+        """Courses for the given codes, in input order, skipping unknown codes."""
+        courses = (self.get(code) for code in course_codes)
+        return [course for course in courses if course is not None]
+
+    def by_department(self, department: str) -> List[CourseSummary]:
+        """Summaries of all courses in a department (case-insensitive)."""
+        codes = self._by_department.get(department.lower(), [])
+        return [self.get_summary(code) for code in codes]
+
+    def by_tag(self, tag: str) -> List[CourseSummary]:
+        """Summaries of all courses with a tag (case-insensitive)."""
+        codes = self._by_tag.get(tag.lower(), [])
+        return [self.get_summary(code) for code in codes]
+
+
+class _SnapshotRecords(Mapping):
+    """Memory-mapped snapshot records, decoded one course at a time."""
+
+    def __init__(self, buffer: mmap.mmap, offsets: Dict[str, Tuple[int, int]]):
+        self._buffer = buffer
+        self._offsets = offsets
+
+    def __getitem__(self, course_code: str) -> Dict[str, Any]:
+        start, length = self._offsets[course_code]
+        return msgpack.unpackb(self._buffer[start : start + length])
+
+    def __contains__(self, course_code: object) -> bool:
+        return course_code in self._offsets
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+
+def snapshot_path_for(json_path: Union[str, Path]) -> Path:
+    """Snapshot file stored next to a catalog JSON file."""
+    return Path(json_path).with_suffix(".snapshot")
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_snapshot(
+    json_path: Union[str, Path], snapshot_path: Optional[Union[str, Path]] = None
+) -> Path:
+    """
+    Write a pre-parsed snapshot of a catalog JSON file.
+
+    Only courses whose summary validates are included, matching
+    ``HierarchicalCatalog.from_file``.
+
+    Returns:
+        Path of the written snapshot
+
+    Raises:
+        RuntimeError: If msgpack is not installed
+    """
+    if msgpack is None:
+        raise RuntimeError("Catalog snapshots require msgpack (pip install msgpack)")
+
+    json_path = Path(json_path)
+    snapshot_path = Path(snapshot_path) if snapshot_path else snapshot_path_for(json_path)
+    stat = json_path.stat()
+    with open(json_path) as f:
+        courses_data = json.load(f).get("courses", [])
+
+    index: CatalogIndex = {}
+    blobs: List[Tuple[str, bytes]] = []
+    for course_data in courses_data:
+        try:
+            summary = CourseSummary(**course_data["summary"])
+        except Exception as e:
+            logger.warning(f"Skipping course {course_data.get('id', 'unknown')}: {e}")
+            continue
+        index[summary.course_code] = (summary.department, summary.tags)
+        blobs.append((summary.course_code, msgpack.packb(course_data)))
+
+    offsets, position = {}, 0
+    for code, blob in blobs:
+        offsets[code] = (position, len(blob))
+        position += len(blob)
+
+    header = msgpack.packb(
+        {
+            "version": SNAPSHOT_VERSION,
+            "source_mtime_ns": stat.st_mtime_ns,
+            "source_size": stat.st_size,
+            "source_sha256": _file_sha256(json_path),
+            "index": {code: list(entry) for code, entry in index.items()},
+            "offsets": {code: list(entry) for code, entry in offsets.items()},
+        }
+    )
+
+    # Write atomically so concurrent readers never see a partial snapshot
+    tmp_path = snapshot_path.with_name(f"{snapshot_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(SNAPSHOT_MAGIC)
+        f.write(_HEADER_LENGTH.pack(len(header)))
+        f.write(header)
+        for _, blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, snapshot_path)
+    return snapshot_path
+
+
+def load_snapshot(
+    json_path: Union[str, Path], snapshot_path: Optional[Union[str, Path]] = None
+) -> Optional[HierarchicalCatalog]:
+    """
+    Open the snapshot for a catalog JSON file if it is present and current.
+
+    The snapshot is current when the JSON file's mtime and size match the
+    header, or (after a touch or copy) when its sha256 still matches.
+
+    Returns:
+        A lazily decoding catalog, or None if there is no usable snapshot
+    """
+    if msgpack is None:
+        return None
+
+    json_path = Path(json_path)
+    snapshot_path = Path(snapshot_path) if snapshot_path else snapshot_path_for(json_path)
+    try:
+        with open(snapshot_path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        prefix = len(SNAPSHOT_MAGIC)
+        if buffer[:prefix] != SNAPSHOT_MAGIC:
+            raise ValueError("bad magic")
+        (header_length,) = _HEADER_LENGTH.unpack_from(buffer, prefix)
+        body_start = prefix + _HEADER_LENGTH.size + header_length
+        header = msgpack.unpackb(buffer[prefix + _HEADER_LENGTH.size : body_start])
+        if header.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"unsupported version {header.get('version')}")
+
+        stat = json_path.stat()
+        unchanged = (
+            header["source_mtime_ns"] == stat.st_mtime_ns
+            and header["source_size"] == stat.st_size
+        )
+        if not unchanged and header["source_sha256"] != _file_sha256(json_path):
+            buffer.close()
+            return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable catalog snapshot {snapshot_path}: {e}")
+        buffer.close()
+        return None
+
+    offsets = {
+        code: (body_start + start, length)
+        for code, (start, length) in header["offsets"].items()
+    }
+    index = {
+        code: (department, tags) for code, (department, tags) in header["index"].items()
+    }
+    return HierarchicalCatalog(
+        _SnapshotRecords(buffer, offsets), index, version=header["source_sha256"]
+    )
+
+
+def _load_catalog(path: Path, use_snapshot: bool) -> HierarchicalCatalog:
+    if use_snapshot:
+        catalog = load_snapshot(path)
+        if catalog is not None:
+            logger.info(f"Loaded catalog snapshot for {path}")
+            return catalog
+
+    catalog = HierarchicalCatalog.from_file(path)
+    if use_snapshot and msgpack is not None:
+        try:
+            write_snapshot(path)
+        except OSError as e:
+            # Read-only installs still work, just without the fast path
+            logger.debug(f"Could not write catalog snapshot: {e}")
+    return catalog
+
+
+_catalogs: Dict[Path, HierarchicalCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog(
+    path: Optional[Union[str, Path]] = None,
+    reload: bool = False,
+    use_snapshot: bool = True,
+) -> HierarchicalCatalog:
+    """
+    Return the process-wide catalog for ``path`` (loading it on first use).
+
+    Args:
+        path: Hierarchical courses JSON file (defaults to the bundled catalog)
+        reload: Re-read the file even if it is already loaded
+        use_snapshot: Load from / refresh the pre-parsed snapshot when possible
+
+    Raises:
+        FileNotFoundError: If the catalog file does not exist
+    """
+    resolved = Path(path).resolve() if path else DEFAULT_CATALOG_PATH
+    with _catalogs_lock:
+        if reload or resolved not in _catalogs:
+            _catalogs[resolved] = _load_catalog(resolved, use_snapshot)
+            logger.info(
+                f"Loaded {len(_catalogs[resolved])} hierarchical courses from {resolved}"
+            )
+        return _catalogs[resolved]
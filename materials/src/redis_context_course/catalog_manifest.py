@@ -0,0 +1,193 @@
+"""
+Catalog version manifest stored in Redis.
+
+Caches of course-derived data (exact-match responses, semantic answers,
+memoized LLM calls) would otherwise keep serving answers about a catalog
+that has since been re-ingested. The ingestion scripts publish a small
+manifest hash per index after every load:
+
+    catalog:manifest:{index_name} -> {version, count, content_hash, updated_at, source}
+
+Each index (the course catalog, the hierarchical summaries) has its own
+manifest, so loading one never bumps the other's version. Caches read the
+manifest of the course index the agents search (``redis_config.vector_index_name``).
+
+``version`` is a counter bumped whenever the ingested content changes
+(re-ingesting identical content keeps it, so caches stay warm). Cache
+layers put the current version into their keys, so a new version makes all
+old entries unreachable at once; they are never scanned or deleted and
+simply expire by TTL.
+
+Readers poll the manifest at most once per ``refresh_interval`` seconds, so
+namespacing costs one HGET every few seconds rather than one per lookup.
+
+Usage:
+    from redis_context_course.catalog_manifest import CatalogManifest
+
+    manifest = CatalogManifest()  # course index manifest
+    manifest.publish(courses_data, source="course_catalog.json")  # ingestion
+    key = f"my_cache:{manifest.version}:{digest}"                   # caches
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional
+
+from redis import Redis
+from redis.exceptions import WatchError
+
+from .redis_config import RedisConfig, redis_config
+
+logger = logging.getLogger(__name__)
+
+# Manifests live at f"{CATALOG_MANIFEST_PREFIX}:{index_name}"
+CATALOG_MANIFEST_PREFIX = "catalog:manifest"
+# Version used while no catalog has been published (or Redis is unreachable)
+UNVERSIONED = "unversioned"
+
+
+def catalog_content_hash(records: Iterable[Any]) -> str:
+    """Order-independent sha256 over the JSON form of catalog records."""
+    digests = sorted(
+        hashlib.sha256(
+            json.dumps(record, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        for record in records
+    )
+    return hashlib.sha256("".join(digests).encode("ascii")).hexdigest()
+
+
+class CatalogManifest:
+    """
+    Read and publish the catalog version manifest.
+
+    ``version`` is cached locally for ``refresh_interval`` seconds; call
+    ``refresh()`` to pick up a new version immediately.
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[Redis] = None,
+        index_name: Optional[str] = None,
+        refresh_interval: float = 5.0,
+        config: Optional[RedisConfig] = None,
+        key: Optional[str] = None,
+    ):
+        """
+        Initialize the manifest accessor.
+
+        Args:
+            redis_client: Redis client (uses default if None)
+            index_name: Index whose catalog the manifest describes (uses the
+                config's course index if None)
+            refresh_interval: Seconds a read version is reused before
+                re-reading the manifest
+            config: RedisConfig whose shared connection pool to use
+                (uses global redis_config if None)
+            key: Redis hash holding the manifest (derived from index_name if None)
+        """
+        config = config or redis_config
+        self.redis = redis_client or config.redis_client
+        self.index_name = index_name or config.vector_index_name
+        self.key = key or f"{CATALOG_MANIFEST_PREFIX}:{self.index_name}"
+        self.refresh_interval = refresh_interval
+
+        self._lock = threading.Lock()
+        self._version: Optional[str] = None
+        self._checked_at = 0.0
+
+    def read(self) -> Optional[Dict[str, str]]:
+        """The stored manifest, or None if no catalog was published."""
+        manifest = self.redis.hgetall(self.key)
+        if not manifest:
+            return None
+        return {
+            (k.decode() if isinstance(k, bytes) else k): (
+                v.decode() if isinstance(v, bytes) else v
+            )
+            for k, v in manifest.items()
+        }
+
+    def publish(
+        self,
+        records: Iterable[Any],
+        count: Optional[int] = None,
+        source: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """
+        Record a completed ingestion, bumping the version if content changed.
+
+        Args:
+            records: Raw records that were ingested (hashed for the manifest)
+            count: Number of records stored (defaults to the number of records)
+            source: Where the records came from, e.g. the input file
+
+        Returns:
+            The manifest now stored in Redis
+        """
+        records = list(records)
+        content_hash = catalog_content_hash(records)
+        fields = {
+            "count": str(len(records) if count is None else count),
+            "content_hash": content_hash,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "source": source or "",
+        }
+
+        # Compare and bump in one WATCH/MULTI transaction, so concurrent
+        # publishers retry instead of losing a bump
+        with self.redis.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    pipe.watch(self.key)
+                    current_hash = pipe.hget(self.key, "content_hash")
+                    if isinstance(current_hash, bytes):
+                        current_hash = current_hash.decode()
+                    unchanged = current_hash == content_hash
+                    pipe.multi()
+                    if not unchanged:
+                        pipe.hincrby(self.key, "version", 1)
+                    pipe.hset(self.key, mapping=fields)
+                    pipe.execute()
+                    break
+                except WatchError:
+                    continue
+
+        self.refresh()
+        manifest = self.read() or {}
+        if unchanged:
+            logger.info(f"Catalog unchanged, keeping version {manifest.get('version')}")
+        else:
+            logger.info(
+                f"Published catalog version {manifest.get('version')} ({fields['count']} records)"
+            )
+        return manifest
+
+    @property
+    def version(self) -> str:
+        """Current catalog version (UNVERSIONED if none was published)."""
+        now = time.monotonic()
+        with self._lock:
+            if self._version is not None and now - self._checked_at < self.refresh_interval:
+                return self._version
+        try:
+            version = self.redis.hget(self.key, "version")
+        except Exception as e:
+            logger.warning(f"Catalog manifest read failed: {e}")
+            return self._version or UNVERSIONED
+        if isinstance(version, bytes):
+            version = version.decode()
+        with self._lock:
+            self._version = version or UNVERSIONED
+            self._checked_at = now
+            return self._version
+
+    def refresh(self):
+        """Forget the locally cached version so the next read hits Redis."""
+        with self._lock:
+            self._version = None
+            self._checked_at = 0.0
@@ -5,22 +5,74 @@ This module handles course storage, retrieval, and recommendation logic
 using Redis vector search for semantic course discovery.
 """
 
+import asyncio
 import json
-from typing import Any, Dict, List, Optional
+import logging
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 from redisvl.query import FilterQuery, VectorQuery
 from redisvl.query.filter import Num, Tag
 
+from .catalog_manifest import CatalogManifest
 from .models import (
     Course,
     CourseFormat,
+    CourseOverview,
     CourseRecommendation,
     DifficultyLevel,
     StudentProfile,
 )
+from .prerequisite_graph import PrerequisiteGraph
 from .redis_config import redis_config
 
+logger = logging.getLogger(__name__)
+
+# Named return-field profiles for search APIs. "full" hydrates a Course and
+# decodes the JSON blobs; the lighter profiles skip them entirely and return
+# a CourseOverview.
+RETURN_FIELD_PROFILES: Dict[str, List[str]] = {
+    "minimal": ["id", "course_code", "title"],
+    "summary": [
+        "id",
+        "course_code",
+        "title",
+        "description",
+        "department",
+        "major",
+        "difficulty_level",
+        "format",
+        "semester",
+        "year",
+        "credits",
+        "instructor",
+        "tags",
+    ],
+    "full": [
+        "id",
+        "course_code",
+        "title",
+        "description",
+        "department",
+        "major",
+        "difficulty_level",
+        "format",
+        "semester",
+        "year",
+        "credits",
+        "tags",
+        "instructor",
+        "max_enrollment",
+        "current_enrollment",
+        "learning_objectives",
+        "prerequisites",
+        "schedule",
+        "created_at",
+        "updated_at",
+    ],
+}
+
 
 class CourseManager:
     """Manages course data and provides recommendation functionality."""
@@ -36,6 +88,45 @@ class CourseManager:
         self.vector_index = self._config.vector_index
         self.embeddings = self._config.embeddings
 
+        # asyncio-native mode: await redis.asyncio / AsyncSearchIndex instead of
+        # blocking the event loop on every FT.SEARCH and HSET
+        self.use_asyncio = getattr(self._config, "use_asyncio", False)
+        if self.use_asyncio:
+            self.async_redis_client = self._config.async_redis_client
+            self.async_vector_index = self._config.async_vector_index
+
+        # Direct prerequisite edges are stored alongside the catalog at
+        # ingestion time; the bitset graph is built lazily on first use
+        self.prerequisite_graph_key = (
+            f"prerequisite_graph:{self._config.vector_index_name}"
+        )
+        self._prerequisite_graph: Optional[PrerequisiteGraph] = None
+
+        # Version of the catalog in this index; loaders publish it after a
+        # (re)load and caches of course-derived data are scoped by it
+        self.catalog_manifest = CatalogManifest(
+            self.redis_client, index_name=self._config.vector_index_name
+        )
+
+    async def _run_query(self, query) -> Any:
+        """Execute a RedisVL query, without blocking the loop in asyncio mode."""
+        if self.use_asyncio:
+            return await self.async_vector_index.query(query)
+        return self.vector_index.query(query)
+
+    async def _write_hashes(self, mappings: Dict[str, Dict[str, Any]]):
+        """Write course hashes in a single pipelined round trip."""
+        if self.use_asyncio:
+            pipe = self.async_redis_client.pipeline(transaction=False)
+            for key, mapping in mappings.items():
+                pipe.hset(key, mapping=mapping)
+            await pipe.execute()
+        else:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key, mapping in mappings.items():
+                pipe.hset(key, mapping=mapping)
+            pipe.execute()
+
     def _build_filters(self, filters: Dict[str, Any]) -> str:
         """Build filter expressions for Redis queries using RedisVL filter classes."""
         if not filters:
@@ -73,17 +164,14 @@ class CourseManager:
 
         return ""
 
-    async def store_course(self, course: Course) -> str:
-        """Store a course in Redis with vector embedding."""
-        # Create searchable content for embedding
+    def _course_content(self, course: Course) -> str:
+        """Build the searchable text that gets embedded for a course."""
         # Include course_code so exact code searches work (e.g., "CS002" query finds CS002)
-        content = f"{course.course_code}: {course.title} {course.description} {course.department} {course.major} {' '.join(course.tags)} {' '.join(course.learning_objectives)}"
-
-        # Generate embedding
-        embedding = await self.embeddings.aembed_query(content)
+        return f"{course.course_code}: {course.title} {course.description} {course.department} {course.major} {' '.join(course.tags)} {' '.join(course.learning_objectives)}"
 
-        # Prepare course data for storage
-        course_data = {
+    def _course_to_hash(self, course: Course, embedding: List[float]) -> Dict[str, Any]:
+        """Convert a Course and its embedding to a Redis hash mapping."""
+        return {
             "id": course.id,
             "course_code": course.course_code,
             "title": course.title,
@@ -110,61 +198,253 @@ class CourseManager:
             "content_vector": np.array(embedding, dtype=np.float32).tobytes(),
         }
 
+    async def store_course(self, course: Course) -> str:
+        """Store a course in Redis with vector embedding."""
+        # Generate embedding
+        embedding = await self.embeddings.aembed_query(self._course_content(course))
+
         # Store in Redis
         key = f"{self._config.vector_index_name}:{course.id}"
-        self.redis_client.hset(key, mapping=course_data)
+        await self._write_hashes(
+            {
+                key: self._course_to_hash(course, embedding),
+                self.prerequisite_graph_key: PrerequisiteGraph.redis_mapping([course]),
+            }
+        )
+        self._prerequisite_graph = None
 
         return course.id
 
+    async def store_courses(
+        self,
+        courses: List[Course],
+        batch_size: int = 64,
+        max_concurrency: int = 4,
+        on_batch: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> List[str]:
+        """
+        Store many courses using batched embeddings and pipelined writes.
+
+        Courses are split into chunks of ``batch_size``. Each chunk is embedded
+        with a single ``aembed_documents`` call and written with one Redis
+        pipeline round trip. Up to ``max_concurrency`` chunks are in flight at
+        the same time.
+
+        Args:
+            courses: Courses to store
+            batch_size: Number of courses per embedding request and pipeline
+            max_concurrency: Maximum number of batches processed concurrently
+            on_batch: Optional callback receiving per-batch throughput stats
+                (batch, size, embed_seconds, write_seconds, courses_per_sec)
+
+        Returns:
+            List of stored course IDs, in input order (courses in batches
+            that failed to embed or write are logged and left out)
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        batches = [
+            courses[i : i + batch_size] for i in range(0, len(courses), batch_size)
+        ]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _store_batch(batch_number: int, batch: List[Course]) -> List[str]:
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    embeddings = await self.embeddings.aembed_documents(
+                        [self._course_content(course) for course in batch]
+                    )
+                    embedded = time.perf_counter()
+
+                    mappings = {
+                        f"{self._config.vector_index_name}:{course.id}": self._course_to_hash(
+                            course, embedding
+                        )
+                        for course, embedding in zip(batch, embeddings)
+                    }
+                    # Prerequisite edges ride along in the same pipeline
+                    mappings[self.prerequisite_graph_key] = PrerequisiteGraph.redis_mapping(
+                        batch
+                    )
+                    await self._write_hashes(mappings)
+                    written = time.perf_counter()
+                except Exception as e:
+                    logger.error(f"Error storing batch {batch_number + 1}: {e}")
+                    return []
+
+            stats = {
+                "batch": batch_number,
+                "size": len(batch),
+                "embed_seconds": embedded - start,
+                "write_seconds": written - embedded,
+                "courses_per_sec": len(batch) / max(written - start, 1e-9),
+            }
+            logger.info(
+                f"Stored batch {batch_number + 1}/{len(batches)}: {stats['size']} courses "
+                f"(embed {stats['embed_seconds']:.2f}s, write {stats['write_seconds']:.2f}s, "
+                f"{stats['courses_per_sec']:.1f} courses/sec)"
+            )
+            if on_batch:
+                on_batch(stats)
+
+            return [course.id for course in batch]
+
+        results = await asyncio.gather(
+            *(_store_batch(i, batch) for i, batch in enumerate(batches))
+        )
+        self._prerequisite_graph = None
+        return [course_id for batch_ids in results for course_id in batch_ids]
+
     # EXPERIMENTAL: Not currently used in notebooks or progressive_agents but available for external use
     # Code typically uses get_course_by_code() instead
-    async def get_course(self, course_id: str) -> Optional[Course]:
-        """Retrieve a course by ID."""
-        key = f"{redis_config.vector_index_name}:{course_id}"
-        course_data = self.redis_client.hgetall(key)
-
+    async def get_course(
+        self, course_id: str, profile: str = "full"
+    ) -> Optional[Union[Course, CourseOverview]]:
+        """Retrieve a course by ID, fetching only the fields in ``profile``."""
+        fields = self._profile_fields(profile)
+        key = f"{self._config.vector_index_name}:{course_id}"
+        # HMGET the projected fields (never the binary content_vector)
+        if self.use_asyncio:
+            values = await self.async_redis_client.hmget(key, fields)
+        else:
+            values = self.redis_client.hmget(key, fields)
+
+        course_data = {f: v for f, v in zip(fields, values) if v is not None}
         if not course_data:
             return None
 
-        return self._dict_to_course(course_data)
+        return self._convert_result(course_data, profile)
 
-    async def get_course_by_code(self, course_code: str) -> Optional[Course]:
-        """Retrieve a course by course code."""
+    async def get_course_by_code(
+        self, course_code: str, profile: str = "full"
+    ) -> Optional[Union[Course, CourseOverview]]:
+        """Retrieve a course by course code, returning only ``profile`` fields."""
+        fields = self._profile_fields(profile)
         query = FilterQuery(
             filter_expression=Tag("course_code") == course_code,
-            return_fields=[
-                "id",
-                "course_code",
-                "title",
-                "description",
-                "department",
-                "major",
-                "difficulty_level",
-                "format",
-                "semester",
-                "year",
-                "credits",
-                "tags",
-                "instructor",
-                "max_enrollment",
-                "current_enrollment",
-                "learning_objectives",
-                "prerequisites",
-                "schedule",
-                "created_at",
-                "updated_at",
-            ],
+            return_fields=fields,
         )
-        results = self.vector_index.query(query)
+        results = await self._run_query(query)
 
-        if results.docs:
-            return self._dict_to_course(results.docs[0].__dict__)
+        # Handle both list and object with .docs attribute
+        result_list = results if isinstance(results, list) else results.docs
+        if result_list:
+            first = result_list[0]
+            return self._convert_result(
+                first if isinstance(first, dict) else first.__dict__, profile
+            )
         return None
 
+    async def get_courses_by_codes(
+        self, course_codes: List[str], profile: str = "full"
+    ) -> Tuple[List[Union[Course, CourseOverview]], List[str]]:
+        """
+        Resolve several course codes with a single tag-union query.
+
+        Issues one FT.SEARCH for ``@course_code:{A|B|C}`` instead of one
+        query per code, so comparison questions usually cost one round trip.
+        Pages through the union until every code is found or the matches run
+        out, so duplicate documents per code never hide a later code.
+
+        Args:
+            course_codes: Course codes to look up (duplicates are ignored)
+            profile: Return-field profile ("minimal", "summary" or "full")
+
+        Returns:
+            Tuple of (courses in input order, codes that were not found)
+        """
+        fields = self._profile_fields(profile)
+        codes = list(dict.fromkeys(code for code in course_codes if code))
+        if not codes:
+            return [], []
+
+        by_code: Dict[str, Union[Course, CourseOverview]] = {}
+        page_size = len(codes)
+        offset = 0
+        while len(by_code) < len(codes):
+            query = FilterQuery(
+                filter_expression=Tag("course_code") == codes,
+                return_fields=fields,
+                num_results=page_size,
+            ).paging(offset, page_size)
+            results = await self._run_query(query)
+            result_list = results if isinstance(results, list) else results.docs
+
+            for result in result_list:
+                data = result if isinstance(result, dict) else result.__dict__
+                if data.get("course_code") in by_code:
+                    continue
+                course = self._convert_result(data, profile)
+                if course:
+                    by_code[course.course_code] = course
+
+            if len(result_list) < page_size:
+                break
+            offset += page_size
+
+        found = [by_code[code] for code in codes if code in by_code]
+        missing = [code for code in codes if code not in by_code]
+        return found, missing
+
+    async def iter_courses(
+        self,
+        batch_size: int = 100,
+        profile: str = "full",
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Union[Course, CourseOverview]]:
+        """
+        Stream the whole catalog without embedding anything.
+
+        Pages through FT.SEARCH with a filter-only query, so memory use is
+        bounded by ``batch_size`` and there is no result cap.
+
+        Args:
+            batch_size: Number of courses fetched per FT.SEARCH page
+            profile: Return-field profile ("minimal", "summary" or "full")
+            filters: Optional metadata filters (see _build_filters)
+
+        Yields:
+            Courses (or CourseOverview for lighter profiles)
+        """
+        fields = self._profile_fields(profile)
+        filter_expression = self._build_filters(filters or {}) or "*"
+
+        offset = 0
+        while True:
+            query = FilterQuery(
+                filter_expression=filter_expression,
+                return_fields=fields,
+                num_results=batch_size,
+            ).paging(offset, batch_size)
+            results = await self._run_query(query)
+            result_list = results if isinstance(results, list) else results.docs
+
+            for result in result_list:
+                course = self._convert_result(
+                    result if isinstance(result, dict) else result.__dict__, profile
+                )
+                if course:
+                    yield course
+
+            if len(result_list) < batch_size:
+                break
+            offset += batch_size
+
+    async def count_courses(self) -> int:
+        """Count indexed courses from FT.INFO (no search, no embedding)."""
+        if self.use_asyncio:
+            info = await self.async_vector_index.info()
+        else:
+            info = self.vector_index.info()
+        return int(info.get("num_docs", 0))
+
     async def get_all_courses(self) -> List[Course]:
         """Retrieve all courses from the catalog."""
-        # Use search with empty query to get all courses
-        return await self.search_courses(query="", limit=1000, similarity_threshold=0.0)
+        return [course async for course in self.iter_courses()]
 
     async def search_courses(
         self,
@@ -172,8 +452,25 @@ class CourseManager:
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 10,
         similarity_threshold: float = 0.6,
-    ) -> List[Course]:
-        """Search courses using semantic similarity."""
+        profile: str = "full",
+    ) -> List[Union[Course, CourseOverview]]:
+        """
+        Search courses using semantic similarity.
+
+        Args:
+            query: Natural language search query
+            filters: Optional metadata filters (see _build_filters)
+            limit: Maximum number of results
+            similarity_threshold: Minimum similarity score to keep a result
+            profile: Return-field profile ("minimal", "summary" or "full").
+                Only "full" returns Course objects; the others return
+                CourseOverview and skip transferring/decoding JSON fields.
+
+        Returns:
+            Matching courses in relevance order
+        """
+        fields = self._profile_fields(profile)
+
         # Generate query embedding
         query_embedding = await self.embeddings.aembed_query(query)
 
@@ -181,28 +478,7 @@ class CourseManager:
         vector_query = VectorQuery(
             vector=query_embedding,
             vector_field_name="content_vector",
-            return_fields=[
-                "id",
-                "course_code",
-                "title",
-                "description",
-                "department",
-                "major",
-                "difficulty_level",
-                "format",
-                "semester",
-                "year",
-                "credits",
-                "tags",
-                "instructor",
-                "max_enrollment",
-                "current_enrollment",
-                "learning_objectives",
-                "prerequisites",
-                "schedule",
-                "created_at",
-                "updated_at",
-            ],
+            return_fields=fields,
             num_results=limit,
         )
 
@@ -212,7 +488,7 @@ class CourseManager:
             vector_query.set_filter(filter_expression)
 
         # Execute search
-        results = self.vector_index.query(vector_query)
+        results = await self._run_query(vector_query)
 
         # Convert results to Course objects
         courses = []
@@ -224,19 +500,54 @@ class CourseManager:
                 # Direct dictionary result
                 vector_score = result.get("vector_score", 1.0)
                 if vector_score >= similarity_threshold:
-                    course = self._dict_to_course(result)
+                    course = self._convert_result(result, profile)
                     if course:
                         courses.append(course)
             else:
                 # Object with attributes
                 vector_score = getattr(result, "vector_score", 1.0)
                 if vector_score >= similarity_threshold:
-                    course = self._dict_to_course(result.__dict__)
+                    course = self._convert_result(result.__dict__, profile)
                     if course:
                         courses.append(course)
 
         return courses
 
+    async def get_prerequisite_graph(self, refresh: bool = False) -> PrerequisiteGraph:
+        """
+        Return the in-process prerequisite graph.
+
+        The graph is built from the edges written at ingestion time. Catalogs
+        ingested before the edges were stored are scanned once and the edges
+        saved, so later processes load them directly.
+
+        Args:
+            refresh: Reload from Redis even if a graph is already cached
+        """
+        if self._prerequisite_graph is not None and not refresh:
+            return self._prerequisite_graph
+
+        if self.use_asyncio:
+            mapping = await self.async_redis_client.hgetall(self.prerequisite_graph_key)
+        else:
+            mapping = self.redis_client.hgetall(self.prerequisite_graph_key)
+
+        if mapping:
+            graph = PrerequisiteGraph.from_mapping(mapping)
+        else:
+            graph = PrerequisiteGraph.from_courses(
+                [course async for course in self.iter_courses()]
+            )
+            if len(graph):
+                if self.use_asyncio:
+                    await graph.asave(self.async_redis_client, self.prerequisite_graph_key)
+                else:
+                    graph.save(self.redis_client, self.prerequisite_graph_key)
+
+        logger.info(f"Loaded prerequisite graph with {len(graph)} courses")
+        self._prerequisite_graph = graph
+        return graph
+
     async def recommend_courses(
         self, student_profile: StudentProfile, query: str = "", limit: int = 5
     ) -> List[CourseRecommendation]:
@@ -269,6 +580,11 @@ class CourseManager:
             limit=limit * 2,  # Get more to filter out completed courses
         )
 
+        # Student bitsets are computed once for all eligibility checks
+        graph = await self.get_prerequisite_graph()
+        completed_mask = graph.mask(student_profile.completed_courses)
+        current_mask = graph.mask(student_profile.current_courses)
+
         # Generate recommendations with scoring
         recommendations = []
         for course in courses:
@@ -280,7 +596,12 @@ class CourseManager:
                 continue
 
             # Check prerequisites
-            prerequisites_met = self._check_prerequisites(course, student_profile)
+            if course.course_code in graph:
+                prerequisites_met = graph.is_eligible_mask(
+                    course.course_code, completed_mask, current_mask
+                )
+            else:
+                prerequisites_met = self._check_prerequisites(course, student_profile)
 
             # Calculate relevance score
             relevance_score = self._calculate_relevance_score(
@@ -311,6 +632,45 @@ class CourseManager:
 
         return recommendations[:limit]
 
+    def _profile_fields(self, profile: str) -> List[str]:
+        """Return the fields for a named profile, rejecting unknown names."""
+        if profile not in RETURN_FIELD_PROFILES:
+            raise ValueError(
+                f"Unknown return-field profile '{profile}'. "
+                f"Expected one of: {', '.join(RETURN_FIELD_PROFILES)}"
+            )
+        return RETURN_FIELD_PROFILES[profile]
+
+    def _convert_result(
+        self, data: Dict[str, Any], profile: str
+    ) -> Optional[Union[Course, CourseOverview]]:
+        """Convert a Redis result to the result type matching ``profile``."""
+        if profile == "full":
+            return self._dict_to_course(data)
+        return self._dict_to_overview(data)
+
+    def _dict_to_overview(self, data: Dict[str, Any]) -> Optional[CourseOverview]:
+        """Convert projected Redis data to a CourseOverview (no JSON decoding)."""
+        try:
+            return CourseOverview(
+                id=data["id"],
+                course_code=data["course_code"],
+                title=data["title"],
+                description=data.get("description"),
+                department=data.get("department"),
+                major=data.get("major"),
+                difficulty_level=data.get("difficulty_level") or None,
+                format=data.get("format") or None,
+                semester=data.get("semester") or None,
+                year=int(data["year"]) if data.get("year") else None,
+                credits=int(data["credits"]) if data.get("credits") else None,
+                instructor=data.get("instructor"),
+                tags=data["tags"].split("|") if data.get("tags") else [],
+            )
+        except Exception as e:
+            print(f"Error converting data to CourseOverview: {e}")
+            return None
+
     def _dict_to_course(self, data: Dict[str, Any]) -> Optional[Course]:
         """Convert Redis hash data to Course object."""
         try:
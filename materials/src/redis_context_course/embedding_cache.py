@@ -0,0 +1,339 @@
+"""
+Content-addressed embedding cache.
+
+Embedding the same text twice costs the same as embedding it once, so this
+module keeps every vector we pay for. Entries are keyed by
+(model name, dimensions, sha256 of text), which means a re-ingest of an
+unchanged catalog or a repeated user query never calls the embeddings API.
+
+Storage tiers:
+1. Redis hash per (model, dimensions) namespace, shared across processes
+2. Optional local SQLite file, useful for notebooks and offline reloads
+
+Both tiers are size-bounded and evict the least recently used entries.
+
+Usage:
+    from redis_context_course.embedding_cache import CachedEmbeddings, EmbeddingCache
+
+    cache = EmbeddingCache(redis_client, max_entries=50_000)
+    embeddings = CachedEmbeddings(OpenAIEmbeddings(), cache)
+    vector = await embeddings.aembed_query("machine learning courses")
+    print(cache.stats())
+"""
+
+import asyncio
+import base64
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+from redis import Redis
+
+logger = logging.getLogger(__name__)
+
+
+def _encode_vector(vector: Sequence[float]) -> str:
+    """Pack a vector as base64 float32 so it round-trips through decoded clients."""
+    return base64.b64encode(np.asarray(vector, dtype=np.float32).tobytes()).decode()
+
+
+def _decode_vector(data: Union[str, bytes]) -> List[float]:
+    """Unpack a base64 float32 vector."""
+    return np.frombuffer(base64.b64decode(data), dtype=np.float32).tolist()
+
+
+class _DiskTier:
+    """Size-bounded local SQLite store for embeddings."""
+
+    def __init__(self, path: Path, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings "
+            "(key TEXT PRIMARY KEY, vector TEXT NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS embeddings_accessed ON embeddings (accessed)"
+        )
+        self._conn.commit()
+
+    def get_many(self, keys: List[str]) -> Dict[str, str]:
+        if not keys:
+            return {}
+        with self._lock:
+            placeholders = ",".join("?" for _ in keys)
+            rows = self._conn.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                keys,
+            ).fetchall()
+            if rows:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE embeddings SET accessed = ? WHERE key = ?",
+                    [(now, key) for key, _ in rows],
+                )
+                self._conn.commit()
+        return dict(rows)
+
+    def put_many(self, entries: Dict[str, str]):
+        if not entries:
+            return
+        with self._lock:
+            now = time.time()
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector, accessed) VALUES (?, ?, ?)",
+                [(key, vector, now) for key, vector in entries.items()],
+            )
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+            if count > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM embeddings WHERE key IN "
+                    "(SELECT key FROM embeddings ORDER BY accessed LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM embeddings")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        return count
+
+
+class EmbeddingCache:
+    """
+    Two-tier (Redis + optional disk) cache of text embeddings.
+
+    Each (model, dimensions) pair gets its own Redis hash mapping
+    sha256(text) to a base64 float32 vector, plus a sorted set of last-access
+    times used for LRU eviction once ``max_entries`` is exceeded.
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[Redis] = None,
+        prefix: str = "embedding_cache",
+        max_entries: int = 100_000,
+        disk_path: Optional[Union[str, Path]] = None,
+        max_disk_entries: int = 100_000,
+    ):
+        """
+        Initialize the embedding cache.
+
+        Args:
+            redis_client: Redis client for the shared tier (None disables it)
+            prefix: Key prefix for the Redis tier
+            max_entries: Maximum entries per namespace in Redis
+            disk_path: Optional SQLite file for the local tier
+            max_disk_entries: Maximum entries in the local tier
+        """
+        self.redis = redis_client
+        self.prefix = prefix
+        self.max_entries = max_entries
+        self._disk = _DiskTier(Path(disk_path), max_disk_entries) if disk_path else None
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def text_hash(text: str) -> str:
+        """Content address of a piece of text."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def namespace(self, model: str, dimensions: Optional[int] = None) -> str:
+        """Redis key holding all entries for a model/dimensions pair."""
+        return f"{self.prefix}:{model}:{dimensions or 'default'}"
+
+    def get_many(
+        self, texts: List[str], model: str, dimensions: Optional[int] = None
+    ) -> List[Optional[List[float]]]:
+        """
+        Look up embeddings for texts.
+
+        Returns:
+            One vector per input text, or None where the text is not cached
+        """
+        if not texts:
+            return []
+
+        namespace = self.namespace(model, dimensions)
+        hashes = [self.text_hash(text) for text in texts]
+        found: Dict[str, str] = {}
+
+        if self.redis is not None:
+            try:
+                unique = list(dict.fromkeys(hashes))
+                values = self.redis.hmget(namespace, unique)
+                found = {h: v for h, v in zip(unique, values) if v is not None}
+                if found:
+                    # Touch entries so eviction keeps hot vectors
+                    self.redis.zadd(
+                        f"{namespace}:lru", {h: time.time() for h in found}
+                    )
+            except Exception as e:
+                logger.warning(f"Embedding cache lookup failed: {e}")
+
+        if self._disk is not None:
+            missing = [h for h in dict.fromkeys(hashes) if h not in found]
+            from_disk = self._disk.get_many([f"{namespace}:{h}" for h in missing])
+            if from_disk:
+                promoted = {key.rsplit(":", 1)[1]: value for key, value in from_disk.items()}
+                self.disk_hits += sum(1 for h in hashes if h in promoted)
+                found.update(promoted)
+                self._put_redis(namespace, promoted)
+
+        results: List[Optional[List[float]]] = []
+        for h in hashes:
+            if h in found:
+                self.hits += 1
+                results.append(_decode_vector(found[h]))
+            else:
+                self.misses += 1
+                results.append(None)
+        return results
+
+    def put_many(
+        self,
+        texts: List[str],
+        vectors: List[List[float]],
+        model: str,
+        dimensions: Optional[int] = None,
+    ):
+        """Store embeddings for texts in every enabled tier."""
+        if not texts:
+            return
+        namespace = self.namespace(model, dimensions)
+        entries = {
+            self.text_hash(text): _encode_vector(vector)
+            for text, vector in zip(texts, vectors)
+        }
+        self._put_redis(namespace, entries)
+        if self._disk is not None:
+            self._disk.put_many({f"{namespace}:{h}": v for h, v in entries.items()})
+
+    def _put_redis(self, namespace: str, entries: Dict[str, str]):
+        if self.redis is None or not entries:
+            return
+        try:
+            now = time.time()
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.hset(namespace, mapping=entries)
+            pipe.zadd(f"{namespace}:lru", {h: now for h in entries})
+            pipe.zcard(f"{namespace}:lru")
+            size = pipe.execute()[-1]
+
+            if size > self.max_entries:
+                evicted = [
+                    member
+                    for member, _ in self.redis.zpopmin(
+                        f"{namespace}:lru", size - self.max_entries
+                    )
+                ]
+                if evicted:
+                    self.redis.hdel(namespace, *evicted)
+                    self.evictions += len(evicted)
+        except Exception as e:
+            logger.warning(f"Embedding cache write failed: {e}")
+
+    def clear(self, model: Optional[str] = None, dimensions: Optional[int] = None):
+        """Drop cached entries (one namespace if model is given, else all)."""
+        if self.redis is not None:
+            if model:
+                namespace = self.namespace(model, dimensions)
+                self.redis.delete(namespace, f"{namespace}:lru")
+            else:
+                keys = list(self.redis.scan_iter(match=f"{self.prefix}:*"))
+                if keys:
+                    self.redis.delete(*keys)
+        if self._disk is not None:
+            self._disk.clear()
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Hit/miss counters for this process (``hits`` includes ``disk_hits``)."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "disk_entries": len(self._disk) if self._disk is not None else 0,
+        }
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    LangChain ``Embeddings`` wrapper that consults an EmbeddingCache first.
+
+    Only texts that miss the cache are sent to the underlying model, in a
+    single batched request, and the results are written back.
+    """
+
+    def __init__(self, embeddings: Embeddings, cache: EmbeddingCache):
+        self.embeddings = embeddings
+        self.cache = cache
+        self.model = getattr(embeddings, "model", type(embeddings).__name__)
+        self.dimensions = getattr(embeddings, "dimensions", None)
+
+    def __getattr__(self, name):
+        # Expose settings of the wrapped model (e.g. chunk_size)
+        if name == "embeddings":
+            raise AttributeError(name)
+        return getattr(self.embeddings, name)
+
+    def _split(self, texts: List[str]):
+        cached = self.cache.get_many(texts, self.model, self.dimensions)
+        missing = list(dict.fromkeys(t for t, v in zip(texts, cached) if v is None))
+        return cached, missing
+
+    def _merge(self, texts, cached, missing, vectors) -> List[List[float]]:
+        self.cache.put_many(missing, vectors, self.model, self.dimensions)
+        computed = dict(zip(missing, vectors))
+        return [v if v is not None else computed[t] for t, v in zip(texts, cached)]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        cached, missing = self._split(texts)
+        vectors = self.embeddings.embed_documents(missing) if missing else []
+        return self._merge(texts, cached, missing, vectors)
+
+    def embed_query(self, text: str) -> List[float]:
+        (cached,) = self.cache.get_many([text], self.model, self.dimensions)
+        if cached is not None:
+            return cached
+        vector = self.embeddings.embed_query(text)
+        self.cache.put_many([text], [vector], self.model, self.dimensions)
+        return vector
+
+    # Async variants run cache I/O in a worker thread so lookups never block
+    # the event loop (the cache uses the synchronous, thread-safe client).
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        cached, missing = await asyncio.to_thread(self._split, texts)
+        vectors = await self.embeddings.aembed_documents(missing) if missing else []
+        return await asyncio.to_thread(self._merge, texts, cached, missing, vectors)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        (cached,) = await asyncio.to_thread(
+            self.cache.get_many, [text], self.model, self.dimensions
+        )
+        if cached is not None:
+            return cached
+        vector = await self.embeddings.aembed_query(text)
+        await asyncio.to_thread(
+            self.cache.put_many, [text], [vector], self.model, self.dimensions
+        )
+        return vector
@@ -0,0 +1,238 @@
+"""
+Rule-based fast path for trivial conversational turns.
+
+A bare "hi", "thanks!" or "ok, got it" does not need a model: classifying it
+costs one LLM call and answering it a second, only to produce a canned
+two-sentence reply. ``TrivialTurnMatcher`` recognizes such turns with one
+precompiled regular expression and answers them from templates, so the agent
+stages can route them straight to the response with no LLM calls.
+
+The matcher is deliberately conservative: the whole message must consist of
+greeting, thanks, farewell or acknowledgement phrases (plus filler such as
+"there" or "so much"). Anything else, e.g. "hi, what are the prerequisites
+for CS101?", falls through to normal intent classification.
+
+Acknowledgements ("sure", "ok", "that's great") are usually a yes to
+whatever the assistant just asked or offered. When the caller passes the
+previous assistant response and it ends with a question or an offer
+("Would you like me to: ..."), acknowledgements are not answered from a
+template either.
+
+Usage:
+    from redis_context_course.fast_path import TrivialTurnMatcher
+
+    matcher = TrivialTurnMatcher()
+    reply = matcher.respond("Thanks so much!")  # templated reply, or None
+    reply = matcher.respond("sure", previous_response=last_reply)  # None after an offer
+    print(matcher.stats())
+"""
+
+import re
+import threading
+from typing import Dict, List, Optional, Union
+
+# Phrases per kind of trivial turn, matched as whole words (case-insensitive)
+TRIVIAL_PHRASES: Dict[str, List[str]] = {
+    "thanks": [
+        "thank you",
+        "thank u",
+        "thanks",
+        "thx",
+        "ty",
+        "much appreciated",
+        "appreciate it",
+        "cheers",
+    ],
+    "farewell": [
+        "bye",
+        "goodbye",
+        "good bye",
+        "see you",
+        "see ya",
+        "see you later",
+        "later",
+        "good night",
+        "have a good day",
+        "have a nice day",
+    ],
+    "greeting": [
+        "hello",
+        "hi",
+        "hey",
+        "hiya",
+        "howdy",
+        "greetings",
+        "good morning",
+        "good afternoon",
+        "good evening",
+        "yo",
+    ],
+    "acknowledgement": [
+        "ok",
+        "okay",
+        "k",
+        "got it",
+        "great",
+        "cool",
+        "nice",
+        "perfect",
+        "awesome",
+        "sounds good",
+        "will do",
+        "alright",
+        "all right",
+        "sure",
+        "understood",
+    ],
+}
+
+# Words that may accompany trivial phrases without changing their meaning
+FILLER_WORDS = [
+    "there",
+    "again",
+    "all",
+    "everyone",
+    "so",
+    "very",
+    "much",
+    "a lot",
+    "lots",
+    "for that",
+    "for the help",
+    "for your help",
+    "oh",
+    "well",
+    "and",
+    "then",
+    "that's",
+    "thats",
+    "it",
+]
+
+# Kinds in priority order when a message mixes several ("hi, thanks!")
+_KIND_PRIORITY = ["thanks", "farewell", "greeting", "acknowledgement"]
+
+DEFAULT_RESPONSES: Dict[str, str] = {
+    "greeting": (
+        "Hello! I'm a course advisor agent. I can help you find courses, view "
+        "syllabi, check prerequisites, and more. What would you like to know?"
+    ),
+    "thanks": (
+        "You're welcome! Let me know if you'd like help with anything else, "
+        "like finding courses or checking prerequisites."
+    ),
+    "farewell": "Goodbye! Come back anytime you need help choosing courses.",
+    "acknowledgement": (
+        "Great! Is there anything else you'd like to know about courses, "
+        "syllabi, or prerequisites?"
+    ),
+}
+
+
+# How much of the previous response's end to inspect for a question or offer
+_FOLLOW_UP_TAIL = 400
+_OFFER_PATTERN = re.compile(
+    r"\?|\b(?:would you like|do you want|want me to|shall i|should i)\b",
+    re.IGNORECASE,
+)
+
+
+def expects_reply(previous_response: Optional[str]) -> bool:
+    """Whether a response ends with a question or offer the user may accept."""
+    if not previous_response:
+        return False
+    return bool(_OFFER_PATTERN.search(previous_response.strip()[-_FOLLOW_UP_TAIL:]))
+
+
+def _alternation(phrases: List[str]) -> str:
+    """Regex alternation matching the longest phrase first."""
+    ordered = sorted(phrases, key=len, reverse=True)
+    return "|".join(re.escape(p).replace(r"\ ", r"\s+") for p in ordered)
+
+
+class TrivialTurnMatcher:
+    """
+    Match trivial turns and answer them from templates.
+
+    Hit and miss counters are kept per instance, so ``stats()`` reports how
+    many turns bypassed the model.
+    """
+
+    def __init__(
+        self,
+        phrases: Optional[Dict[str, List[str]]] = None,
+        responses: Optional[Dict[str, str]] = None,
+        max_length: int = 60,
+    ):
+        """
+        Initialize the matcher.
+
+        Args:
+            phrases: Phrases per kind (defaults to TRIVIAL_PHRASES)
+            responses: Templated reply per kind (defaults to DEFAULT_RESPONSES)
+            max_length: Longer messages are never treated as trivial
+        """
+        self.phrases = phrases or TRIVIAL_PHRASES
+        self.responses = responses or DEFAULT_RESPONSES
+        self.max_length = max_length
+
+        self._kind_patterns = {
+            kind: re.compile(rf"\b(?:{_alternation(words)})\b", re.IGNORECASE)
+            for kind, words in self.phrases.items()
+        }
+        token = _alternation(
+            [p for words in self.phrases.values() for p in words] + FILLER_WORDS
+        )
+        # The whole message: phrases and filler separated by spaces/punctuation,
+        # optionally followed by emoji or other symbols
+        self._pattern = re.compile(
+            rf"^[\W_]*(?:(?:{token})\b[\W_]*)+$", re.IGNORECASE
+        )
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def match(self, query: str) -> Optional[str]:
+        """Kind of trivial turn ("greeting", "thanks", ...) or None."""
+        text = query.strip()
+        if not text or len(text) > self.max_length or not self._pattern.match(text):
+            return None
+        found = [kind for kind, pattern in self._kind_patterns.items() if pattern.search(text)]
+        if not found:
+            # Filler words only ("oh well")
+            return None
+        return min(
+            found,
+            key=lambda k: _KIND_PRIORITY.index(k) if k in _KIND_PRIORITY else len(_KIND_PRIORITY),
+        )
+
+    def respond(self, query: str, previous_response: Optional[str] = None) -> Optional[str]:
+        """
+        Templated reply for a trivial turn, or None if the model is needed.
+
+        Args:
+            query: User message
+            previous_response: Last assistant response, if any; an
+                acknowledgement of a question or offer in it needs the model
+        """
+        kind = self.match(query)
+        if kind == "acknowledgement" and expects_reply(previous_response):
+            kind = None
+        response = self.responses.get(kind) if kind else None
+        with self._lock:
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return response
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Fast-path hit/miss counters for this matcher."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
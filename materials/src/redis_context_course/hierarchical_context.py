@@ -6,11 +6,69 @@ This module demonstrates advanced Section 2 techniques:
 - Hybrid assembly (combining multiple retrieval strategies)
 - Progressive disclosure (overview first, details on-demand)
 - Context budget management (strategic token allocation)
+
+Rendered course fragments are cached per (catalog version, course code,
+content fingerprint, section set), so repeated queries over the same courses assemble context by
+joining immutable strings instead of re-formatting (and re-sorting) models.
 """
 
-from typing import List, Tuple
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+from .hierarchical_models import CourseDetails, CourseSummary, WeekPlan
+from .token_counter import get_token_counter
+
+# Extracted information types -> detail section that answers them
+_INFO_TYPE_SECTIONS = {
+    "overview": "description",
+    "description": "description",
+    "prerequisites": "prerequisites",
+    "prerequisite": "prerequisites",
+    "syllabus": "objectives",
+    "learning_objectives": "objectives",
+    "objectives": "objectives",
+    "assignments": "assignments",
+    "assignment": "assignments",
+}
+
+# Detail parts offered in the second budget tier (weeks come last)
+_BUDGET_SECTION_KINDS = ("description", "objectives", "prerequisites", "assignments")
+
+
+def _fingerprint(model: BaseModel) -> bytes:
+    """Digest of a model's content, so partial or fallback objects never share fragments."""
+    return hashlib.blake2b(model.model_dump_json().encode("utf-8"), digest_size=16).digest()
+
+
+def _group_headings(
+    kind: str, summary_count: int, detail_count: int, shown: Optional[int] = None
+) -> List[str]:
+    """Heading lines of the summary ("summary") or details ("part") group."""
+    if kind == "summary":
+        found = f"Found {summary_count} relevant courses"
+        if shown is not None and shown < summary_count:
+            found += f" (top {shown} shown)"
+        return ["## Overview of All Matches\n", found + ":\n"]
+    return [
+        f"\n## Detailed Information (Top {detail_count} Courses)\n",
+        "Full syllabi and assignments for the most relevant courses:\n",
+    ]
 
-from .hierarchical_models import CourseDetails, CourseSummary
+
+def _part_section(kind: str) -> str:
+    """Section a rendered detail part belongs to (weeks are part of the syllabus)."""
+    return "syllabus" if kind == "week" else kind
+
+
+def _overlap(terms: set, week: WeekPlan) -> int:
+    """Number of query terms mentioned in a syllabus week."""
+    text = " ".join([week.topic, *week.subtopics]).lower()
+    return sum(1 for term in terms if term in text)
 
 
 class HierarchicalContextAssembler:
@@ -27,7 +85,13 @@ class HierarchicalContextAssembler:
     - Efficient token usage
     """
 
-    def __init__(self, test_mode: bool = False):
+    def __init__(
+        self,
+        test_mode: bool = False,
+        catalog_version: Optional[str] = None,
+        max_fragments: int = 4096,
+        token_model: str = "gpt-4o",
+    ):
         """
         Initialize the context assembler.
         
@@ -35,8 +99,21 @@ class HierarchicalContextAssembler:
             test_mode: If True, raises NotImplementedError for assembly methods.
                       Used in Stage 3 notebook where students implement these methods.
                       If False (default), uses production implementations.
+            catalog_version: Version of the catalog the courses come from
+                      (e.g. ``HierarchicalCatalog.version``). Rendered fragments
+                      are only cached while a version is set.
+            max_fragments: Maximum cached fragments (least recently used are evicted)
+            token_model: Model whose tokenizer ``count_tokens`` and
+                      ``assemble_with_budget`` use
         """
         self._test_mode = test_mode
+        self.catalog_version = catalog_version
+        self.max_fragments = max_fragments
+        self._fragments: "OrderedDict[Tuple, str]" = OrderedDict()
+        self._fragment_lock = threading.Lock()
+        self.token_model = token_model
+        self.fragment_hits = 0
+        self.fragment_misses = 0
 
     def assemble_summary_only_context(
         self,
@@ -81,6 +158,7 @@ class HierarchicalContextAssembler:
         summaries: List[CourseSummary],
         details: List[CourseDetails],
         query: str,
+        detail_sections: Optional[FrozenSet[str]] = None,
     ) -> str:
         """
         Assemble context with progressive disclosure.
@@ -89,6 +167,8 @@ class HierarchicalContextAssembler:
             summaries: All course summaries (e.g., top 5)
             details: Detailed courses (e.g., top 2-3)
             query: Original search query
+            detail_sections: Detail sections to include (see ``sections_for``);
+                      None includes everything
 
         Returns:
             Assembled context string
@@ -120,14 +200,90 @@ class HierarchicalContextAssembler:
             )
         
             for detail in details:
-                sections.append(self._format_details(detail))
+                sections.append(self._format_details(detail, detail_sections))
         
         return "\n".join(sections)
 
+    @staticmethod
+    def sections_for(info_types: Optional[Iterable[str]]) -> Optional[FrozenSet[str]]:
+        """
+        Map requested information types onto detail sections.
+
+        Args:
+            info_types: Extracted information types (e.g. ["assignments"]);
+                        empty or None means everything
+
+        Returns:
+            Sections to render, or None for all sections. The syllabus is
+            always included as the course structure.
+        """
+        if not info_types:
+            return None
+        sections = {"syllabus"}
+        for info_type in info_types:
+            section = _INFO_TYPE_SECTIONS.get(info_type.lower())
+            if section:
+                sections.add(section)
+        return frozenset(sections)
+
+    def clear_fragment_cache(self):
+        """Drop all cached fragments (e.g. after reloading the catalog)."""
+        with self._fragment_lock:
+            self._fragments.clear()
+
+    def fragment_cache_stats(self) -> Dict[str, Union[int, float]]:
+        """Hit/miss counters for the rendered fragment cache."""
+        lookups = self.fragment_hits + self.fragment_misses
+        return {
+            "hits": self.fragment_hits,
+            "misses": self.fragment_misses,
+            "entries": len(self._fragments),
+            "hit_rate": self.fragment_hits / lookups if lookups else 0.0,
+        }
+
+    def _fragment(self, key: Tuple, model: BaseModel, render: Callable[[], Any]) -> Any:
+        """Return a cached fragment of ``model``, rendering and storing it on a miss."""
+        if self.catalog_version is None:
+            return render()
+
+        key = (self.catalog_version, _fingerprint(model)) + key
+        with self._fragment_lock:
+            fragment = self._fragments.get(key)
+            if fragment is not None:
+                self._fragments.move_to_end(key)
+                self.fragment_hits += 1
+                return fragment
+
+        fragment = render()
+        with self._fragment_lock:
+            self.fragment_misses += 1
+            self._fragments[key] = fragment
+            if len(self._fragments) > self.max_fragments:
+                self._fragments.popitem(last=False)
+        return fragment
+
     def _format_summary(self, summary: CourseSummary, index: int) -> str:
         """Format a course summary (lightweight)."""
+        # The result index varies per query, so it stays outside the fragment
+        return f"\n### {index}. " + self._fragment(
+            ("summary", summary.course_code),
+            summary,
+            lambda: self._render_summary(summary),
+        )
+
+    def _format_details(
+        self, details: CourseDetails, sections: Optional[FrozenSet[str]] = None
+    ) -> str:
+        """Format course details (comprehensive, or only the given sections)."""
+        return self._fragment(
+            ("details", details.course_code, sections),
+            details,
+            lambda: self._render_details(details, sections),
+        )
+
+    def _render_summary(self, summary: CourseSummary) -> str:
         parts = [
-            f"\n### {index}. {summary.course_code}: {summary.title}",
+            f"{summary.course_code}: {summary.title}",
             f"**Department**: {summary.department}",
             f"**Instructor**: {summary.instructor}",
             f"**Credits**: {summary.credits} | **Level**: {summary.difficulty_level.value}",
@@ -145,38 +301,64 @@ class HierarchicalContextAssembler:
 
         return "\n".join(parts) + "\n"
 
-    def _format_details(self, details: CourseDetails) -> str:
-        """Format full course details (comprehensive)."""
-        sections = [
-            f"\n---\n## {details.course_code}: {details.title}",
-            f"\n**Instructor**: {details.instructor}",
-        ]
+    def _render_details(
+        self, details: CourseDetails, sections: Optional[FrozenSet[str]]
+    ) -> str:
+        return (
+            "\n".join(
+                text
+                for kind, text in self._detail_parts(details)
+                if sections is None or _part_section(kind) in sections
+            )
+            + "\n"
+        )
+
+    def _detail_parts(self, details: CourseDetails) -> Tuple[Tuple[str, str], ...]:
+        """Rendered (kind, text) parts of a course's details, cached per course."""
+        return self._fragment(
+            ("detail_parts", details.course_code),
+            details,
+            lambda: tuple(self._render_detail_parts(details)),
+        )
+
+    def _render_detail_parts(self, details: CourseDetails) -> List[Tuple[str, str]]:
+        """
+        Render details as parts that join (with newlines) into the full block.
 
-        # Description
-        sections.append(f"\n### Description\n{details.full_description}")
+        Kinds are "header", "description", "objectives", "prerequisites",
+        "assignments", "syllabus" (the syllabus heading) and one "week" per
+        syllabus week.
+        """
+        parts = [
+            (
+                "header",
+                f"\n---\n## {details.course_code}: {details.title}"
+                f"\n\n**Instructor**: {details.instructor}",
+            ),
+            ("description", f"\n### Description\n{details.full_description}"),
+        ]
 
         # Learning Objectives
         if details.learning_objectives:
-            sections.append("\n### Learning Objectives")
-            for obj in details.learning_objectives:
-                sections.append(f"- {obj}")
+            lines = ["\n### Learning Objectives"]
+            lines.extend(f"- {obj}" for obj in details.learning_objectives)
+            parts.append(("objectives", "\n".join(lines)))
 
         # Prerequisites
         if details.prerequisites:
-            sections.append("\n### Prerequisites")
-            for prereq in details.prerequisites:
-                sections.append(f"- {prereq.course_code}: {prereq.course_title}")
+            lines = ["\n### Prerequisites"]
+            lines.extend(
+                f"- {prereq.course_code}: {prereq.course_title}"
+                for prereq in details.prerequisites
+            )
+            parts.append(("prerequisites", "\n".join(lines)))
 
         # Assignments Summary
-        # if details.assignments:
-        #     sections.append(
-        #         f"\n### Assignments ({details.get_total_assignments()} total, {details.get_total_points()} points)"
-        #     )
         if details.assignments:
             total_points = sum(a.points for a in details.assignments)
-            sections.append(
+            lines = [
                 f"\n### Assignments ({len(details.assignments)} total, {total_points} points)"
-            )
+            ]
 
             # Group by type
             by_type = {}
@@ -188,72 +370,174 @@ class HierarchicalContextAssembler:
             for assign_type, assignments in sorted(
                 by_type.items(), key=lambda x: x[0].value
             ):
-                sections.append(
-                    f"\n**{assign_type.value.title()}s** ({len(assignments)}):"
-                )
+                lines.append(f"\n**{assign_type.value.title()}s** ({len(assignments)}):")
                 for assignment in sorted(assignments, key=lambda a: a.due_week):
-                    sections.append(
+                    lines.append(
                         f"- Week {assignment.due_week}: {assignment.title} "
                         f"({assignment.points} points)"
                     )
+            parts.append(("assignments", "\n".join(lines)))
 
         # Syllabus
-        sections.append(f"\n### Course Syllabus ({details.syllabus.total_weeks} weeks)")
-
+        parts.append(
+            ("syllabus", f"\n### Course Syllabus ({details.syllabus.total_weeks} weeks)")
+        )
         for week in details.syllabus.weeks:
-            sections.append(f"\n**Week {week.week_number}: {week.topic}**")
+            lines = [f"\n**Week {week.week_number}: {week.topic}**"]
 
             if week.subtopics:
-                sections.append("Topics: " + ", ".join(week.subtopics))
+                lines.append("Topics: " + ", ".join(week.subtopics))
 
             if week.readings:
-                sections.append("Readings: " + ", ".join(week.readings))
+                lines.append("Readings: " + ", ".join(week.readings))
 
             if week.assignments:
-                sections.append("Due: " + ", ".join(week.assignments))
-
-        return "\n".join(sections) + "\n"
-
-    # EXPERIMENTAL: Not currently used in notebooks or progressive_agents but available for external use
-    # def estimate_tokens(self, text: str) -> int:
-    #     """Estimate token count (rough approximation)."""
-    #     # Rough estimate: 1 token ≈ 4 characters
-    #     return len(text) // 4
-
-    # EXPERIMENTAL: Not currently used in notebooks or progressive_agents but available for external use
-    # def assemble_with_budget(
-    #     self,
-    #     summaries: List[CourseSummary],
-    #     details: List[CourseDetails],
-    #     query: str,
-    #     max_tokens: int = 2000,
-    # ) -> Tuple[str, int]:
-    #     """
-    #     Assemble context within token budget.
-
-    #     Args:
-    #         summaries: All course summaries
-    #         details: Detailed courses
-    #         query: Search query
-    #         max_tokens: Maximum token budget
-
-    #     Returns:
-    #         Tuple of (context, estimated_tokens)
-    #     """
-    #     # Start with full context
-    #     context = self.assemble_hierarchical_context(summaries, details, query)
-    #     estimated = self.estimate_tokens(context)
-
-    #     # If over budget, reduce details
-    #     if estimated > max_tokens and len(details) > 1:
-    #         # Try with fewer details
-    #         reduced_details = details[: len(details) - 1]
-    #         context = self.assemble_hierarchical_context(
-    #             summaries, reduced_details, query
-    #         )
-    #         estimated = self.estimate_tokens(context)
-
-    #     return context, estimated
+                lines.append("Due: " + ", ".join(week.assignments))
+
+            parts.append(("week", "\n".join(lines)))
+
+        return parts
+
+    def count_tokens(self, text: str, memoize: bool = True) -> int:
+        """
+        Exact token count of ``text`` (shared, memoized ``TokenCounter``).
+
+        Pass ``memoize=False`` for one-off text such as a fully assembled
+        context.
+        """
+        return get_token_counter(self.token_model).count(text, memoize=memoize)
+
+    def assemble_with_budget(
+        self,
+        summaries: List[CourseSummary],
+        details: List[CourseDetails],
+        query: str,
+        max_tokens: int = 2000,
+        detail_sections: Optional[FrozenSet[str]] = None,
+    ) -> Tuple[str, int]:
+        """
+        Assemble hierarchical context within a token budget.
+
+        Summaries and details are assumed to be in relevance order. Fragments
+        are added greedily in three tiers until the budget is used:
+
+        1. Course summaries, by rank
+        2. Detail sections (description, objectives, ...), by course rank
+        3. Syllabus weeks, by course rank and then by overlap with the query
+
+        Fragments that do not fit are skipped so smaller ones further down
+        can still be used. The query heading is always included. Selected
+        fragments are emitted in the same layout as
+        ``assemble_hierarchical_context``; when everything fits the output is
+        identical.
+
+        Args:
+            summaries: All course summaries, most relevant first
+            details: Detailed courses, most relevant first
+            query: Search query
+            max_tokens: Maximum tokens for the assembled context
+            detail_sections: Detail sections to consider (see ``sections_for``)
+
+        Returns:
+            Tuple of (context, exact token count of the context)
+        """
+        parts = [self._detail_parts(detail) for detail in details]
+
+        # Candidates in priority order: ("summary", i) or ("part", course, part)
+        candidates: List[Tuple] = [("summary", i) for i in range(len(summaries))]
+        for d, course_parts in enumerate(parts):
+            candidates.extend(
+                ("part", d, p)
+                for p, (kind, _) in enumerate(course_parts)
+                if kind in _BUDGET_SECTION_KINDS
+                and (detail_sections is None or kind in detail_sections)
+            )
+        if detail_sections is None or "syllabus" in detail_sections:
+            terms = {t for t in re.findall(r"\w+", query.lower()) if len(t) > 2}
+            for d, (detail, course_parts) in enumerate(zip(details, parts)):
+                week_parts = [p for p, (kind, _) in enumerate(course_parts) if kind == "week"]
+                ranked = sorted(
+                    zip(week_parts, detail.syllabus.weeks),
+                    key=lambda pw: -_overlap(terms, pw[1]),
+                )
+                candidates.extend(("part", d, p) for p, _ in ranked)
+
+        picks: List[Tuple] = []
+        picked = set()
+        used = self.count_tokens(
+            self._render_budgeted(summaries, details, parts, query, picks), memoize=False
+        )
+        for candidate in candidates:
+            needed = [candidate] + [
+                dep for dep in self._dependencies(candidate, parts) if dep not in picked
+            ]
+            cost = sum(self._candidate_tokens(c, summaries, parts) for c in needed)
+            if not any(c[0] == candidate[0] for c in picks):
+                # First fragment of its kind also brings the group heading
+                cost += sum(
+                    self.count_tokens(line) + 1
+                    for line in _group_headings(candidate[0], len(summaries), len(details))
+                )
+            if used + cost > max_tokens:
+                continue
+            picks.append(candidate)
+            picked.update(needed)
+            used += cost
+
+        # Token boundaries can merge across fragments, so verify the real count
+        context = self._render_budgeted(summaries, details, parts, query, picks)
+        tokens = self.count_tokens(context, memoize=False)
+        while tokens > max_tokens and picks:
+            picks.pop()
+            context = self._render_budgeted(summaries, details, parts, query, picks)
+            tokens = self.count_tokens(context, memoize=False)
+        return context, tokens
+
+    @staticmethod
+    def _dependencies(candidate: Tuple, parts) -> List[Tuple]:
+        """Parts that must be present for a candidate to make sense."""
+        if candidate[0] != "part":
+            return []
+        _, d, p = candidate
+        deps = [("part", d, 0)]  # course header
+        if parts[d][p][0] == "week":
+            deps.append(
+                ("part", d, next(i for i, (kind, _) in enumerate(parts[d]) if kind == "syllabus"))
+            )
+        return deps
+
+    def _candidate_tokens(self, candidate: Tuple, summaries, parts) -> int:
+        if candidate[0] == "summary":
+            text = self._format_summary(summaries[candidate[1]], candidate[1] + 1)
+        else:
+            text = parts[candidate[1]][candidate[2]][1]
+        # +1 for the newline joining it to the previous fragment
+        return self.count_tokens(text) + 1
+
+    def _render_budgeted(self, summaries, details, parts, query, picks) -> str:
+        shown_summaries = sorted(c[1] for c in picks if c[0] == "summary")
+        chosen: Dict[int, set] = {}
+        for candidate in picks:
+            if candidate[0] == "part":
+                for _, d, p in [candidate] + self._dependencies(candidate, parts):
+                    chosen.setdefault(d, set()).add(p)
+
+        sections = [f"# Course Search Results for: {query}\n"]
+        if shown_summaries:
+            sections.extend(
+                _group_headings("summary", len(summaries), len(details), len(shown_summaries))
+            )
+            for rank, i in enumerate(shown_summaries, 1):
+                sections.append(self._format_summary(summaries[i], rank))
+
+        if chosen:
+            sections.extend(_group_headings("part", len(summaries), len(chosen)))
+            for d in sorted(chosen):
+                sections.append(
+                    "\n".join(parts[d][p][1] for p in sorted(chosen[d])) + "\n"
+                )
+
+        return "\n".join(sections)
 
 
 # EXPERIMENTAL: Not currently used in notebooks or progressive_agents but available for external use
@@ -8,22 +8,67 @@ This module implements progressive disclosure:
 This demonstrates context budget management and advanced Section 2 techniques.
 """
 
+import asyncio
 import json
 import logging
-from typing import List, Optional, Tuple
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-from openai import OpenAI
+import numpy as np
 from redis import Redis
 from redisvl.index import SearchIndex
-from redisvl.query import VectorQuery
+from redisvl.query import FilterQuery, VectorQuery
 from redisvl.query.filter import Tag
 
-from .hierarchical_models import CourseDetails, CourseSummary, HierarchicalCourse
-from .redis_config import redis_config
+from .hierarchical_models import (
+    CourseDetails,
+    CourseSummary,
+    CourseSyllabus,
+    HierarchicalCourse,
+    WeekPlan,
+)
+from .redis_config import RedisConfig, redis_config
 
 logger = logging.getLogger(__name__)
 
 
+# Fields every projected CourseDetails needs, whatever sections were requested
+DETAIL_HEADER_PATHS = [
+    "$.course_code",
+    "$.title",
+    "$.department",
+    "$.credits",
+    "$.difficulty_level",
+    "$.format",
+    "$.instructor",
+    "$.semester",
+    "$.year",
+    "$.max_enrollment",
+    "$.tags",
+]
+
+# JSONPath sections fetched per requested information type (JSON storage mode)
+DETAIL_SECTION_PATHS: Dict[str, List[str]] = {
+    "overview": ["$.full_description"],
+    "description": ["$.full_description"],
+    "prerequisites": ["$.prerequisites"],
+    "prerequisite": ["$.prerequisites"],
+    "assignments": ["$.assignments"],
+    "assignment": ["$.assignments"],
+    "syllabus": ["$.syllabus", "$.learning_objectives"],
+    "topics": ["$.syllabus.weeks[*].week_number", "$.syllabus.weeks[*].topic"],
+    "learning_objectives": ["$.learning_objectives"],
+    "objectives": ["$.learning_objectives"],
+}
+
+
+def _decode(value: Optional[Union[str, bytes]]) -> Optional[str]:
+    """Normalize a Redis reply to str (clients may or may not decode responses)."""
+    if isinstance(value, bytes):
+        return value.decode()
+    return value
+
+
 # EXPERIMENTAL: Not currently used in notebooks or progressive_agents but available for external use
 # This class is used only by scripts/load_hierarchical_courses.py for data loading
 class HierarchicalCourseManager:
@@ -32,7 +77,7 @@ class HierarchicalCourseManager:
 
     Architecture:
     - Tier 1: Vector index of course summaries (for search)
-    - Tier 2: Hash storage of full course details (for deep dives)
+    - Tier 2: String or RedisJSON storage of full course details (for deep dives)
 
     This enables:
     - Fast initial search across all courses
@@ -48,6 +93,8 @@ class HierarchicalCourseManager:
         redis_client: Optional[Redis] = None,
         summary_index_name: str = "course_summaries",
         details_prefix: str = "course_details",
+        config: Optional[RedisConfig] = None,
+        details_storage: str = "string",
     ):
         """
         Initialize hierarchical course manager.
@@ -56,10 +103,27 @@ class HierarchicalCourseManager:
             redis_client: Redis client (uses default if None)
             summary_index_name: Name for summary vector index
             details_prefix: Prefix for details hash keys
+            config: RedisConfig whose shared connection pool to use
+                (uses global redis_config if None)
+            details_storage: "string" stores details as one JSON string;
+                "json" stores a RedisJSON document so fetch_details can
+                read only the sections a question needs
         """
-        self.redis = redis_client or redis_config.redis_client
+        if details_storage not in ("string", "json"):
+            raise ValueError(
+                f"Unknown details_storage '{details_storage}'. Expected 'string' or 'json'"
+            )
+        config = config or redis_config
+        self.redis = redis_client or config.redis_client
+        # Shared cached embeddings (text-embedding-3-small, 1536 dims like the
+        # summary index), so reloading unchanged summaries re-embeds nothing
+        self.embeddings = config.embeddings
         self.summary_index_name = summary_index_name
         self.details_prefix = details_prefix
+        self.details_storage = details_storage
+        # course_code -> course id, maintained at write time. Kept outside the
+        # summary prefix so the index does not pick it up as a document.
+        self.code_index_key = f"{summary_index_name}_code_index"
 
         # Will be initialized when needed
         self._summary_index: Optional[SearchIndex] = None
@@ -103,7 +167,7 @@ class HierarchicalCourseManager:
                         "name": "embedding",
                         "type": "vector",
                         "attrs": {
-                            "dims": 1536,  # OpenAI ada-002 dimensions
+                            "dims": 1536,  # text-embedding-3-small dimensions
                             "algorithm": "hnsw",
                             "distance_metric": "cosine",
                         },
@@ -111,8 +175,7 @@ class HierarchicalCourseManager:
                 ],
             }
 
-            self._summary_index = SearchIndex.from_dict(schema)
-            self._summary_index.set_client(self.redis)
+            self._summary_index = SearchIndex.from_dict(schema, redis_client=self.redis)
 
             # Create index if it doesn't exist
             try:
@@ -124,6 +187,44 @@ class HierarchicalCourseManager:
 
         return self._summary_index
 
+    def _summary_mapping(
+        self, summary: CourseSummary, course_id: str, embedding: List[float]
+    ) -> Dict[str, Any]:
+        """Hash fields for a summary document."""
+        return {
+            "id": course_id,
+            "course_code": summary.course_code,
+            "title": summary.title,
+            "department": summary.department,
+            "credits": str(summary.credits),
+            "difficulty_level": summary.difficulty_level.value,
+            "format": summary.format.value,
+            "instructor": summary.instructor,
+            "short_description": summary.short_description,
+            "prerequisite_codes": "|".join(summary.prerequisite_codes),
+            "tags": "|".join(summary.tags),
+            "embedding_text": summary.embedding_text,
+            # Binary float32 data for Redis vector search
+            "embedding": np.array(embedding, dtype=np.float32).tobytes(),
+        }
+
+    def _queue_course(self, pipe, course: HierarchicalCourse, embedding: List[float]):
+        """Queue the summary hash, code index entry and details blob of a course."""
+        pipe.hset(
+            f"{self.summary_index_name}:{course.id}",
+            mapping=self._summary_mapping(course.summary, course.id, embedding),
+        )
+        pipe.hset(self.code_index_key, course.summary.course_code, course.id)
+        self._queue_details(pipe, course.details, course.id)
+
+    def _queue_details(self, pipe, details: CourseDetails, course_id: str):
+        """Queue the details write in the configured storage format."""
+        key = f"{self.details_prefix}:{course_id}"
+        if self.details_storage == "json":
+            pipe.json().set(key, "$", details.model_dump(mode="json"))
+        else:
+            pipe.set(key, details.model_dump_json())
+
     async def add_course(self, course: HierarchicalCourse) -> bool:
         """
         Add a hierarchical course to storage.
@@ -148,56 +249,108 @@ class HierarchicalCourseManager:
             logger.error(f"Error adding course {course.summary.course_code}: {e}")
             return False
 
+    async def add_courses(
+        self,
+        courses: List[HierarchicalCourse],
+        batch_size: int = 100,
+        max_concurrency: int = 4,
+        on_batch: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> int:
+        """
+        Add many hierarchical courses using batched embeddings and pipelines.
+
+        Each chunk of ``batch_size`` summaries is embedded with a single
+        ``aembed_documents`` call on the shared cached embeddings, then its
+        summary hashes, code index entries and details blobs are written in
+        one pipeline (off the event loop). Up to
+        ``max_concurrency`` chunks are in flight at the same time. A failed
+        chunk is logged and skipped.
+
+        Args:
+            courses: Courses to add
+            batch_size: Number of courses per embedding request and pipeline
+            max_concurrency: Maximum number of batches processed concurrently
+            on_batch: Optional callback receiving per-batch throughput stats
+                (batch, size, embed_seconds, write_seconds, courses_per_sec)
+
+        Returns:
+            Number of courses stored
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        batches = [
+            courses[i : i + batch_size] for i in range(0, len(courses), batch_size)
+        ]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _add_batch(batch_number: int, batch: List[HierarchicalCourse]) -> int:
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    for course in batch:
+                        if not course.summary.embedding_text:
+                            course.summary.generate_embedding_text()
+                    embeddings = await self.embeddings.aembed_documents(
+                        [course.summary.embedding_text for course in batch]
+                    )
+                    embedded = time.perf_counter()
+
+                    pipe = self.redis.pipeline(transaction=False)
+                    for course, embedding in zip(batch, embeddings):
+                        self._queue_course(pipe, course, embedding)
+                    await asyncio.to_thread(pipe.execute)
+                    written = time.perf_counter()
+                except Exception as e:
+                    logger.error(f"Error adding batch {batch_number + 1}: {e}")
+                    return 0
+
+            stats = {
+                "batch": batch_number,
+                "size": len(batch),
+                "embed_seconds": embedded - start,
+                "write_seconds": written - embedded,
+                "courses_per_sec": len(batch) / max(written - start, 1e-9),
+            }
+            logger.info(
+                f"Added batch {batch_number + 1}/{len(batches)}: {stats['size']} courses "
+                f"(embed {stats['embed_seconds']:.2f}s, write {stats['write_seconds']:.2f}s, "
+                f"{stats['courses_per_sec']:.1f} courses/sec)"
+            )
+            if on_batch:
+                on_batch(stats)
+            return len(batch)
+
+        results = await asyncio.gather(
+            *(_add_batch(i, batch) for i, batch in enumerate(batches))
+        )
+        return sum(results)
+
     async def _store_summary(self, summary: CourseSummary, course_id: str):
         """Store course summary in vector index."""
-        import numpy as np
-
         # Generate embedding text if not present
         if not summary.embedding_text:
             summary.generate_embedding_text()
 
-        # Get embedding from OpenAI
-        client = OpenAI()
-
-        response = client.embeddings.create(
-            model="text-embedding-ada-002", input=summary.embedding_text
-        )
-        embedding = response.data[0].embedding
-
-        # Convert embedding to binary float32 for Redis vector search
-        embedding_bytes = np.array(embedding, dtype=np.float32).tobytes()
+        embedding = await self.embeddings.aembed_query(summary.embedding_text)
+        data = self._summary_mapping(summary, course_id, embedding)
 
-        # Prepare data for storage
-        data = {
-            "id": course_id,
-            "course_code": summary.course_code,
-            "title": summary.title,
-            "department": summary.department,
-            "credits": str(summary.credits),
-            "difficulty_level": summary.difficulty_level.value,
-            "format": summary.format.value,
-            "instructor": summary.instructor,
-            "short_description": summary.short_description,
-            "prerequisite_codes": "|".join(summary.prerequisite_codes),
-            "tags": "|".join(summary.tags),
-            "embedding_text": summary.embedding_text,
-            "embedding": embedding_bytes,  # Binary float32 data
-        }
-
-        # Store in Redis
+        # Store in Redis, together with the code -> id mapping
         key = f"{self.summary_index_name}:{course_id}"
-        self.redis.hset(key, mapping=data)
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hset(key, mapping=data)
+        pipe.hset(self.code_index_key, summary.course_code, course_id)
+        await asyncio.to_thread(pipe.execute)
 
         logger.debug(f"Stored summary for {summary.course_code}")
 
     async def _store_details(self, details: CourseDetails, course_id: str):
-        """Store full course details in hash."""
-        # Serialize details to JSON
-        details_json = details.model_dump_json()
-
-        # Store in Redis hash
-        key = f"{self.details_prefix}:{course_id}"
-        self.redis.set(key, details_json)
+        """Store full course details (JSON string or RedisJSON document)."""
+        pipe = self.redis.pipeline(transaction=False)
+        self._queue_details(pipe, details, course_id)
+        await asyncio.to_thread(pipe.execute)
 
         logger.debug(f"Stored details for {details.course_code}")
 
@@ -223,10 +376,7 @@ class HierarchicalCourseManager:
             List of course summaries
         """
         # Get embedding for query
-        client = OpenAI()
-
-        response = client.embeddings.create(model="text-embedding-ada-002", input=query)
-        query_embedding = response.data[0].embedding
+        query_embedding = await self.embeddings.aembed_query(query)
 
         # Create vector query
         index = self._get_summary_index()
@@ -280,34 +430,47 @@ class HierarchicalCourseManager:
         logger.info(f"Found {len(summaries)} course summaries for query: {query}")
         return summaries
 
-    async def fetch_details(self, course_codes: List[str]) -> List[CourseDetails]:
+    async def fetch_details(
+        self, course_codes: List[str], information_types: Optional[List[str]] = None
+    ) -> List[CourseDetails]:
         """
         Fetch full details for specific courses.
 
         This is Tier 2: Detailed information on-demand.
 
+        In "json" storage mode with ``information_types`` given, only the
+        matching JSONPath sections (see DETAIL_SECTION_PATHS) plus the header
+        fields are transferred; other sections come back empty.
+
         Args:
             course_codes: List of course codes to fetch
+            information_types: Sections the answer needs (e.g. ["prerequisites"])
 
         Returns:
             List of course details
         """
-        details_list = []
-
+        course_ids = await self._get_course_ids(course_codes)
+        found_codes = [code for code in course_codes if code in course_ids]
         for course_code in course_codes:
-            # Find course ID from summary index
-            course_id = await self._get_course_id(course_code)
-            if not course_id:
+            if course_code not in course_ids:
                 logger.warning(f"Course not found: {course_code}")
-                continue
 
-            # Fetch details from hash
-            key = f"{self.details_prefix}:{course_id}"
-            details_json = self.redis.get(key)
+        keys = [f"{self.details_prefix}:{course_ids[code]}" for code in found_codes]
+        if self.details_storage == "json":
+            details_by_key = self._fetch_json_details(keys, information_types)
+        else:
+            # Fetch all details blobs in one round trip
+            blobs = self.redis.mget(keys) if keys else []
+            details_by_key = {
+                key: CourseDetails.model_validate_json(blob)
+                for key, blob in zip(keys, blobs)
+                if blob
+            }
 
-            if details_json:
-                details = CourseDetails.model_validate_json(details_json)
-                details_list.append(details)
+        details_list = []
+        for course_code, key in zip(found_codes, keys):
+            if key in details_by_key:
+                details_list.append(details_by_key[key])
                 logger.debug(f"Fetched details for {course_code}")
             else:
                 logger.warning(f"Details not found for {course_code}")
@@ -315,27 +478,118 @@ class HierarchicalCourseManager:
         logger.info(f"Fetched {len(details_list)} course details")
         return details_list
 
+    def _fetch_json_details(
+        self, keys: List[str], information_types: Optional[List[str]]
+    ) -> Dict[str, CourseDetails]:
+        """Read RedisJSON details documents, projecting sections when possible."""
+        if not keys:
+            return {}
+
+        section_paths = []
+        for info_type in information_types or []:
+            section_paths.extend(DETAIL_SECTION_PATHS.get(info_type.lower(), []))
+        # Unknown or missing information types: read the whole document
+        paths = (
+            list(dict.fromkeys(DETAIL_HEADER_PATHS + section_paths))
+            if section_paths
+            else ["$"]
+        )
+
+        pipe = self.redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.json().get(key, *paths)
+        replies = pipe.execute(raise_on_error=False)
+
+        details_by_key = {}
+        for key, reply in zip(keys, replies):
+            if (
+                isinstance(reply, Exception)
+                or not reply
+                or (paths != ["$"] and not reply.get("$.course_code"))
+            ):
+                # Missing, or written in string mode before switching storage
+                try:
+                    blob = self.redis.get(key)
+                except Exception:
+                    blob = None
+                if blob:
+                    details_by_key[key] = CourseDetails.model_validate_json(blob)
+                continue
+            if paths == ["$"]:
+                details_by_key[key] = CourseDetails.model_validate(reply[0])
+            else:
+                details_by_key[key] = self._details_from_paths(reply)
+        return details_by_key
+
+    @staticmethod
+    def _details_from_paths(reply: Dict[str, List[Any]]) -> CourseDetails:
+        """Build a CourseDetails from a multi-path JSON.GET reply."""
+        data = {
+            path[2:]: values[0]
+            for path, values in reply.items()
+            if values and "[*]" not in path
+        }
+
+        syllabus = data.pop("syllabus", None)
+        if syllabus is None:
+            # Week topics only: an outline without readings or subtopics
+            numbers = reply.get("$.syllabus.weeks[*].week_number", [])
+            topics = reply.get("$.syllabus.weeks[*].topic", [])
+            weeks = [
+                WeekPlan(week_number=number, topic=topic)
+                for number, topic in zip(numbers, topics)
+            ]
+            syllabus = CourseSyllabus(weeks=weeks, total_weeks=len(weeks))
+
+        data.setdefault("full_description", "")
+        return CourseDetails(syllabus=syllabus, **data)
+
     async def _get_course_id(self, course_code: str) -> Optional[str]:
         """Get course ID from course code."""
-        # Search summary index for course code
-        # Use hget for specific fields to avoid decoding binary embedding data
-        keys = self.redis.keys(f"{self.summary_index_name}:*")
-        for key in keys:
-            # Get only the fields we need (not the binary embedding)
-            stored_code = self.redis.hget(key, "course_code")
-            if stored_code:
-                # Handle both bytes and string responses
-                if isinstance(stored_code, bytes):
-                    stored_code = stored_code.decode()
-                if stored_code == course_code:
-                    course_id = self.redis.hget(key, "id")
-                    if isinstance(course_id, bytes):
-                        course_id = course_id.decode()
-                    return course_id
-        return None
+        return (await self._get_course_ids([course_code])).get(course_code)
+
+    async def _get_course_ids(self, course_codes: List[str]) -> Dict[str, str]:
+        """
+        Resolve course codes to IDs.
+
+        Reads the code index with one HMGET. Codes missing from it (courses
+        stored before the index existed) are resolved with a single TAG query
+        on the summary index and written back to the code index.
+        """
+        codes = list(dict.fromkeys(course_codes))
+        if not codes:
+            return {}
+
+        values = self.redis.hmget(self.code_index_key, codes)
+        course_ids = {
+            code: _decode(value) for code, value in zip(codes, values) if value
+        }
+
+        missing = [code for code in codes if code not in course_ids]
+        if missing:
+            query = FilterQuery(
+                filter_expression=Tag("course_code") == missing,
+                return_fields=["id", "course_code"],
+                num_results=len(missing) * 2,
+            )
+            backfill = {}
+            for result in self._get_summary_index().query(query):
+                code, course_id = result.get("course_code"), result.get("id")
+                if code and course_id and code not in backfill:
+                    backfill[code] = course_id
+            if backfill:
+                self.redis.hset(self.code_index_key, mapping=backfill)
+                course_ids.update(backfill)
+
+        return course_ids
 
     async def hierarchical_search(
-        self, query: str, summary_limit: int = 5, detail_limit: int = 2, **filters
+        self,
+        query: str,
+        summary_limit: int = 5,
+        detail_limit: int = 2,
+        information_types: Optional[List[str]] = None,
+        **filters,
     ) -> Tuple[List[CourseSummary], List[CourseDetails]]:
         """
         Two-stage hierarchical retrieval.
@@ -348,6 +602,7 @@ class HierarchicalCourseManager:
             query: Search query
             summary_limit: Number of summaries to return
             detail_limit: Number of detailed courses to fetch
+            information_types: Detail sections to fetch (all if None)
             **filters: Additional filters (department, difficulty)
 
         Returns:
@@ -362,7 +617,7 @@ class HierarchicalCourseManager:
 
         # Stage 2: Fetch details for top N
         top_codes = [s.course_code for s in summaries[:detail_limit]]
-        details = await self.fetch_details(top_codes)
+        details = await self.fetch_details(top_codes, information_types)
 
         logger.info(
             f"Hierarchical search complete: {len(summaries)} summaries, {len(details)} details"
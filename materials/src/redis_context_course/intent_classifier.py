@@ -0,0 +1,266 @@
+"""
+Local embedding-based intent classification.
+
+The agent stages classify every query into one of five intents (GREETING,
+GENERAL, SYLLABUS_OBJECTIVES, ASSIGNMENTS, PREREQUISITES) with a full LLM call
+and a long prompt. Most queries are easy to label, so
+``EmbeddingIntentClassifier`` answers them locally with a nearest-centroid
+classifier over embedded labeled examples: one query embedding and a
+5-row matrix-vector product. Only queries whose confidence falls below a
+threshold are sent to the LLM fallback.
+
+Example vectors are embedded once, in a single batch; with an EmbeddingCache
+they survive restarts and are never re-embedded.
+
+Usage:
+    from redis_context_course.intent_classifier import EmbeddingIntentClassifier
+
+    classifier = EmbeddingIntentClassifier(embeddings, fallback=classify_with_llm)
+    prediction = await classifier("What are the prerequisites for CS002?")
+    print(prediction.label, prediction.source)
+    print(classifier.stats())  # fallback rate and latency saved
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from .embedding_cache import CachedEmbeddings, EmbeddingCache
+from .redis_config import redis_config
+
+logger = logging.getLogger(__name__)
+
+# Labeled examples per intent; the centroid of each list represents the intent
+DEFAULT_INTENT_EXAMPLES: Dict[str, List[str]] = {
+    "GREETING": [
+        "hello",
+        "hi there",
+        "hey",
+        "good morning",
+        "thank you",
+        "thanks a lot",
+        "thanks, that was helpful",
+        "bye",
+        "see you later",
+        "how are you?",
+    ],
+    "GENERAL": [
+        "What is CS002?",
+        "Tell me about the machine learning course",
+        "What courses are available on databases?",
+        "Give me an overview of CS101",
+        "Which courses cover Redis?",
+        "Who teaches the data structures course?",
+        "Find me beginner programming courses",
+        "What is this course about?",
+        "Are there any online courses on web development?",
+        "How many credits is MATH201?",
+    ],
+    "SYLLABUS_OBJECTIVES": [
+        "Show me the syllabus for CS002",
+        "What will I learn in this course?",
+        "What topics are covered?",
+        "Give me details about this course",
+        "What are the learning objectives?",
+        "What is covered in week 3?",
+        "What is the course structure?",
+        "What are the learning outcomes of CS201?",
+        "Walk me through the weekly schedule",
+        "Which topics does the course go through?",
+    ],
+    "ASSIGNMENTS": [
+        "What are the assignments?",
+        "How many exams are there?",
+        "What's the workload?",
+        "Is there a final project?",
+        "How is the course graded?",
+        "What homework is due for CS002?",
+        "How much is the midterm worth?",
+        "Are there quizzes in this class?",
+        "What kind of projects do we do?",
+        "How many points are the labs worth?",
+    ],
+    "PREREQUISITES": [
+        "What are the prerequisites?",
+        "What do I need before taking this?",
+        "Can I take CS301 without CS201?",
+        "What courses do I need to complete first?",
+        "Do I need any prior knowledge?",
+        "What are the requirements for the machine learning course?",
+        "Am I ready for this course if I only took CS101?",
+        "Is calculus required for this class?",
+        "What should I know before enrolling?",
+        "Which courses are required before CS202?",
+    ],
+}
+
+IntentFallback = Callable[[str], Awaitable[str]]
+
+
+@dataclass
+class IntentPrediction:
+    """Intent chosen for one query."""
+
+    label: str
+    # Softmax probability of the winning centroid (1.0 when the LLM decided)
+    confidence: float
+    # "local" or "llm"
+    source: str
+    latency_ms: float
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length so dot products are cosine similarities."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+class EmbeddingIntentClassifier:
+    """
+    Nearest-centroid intent classifier with an optional LLM fallback.
+
+    Instances are async callables taking a query, so they can be passed
+    directly to the agent stages' ``set_classify_intent_function`` hook.
+    """
+
+    def __init__(
+        self,
+        embeddings_model: Optional[Embeddings] = None,
+        examples: Optional[Dict[str, Sequence[str]]] = None,
+        fallback: Optional[IntentFallback] = None,
+        confidence_threshold: float = 0.5,
+        temperature: float = 0.05,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        llm_latency_ms: Optional[float] = None,
+    ):
+        """
+        Initialize the classifier.
+
+        Args:
+            embeddings_model: Embeddings model (defaults to redis_config.embeddings,
+                              the cached model the course index uses)
+            examples: Labeled examples per intent (defaults to DEFAULT_INTENT_EXAMPLES)
+            fallback: Async LLM classifier used below the confidence threshold;
+                      without one the local label is always returned
+            confidence_threshold: Minimum centroid probability answered locally
+            temperature: Softmax temperature over cosine similarities
+            embedding_cache: Optional cache so example and query embeddings are
+                            reused across restarts (the default model is
+                            already cached when the config enables it)
+            llm_latency_ms: Assumed LLM classification latency, used to report
+                            latency saved until a fallback call has been timed
+        """
+        embeddings_model = embeddings_model or redis_config.embeddings
+        if embedding_cache is not None and not isinstance(embeddings_model, CachedEmbeddings):
+            embeddings_model = CachedEmbeddings(embeddings_model, embedding_cache)
+        self.embeddings_model = embeddings_model
+        self.examples = {
+            label: list(texts)
+            for label, texts in (examples or DEFAULT_INTENT_EXAMPLES).items()
+            if texts
+        }
+        self.fallback = fallback
+        self.confidence_threshold = confidence_threshold
+        self.temperature = temperature
+        self.llm_latency_ms = llm_latency_ms
+
+        self.labels: List[str] = list(self.examples)
+        self._centroids: Optional[np.ndarray] = None
+        self._fit_lock = asyncio.Lock()
+
+        self._stats_lock = threading.Lock()
+        self.local_count = 0
+        self.fallback_count = 0
+        self.local_ms = 0.0
+        self.fallback_ms = 0.0
+
+    async def fit(self):
+        """Embed all labeled examples in one batch and build the centroids."""
+        texts = [text for label in self.labels for text in self.examples[label]]
+        vectors = _normalize(
+            np.asarray(await self.embeddings_model.aembed_documents(texts), dtype=np.float32)
+        )
+        counts = [len(self.examples[label]) for label in self.labels]
+        starts = np.cumsum([0, *counts[:-1]])
+        self._centroids = _normalize(np.add.reduceat(vectors, starts, axis=0))
+        logger.info(
+            f"Built intent centroids for {len(self.labels)} intents from {len(texts)} examples"
+        )
+
+    async def _ensure_fitted(self):
+        if self._centroids is None:
+            async with self._fit_lock:
+                if self._centroids is None:
+                    await self.fit()
+
+    def _probabilities(self, query_vector: Sequence[float]) -> np.ndarray:
+        query = _normalize(np.asarray(query_vector, dtype=np.float32))
+        logits = (self._centroids @ query) / self.temperature
+        exp = np.exp(logits - logits.max())
+        return exp / exp.sum()
+
+    async def classify(self, query: str) -> IntentPrediction:
+        """Classify a query locally, deferring to the fallback when unsure."""
+        start = time.perf_counter()
+        await self._ensure_fitted()
+        probabilities = self._probabilities(await self.embeddings_model.aembed_query(query))
+        best = int(np.argmax(probabilities))
+        label, confidence = self.labels[best], float(probabilities[best])
+        local_ms = (time.perf_counter() - start) * 1000
+
+        if confidence >= self.confidence_threshold or self.fallback is None:
+            with self._stats_lock:
+                self.local_count += 1
+                self.local_ms += local_ms
+            return IntentPrediction(label, confidence, "local", local_ms)
+
+        llm_start = time.perf_counter()
+        try:
+            llm_label = (await self.fallback(query)).strip().upper()
+        except Exception as e:
+            logger.warning(f"Intent fallback failed, using local label {label}: {e}")
+            return IntentPrediction(label, confidence, "local", local_ms)
+        llm_ms = (time.perf_counter() - llm_start) * 1000
+        with self._stats_lock:
+            self.fallback_count += 1
+            self.fallback_ms += llm_ms
+        return IntentPrediction(llm_label, 1.0, "llm", local_ms + llm_ms)
+
+    async def __call__(self, query: str) -> IntentPrediction:
+        return await self.classify(query)
+
+    def stats(self) -> Dict[str, Union[int, float, None]]:
+        """
+        Fallback rate and latency saved for this process.
+
+        Latency saved is, per locally answered query, the mean LLM
+        classification latency (measured on fallbacks, else ``llm_latency_ms``)
+        minus the mean local latency.
+        """
+        with self._stats_lock:
+            total = self.local_count + self.fallback_count
+            avg_local = self.local_ms / self.local_count if self.local_count else 0.0
+            avg_llm = (
+                self.fallback_ms / self.fallback_count
+                if self.fallback_count
+                else self.llm_latency_ms
+            )
+            return {
+                "queries": total,
+                "local": self.local_count,
+                "llm_fallbacks": self.fallback_count,
+                "llm_fallback_rate": self.fallback_count / total if total else 0.0,
+                "avg_local_ms": avg_local,
+                "avg_llm_ms": avg_llm,
+                "latency_saved_ms": (
+                    self.local_count * max(avg_llm - avg_local, 0.0)
+                    if avg_llm is not None
+                    else None
+                ),
+            }
@@ -0,0 +1,176 @@
+"""
+Redis-backed memoization of deterministic LLM calls.
+
+Intent classification, query decomposition, entity extraction and quality
+evaluation send fully deterministic, low-temperature prompts; sending the
+same prompt twice re-bills the same answer. ``LLMResponseCache`` is a
+LangChain ``BaseCache`` that stores responses in Redis keyed by
+(model, temperature, max_tokens, sha256 of prompt), with a TTL. Keys are
+also scoped by the ingested catalog version (see catalog_manifest), so
+re-ingestion retires every memoized response at once.
+
+Each cache instance is labeled with the node that uses it, and hits are
+counted per node together with the tokens the cached response originally
+cost, so ``llm_cache_stats()`` reports saved calls and tokens per node.
+
+Usage:
+    from redis_context_course.llm_cache import LLMResponseCache, llm_cache_stats
+
+    llm = ChatOpenAI(
+        model="gpt-4o-mini",
+        temperature=0.1,
+        max_tokens=800,
+        cache=LLMResponseCache("gpt-4o-mini", 0.1, 800, node="classify_intent"),
+    )
+    await llm.ainvoke(prompt)  # second identical call is answered from Redis
+    print(llm_cache_stats())
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from typing import Any, Dict, Optional, Sequence
+
+from langchain_core.caches import BaseCache
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, Generation
+from redis import Redis
+
+from .catalog_manifest import CatalogManifest
+from .redis_config import RedisConfig, redis_config
+
+logger = logging.getLogger(__name__)
+
+_stats: Dict[str, Dict[str, int]] = {}
+_stats_lock = threading.Lock()
+
+
+def _record(node: str, hit: bool, saved_tokens: int = 0):
+    with _stats_lock:
+        stats = _stats.setdefault(node, {"calls": 0, "saved_calls": 0, "saved_tokens": 0})
+        stats["calls"] += 1
+        if hit:
+            stats["saved_calls"] += 1
+            stats["saved_tokens"] += saved_tokens
+
+
+def llm_cache_stats() -> Dict[str, Dict[str, float]]:
+    """Saved calls and tokens per node for this process."""
+    with _stats_lock:
+        return {
+            node: {
+                "calls": stats["calls"],
+                "saved_calls": stats["saved_calls"],
+                "saved_tokens": stats["saved_tokens"],
+                "hit_rate": stats["saved_calls"] / stats["calls"] if stats["calls"] else 0.0,
+            }
+            for node, stats in _stats.items()
+        }
+
+
+def reset_llm_cache_stats():
+    """Clear the per-node counters."""
+    with _stats_lock:
+        _stats.clear()
+
+
+class LLMResponseCache(BaseCache):
+    """
+    LangChain cache storing LLM responses in Redis.
+
+    One instance is bound to one model configuration; the key is built from
+    that configuration and the prompt, so any change to model, temperature
+    or max_tokens misses.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        temperature: float,
+        max_tokens: Optional[int],
+        node: str = "default",
+        ttl: int = 86400,
+        namespace: str = "llm_cache",
+        redis_client: Optional[Redis] = None,
+        config: Optional[RedisConfig] = None,
+        manifest: Optional[CatalogManifest] = None,
+    ):
+        """
+        Initialize the LLM response cache.
+
+        Args:
+            model: Model name of the LLM this cache is attached to
+            temperature: Sampling temperature of that LLM
+            max_tokens: Output token limit of that LLM
+            node: Label used to report savings (e.g. the workflow node)
+            ttl: Seconds before a cached response expires (0 disables expiry)
+            namespace: Key prefix in Redis
+            redis_client: Redis client (uses default if None)
+            config: RedisConfig whose shared connection pool to use
+                (uses global redis_config if None)
+            manifest: Catalog manifest whose version scopes entries (reads
+                the default manifest on the same Redis if None)
+        """
+        self.redis = redis_client or (config or redis_config).redis_client
+        self.manifest = manifest or CatalogManifest(self.redis)
+        self.model = model
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.node = node
+        self.ttl = ttl
+        self.namespace = namespace
+
+    def _key(self, prompt: str) -> str:
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        return (
+            f"{self.namespace}:{self.manifest.version}:{self.model}:"
+            f"{self.temperature}:{self.max_tokens}:{digest}"
+        )
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+        """Return cached generations for a prompt, or None on a miss."""
+        try:
+            raw = self.redis.get(self._key(prompt))
+        except Exception as e:
+            logger.warning(f"LLM cache lookup failed for {self.node}: {e}")
+            raw = None
+        if raw is None:
+            _record(self.node, hit=False)
+            return None
+
+        entries = json.loads(raw)
+        saved = sum(entry.get("total_tokens", 0) for entry in entries)
+        _record(self.node, hit=True, saved_tokens=saved)
+        logger.info(f"💾 LLM cache hit for {self.node} (saved {saved} tokens)")
+        # Cached messages carry no usage_metadata: nothing was billed for them
+        return [
+            ChatGeneration(message=AIMessage(content=entry["text"]))
+            if entry.get("chat", True)
+            else Generation(text=entry["text"])
+            for entry in entries
+        ]
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]):
+        """Store the generations produced for a prompt."""
+        entries = []
+        for generation in return_val:
+            entry: Dict[str, Any] = {
+                "text": generation.text,
+                "chat": isinstance(generation, ChatGeneration),
+            }
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                entry["total_tokens"] = usage.get("total_tokens", 0)
+            entries.append(entry)
+        try:
+            self.redis.set(self._key(prompt), json.dumps(entries), ex=self.ttl or None)
+        except Exception as e:
+            logger.warning(f"LLM cache store failed for {self.node}: {e}")
+
+    def clear(self, **kwargs: Any):
+        """Delete every cached response for this model configuration."""
+        pattern = f"{self.namespace}:*:{self.model}:{self.temperature}:{self.max_tokens}:*"
+        keys = list(self.redis.scan_iter(match=pattern, count=1000))
+        if keys:
+            self.redis.delete(*keys)
@@ -96,6 +96,27 @@ class Course(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.now)
 
 
+class CourseOverview(BaseModel):
+    """
+    Lightweight course projection returned by the "minimal" and "summary"
+    field profiles of CourseManager. Fields not in the profile stay None.
+    """
+
+    id: str
+    course_code: str
+    title: str
+    description: Optional[str] = None
+    department: Optional[str] = None
+    major: Optional[str] = None
+    difficulty_level: Optional[DifficultyLevel] = None
+    format: Optional[CourseFormat] = None
+    semester: Optional[Semester] = None
+    year: Optional[int] = None
+    credits: Optional[int] = None
+    instructor: Optional[str] = None
+    tags: List[str] = Field(default_factory=list)
+
+
 class Major(BaseModel):
     """Academic major information."""
 
@@ -11,10 +11,11 @@ of the Context Engineering course. These are production-ready patterns for:
 
 from typing import Any, Dict, List, Optional
 
-import tiktoken
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
 
+from .token_counter import get_token_counter
+
 
 # EXPERIMENTAL: Not currently used in notebooks or progressive_agents but available for external use
 # Token Counting (from Section 4, notebook 01_context_window_management.ipynb)
@@ -30,12 +31,8 @@ def count_tokens(text: str, model: str = "gpt-4o") -> int:
     Returns:
         Number of tokens
     """
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-        encoding = tiktoken.get_encoding("cl100k_base")
-
-    return len(encoding.encode(text))
+    # Shared counter: cached encoding and memoized counts for repeated text
+    return get_token_counter(model).count(text)
 
 
 # EXPERIMENTAL: Not currently used in notebooks or progressive_agents but available for external use
@@ -0,0 +1,359 @@
+"""
+Precomputed prerequisite graph for the course catalog.
+
+Prerequisites form a directed graph (course -> required course). Answering
+"what can I take after CS001" or "what is the full chain to CS040" by running
+one search per hop is slow, so this module builds the whole graph once and
+keeps it in memory as integer bitsets:
+
+- ``prereqs``: direct prerequisites of each course
+- ``closure``: every course required transitively (the full chain)
+- ``unlocks``: reverse edges, i.e. courses that list a course as prerequisite
+
+Eligibility checks, closures and reverse lookups are then a few bitwise
+operations. The direct edges (with each prerequisite's minimum grade) are
+also stored in Redis (one hash field per course) at ingestion time so other processes can rebuild the graph without
+scanning the catalog.
+
+Usage:
+    from redis_context_course.prerequisite_graph import PrerequisiteGraph
+
+    graph = PrerequisiteGraph.from_courses(courses)
+    graph.is_eligible("CS040", completed=["CS001", "CS010"])
+    graph.prerequisite_chain("CS040")
+    graph.unlocks("CS001")
+"""
+
+import json
+import logging
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+
+from .models import Course
+
+logger = logging.getLogger(__name__)
+
+
+class PrerequisiteGraph:
+    """
+    In-process prerequisite DAG with bitset closures.
+
+    Every course code is assigned a bit position. Sets of courses (a student's
+    completed courses, a closure, ...) are plain Python ints, so set
+    operations are single bitwise instructions regardless of catalog size.
+    """
+
+    def __init__(self, edges: Dict[str, List[Sequence]]):
+        """
+        Build the graph from direct edges.
+
+        Args:
+            edges: Course code -> list of (prerequisite code, can_be_concurrent,
+                minimum grade); the grade is missing from edges stored
+                before grades were recorded
+        """
+        codes = set(edges)
+        for prereqs in edges.values():
+            codes.update(edge[0] for edge in prereqs)
+
+        self.codes: List[str] = sorted(codes)
+        self._bit: Dict[str, int] = {code: i for i, code in enumerate(self.codes)}
+        size = len(self.codes)
+
+        # Direct prerequisites, split by whether they may be taken concurrently
+        self._strict = [0] * size
+        self._concurrent = [0] * size
+        self._unlocks = [0] * size
+        # Course code -> prerequisite code -> minimum grade (None if unknown)
+        self._min_grades: Dict[str, Dict[str, Optional[str]]] = {}
+        for code, prereqs in edges.items():
+            i = self._bit[code]
+            for edge in prereqs:
+                prereq_code, can_be_concurrent = edge[0], edge[1]
+                if len(edge) > 2:
+                    self._min_grades.setdefault(code, {})[prereq_code] = edge[2]
+                j = self._bit[prereq_code]
+                if can_be_concurrent:
+                    self._concurrent[i] |= 1 << j
+                else:
+                    self._strict[i] |= 1 << j
+                self._unlocks[j] |= 1 << i
+
+        self.cycles = self._find_cycles()
+        if self.cycles:
+            logger.warning(
+                f"Prerequisite graph has {len(self.cycles)} cycle(s): "
+                + "; ".join(" -> ".join(cycle) for cycle in self.cycles)
+            )
+        self._order = self._topological_order()
+        self._closure = self._compute_closure()
+
+    @classmethod
+    def from_courses(cls, courses: Iterable[Course]) -> "PrerequisiteGraph":
+        """Build the graph from Course records."""
+        return cls({course.course_code: cls.course_edges(course) for course in courses})
+
+    @staticmethod
+    def course_edges(course: Course) -> List[Tuple[str, bool, Optional[str]]]:
+        """Direct edges of one course as (prerequisite code, can_be_concurrent, minimum grade)."""
+        return [
+            (p.course_code, p.can_be_concurrent, p.minimum_grade)
+            for p in course.prerequisites
+        ]
+
+    # ------------------------------------------------------------------
+    # Redis persistence
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def redis_mapping(courses: Iterable[Course]) -> Dict[str, str]:
+        """Hash fields (course code -> JSON edges) for storing courses' edges."""
+        return {
+            course.course_code: json.dumps(PrerequisiteGraph.course_edges(course))
+            for course in courses
+        }
+
+    def _mapping(self) -> Dict[str, str]:
+        """Hash fields (course code -> JSON edges) for this graph's edges."""
+        return {
+            code: json.dumps(
+                [
+                    (prereq, concurrent, self.min_grade(code, prereq))
+                    for prereq, concurrent in self.direct_edges(code)
+                ]
+            )
+            for code in self.codes
+        }
+
+    def save(self, redis_client: Redis, key: str):
+        """Replace the edges stored under ``key`` with this graph's edges."""
+        mapping = self._mapping()
+        pipe = redis_client.pipeline()
+        pipe.delete(key)
+        if mapping:
+            pipe.hset(key, mapping=mapping)
+        pipe.execute()
+
+    async def asave(self, redis_client: AsyncRedis, key: str):
+        """Async version of ``save`` for redis.asyncio clients."""
+        mapping = self._mapping()
+        async with redis_client.pipeline() as pipe:
+            pipe.delete(key)
+            if mapping:
+                pipe.hset(key, mapping=mapping)
+            await pipe.execute()
+
+    @classmethod
+    def from_mapping(cls, mapping: Dict[str, str]) -> "PrerequisiteGraph":
+        """Build the graph from a stored hash (course code -> JSON edges)."""
+        return cls(
+            {
+                code: [(edge[0], bool(edge[1]), *edge[2:3]) for edge in json.loads(raw)]
+                for code, raw in mapping.items()
+            }
+        )
+
+    @classmethod
+    def load(cls, redis_client: Redis, key: str) -> Optional["PrerequisiteGraph"]:
+        """Load the graph stored under ``key``, or None if nothing is stored."""
+        mapping = redis_client.hgetall(key)
+        return cls.from_mapping(mapping) if mapping else None
+
+    # ------------------------------------------------------------------
+    # Bitset helpers
+    # ------------------------------------------------------------------
+
+    def __contains__(self, course_code: str) -> bool:
+        return course_code in self._bit
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def mask(self, course_codes: Iterable[str]) -> int:
+        """Bitset of the given course codes (unknown codes are ignored)."""
+        bits = 0
+        for code in course_codes:
+            i = self._bit.get(code)
+            if i is not None:
+                bits |= 1 << i
+        return bits
+
+    def codes_of(self, bits: int) -> List[str]:
+        """Course codes in a bitset, in topological (take-first) order."""
+        return [code for code in self._order if bits >> self._bit[code] & 1]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def direct_edges(self, course_code: str) -> List[Tuple[str, bool]]:
+        """Direct prerequisites of a course as (code, can_be_concurrent)."""
+        i = self._bit.get(course_code)
+        if i is None:
+            return []
+        return [(code, False) for code in self.codes_of(self._strict[i])] + [
+            (code, True) for code in self.codes_of(self._concurrent[i])
+        ]
+
+    def min_grade(self, course_code: str, prerequisite_code: str) -> Optional[str]:
+        """Minimum grade required in a direct prerequisite (None if unknown)."""
+        return self._min_grades.get(course_code, {}).get(prerequisite_code)
+
+    def missing_prerequisites(
+        self,
+        course_code: str,
+        completed: Iterable[str] = (),
+        current: Iterable[str] = (),
+    ) -> List[str]:
+        """Direct prerequisites of a course the student has not satisfied."""
+        i = self._bit.get(course_code)
+        if i is None:
+            return []
+        done = self.mask(completed)
+        in_progress = done | self.mask(current)
+        missing = (self._strict[i] & ~done) | (self._concurrent[i] & ~in_progress)
+        return self.codes_of(missing)
+
+    def is_eligible(
+        self,
+        course_code: str,
+        completed: Iterable[str] = (),
+        current: Iterable[str] = (),
+    ) -> bool:
+        """Whether a student may take a course (unknown courses have no prerequisites)."""
+        return self.is_eligible_mask(
+            course_code, self.mask(completed), self.mask(current)
+        )
+
+    def is_eligible_mask(self, course_code: str, done: int, current: int = 0) -> bool:
+        """Eligibility check against precomputed student bitsets."""
+        i = self._bit.get(course_code)
+        if i is None:
+            return True
+        return not (self._strict[i] & ~done) and not (
+            self._concurrent[i] & ~(done | current)
+        )
+
+    def prerequisite_chain(self, course_code: str) -> List[str]:
+        """Every course required, directly or transitively, in take-first order."""
+        i = self._bit.get(course_code)
+        return self.codes_of(self._closure[i]) if i is not None else []
+
+    def unlocks(self, course_code: str, transitive: bool = False) -> List[str]:
+        """Courses that require ``course_code`` (directly, or anywhere in their chain)."""
+        i = self._bit.get(course_code)
+        if i is None:
+            return []
+        if not transitive:
+            return self.codes_of(self._unlocks[i])
+        bit = 1 << i
+        return self.codes_of(
+            self.mask(code for j, code in enumerate(self.codes) if self._closure[j] & bit)
+        )
+
+    def eligible_courses(
+        self, completed: Iterable[str] = (), current: Iterable[str] = ()
+    ) -> List[str]:
+        """Courses not yet taken whose prerequisites are all satisfied."""
+        completed = list(completed)
+        current = list(current)
+        done = self.mask(completed)
+        in_progress = self.mask(current)
+        taken = done | in_progress
+        return [
+            code
+            for code in self._order
+            if not taken >> self._bit[code] & 1
+            and self.is_eligible_mask(code, done, in_progress)
+        ]
+
+    def describe(self, course_code: str) -> str:
+        """Short text summary of a course's place in the graph, for LLM context."""
+        chain = self.prerequisite_chain(course_code)
+        unlocked = self.unlocks(course_code)
+        lines = [f"{course_code}:"]
+        lines.append(f"  Full prerequisite chain: {', '.join(chain) if chain else 'None'}")
+        lines.append(f"  Unlocks: {', '.join(unlocked) if unlocked else 'None'}")
+        return "\n".join(lines)
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    def _direct(self, i: int) -> int:
+        return self._strict[i] | self._concurrent[i]
+
+    def _bits(self, bits: int) -> Iterable[int]:
+        while bits:
+            low = bits & -bits
+            yield low.bit_length() - 1
+            bits ^= low
+
+    def _find_cycles(self) -> List[List[str]]:
+        """Detect prerequisite cycles with an iterative three-colour DFS."""
+        WHITE, GREY, BLACK = 0, 1, 2
+        colour = [WHITE] * len(self.codes)
+        cycles = []
+        for root in range(len(self.codes)):
+            if colour[root] != WHITE:
+                continue
+            path = [root]
+            stack = [iter(self._bits(self._direct(root)))]
+            colour[root] = GREY
+            while stack:
+                child = next(stack[-1], None)
+                if child is None:
+                    colour[path.pop()] = BLACK
+                    stack.pop()
+                elif colour[child] == GREY:
+                    cycle = path[path.index(child) :] + [child]
+                    cycles.append([self.codes[i] for i in cycle])
+                elif colour[child] == WHITE:
+                    colour[child] = GREY
+                    path.append(child)
+                    stack.append(iter(self._bits(self._direct(child))))
+        return cycles
+
+    def _topological_order(self) -> List[str]:
+        """Prerequisites before dependents (Kahn); courses on cycles go last."""
+        remaining = [bin(self._direct(i)).count("1") for i in range(len(self.codes))]
+        ready = deque(i for i, count in enumerate(remaining) if count == 0)
+        order = []
+        while ready:
+            i = ready.popleft()
+            order.append(i)
+            for j in self._bits(self._unlocks[i]):
+                remaining[j] -= 1
+                if remaining[j] == 0:
+                    ready.append(j)
+        placed = set(order)
+        order.extend(i for i in range(len(self.codes)) if i not in placed)
+        return [self.codes[i] for i in order]
+
+    def _compute_closure(self) -> List[int]:
+        """Transitive prerequisites of every course as bitsets."""
+        closure = [0] * len(self.codes)
+        if self.cycles:
+            # No valid topological order: fall back to a traversal per course
+            for i in range(len(self.codes)):
+                seen, frontier = 0, self._direct(i)
+                while frontier:
+                    seen |= frontier
+                    next_frontier = 0
+                    for j in self._bits(frontier):
+                        next_frontier |= self._direct(j)
+                    frontier = next_frontier & ~seen
+                closure[i] = seen
+            return closure
+
+        # In topological order every prerequisite's closure is already final
+        for code in self._order:
+            i = self._bit[code]
+            bits = self._direct(i)
+            for j in self._bits(self._direct(i)):
+                bits |= closure[j]
+            closure[i] = bits
+        return closure
@@ -2,18 +2,101 @@
 Redis configuration and connection management for the Class Agent.
 
 This module handles all Redis connections, including vector storage
-and checkpointing.
+and checkpointing. Synchronous clients are the default; set
+``use_asyncio=True`` to get redis.asyncio clients for async callers.
 """
 
 import os
-from typing import Optional
+import threading
+import time
+from typing import Any, Dict, Optional, Union
 
 import redis
+import redis.asyncio
 from langchain_openai import OpenAIEmbeddings
 from langgraph.checkpoint.redis import RedisSaver
-from redisvl.index import SearchIndex
+from redis.asyncio import Redis as AsyncRedis
+from redisvl.index import AsyncSearchIndex, SearchIndex
 from redisvl.schema import IndexSchema
 
+from .embedding_cache import CachedEmbeddings, EmbeddingCache
+
+
+class _PoolStatsMixin:
+    """Track checkout wait time and in-use connections for a connection pool."""
+
+    def _init_stats(self):
+        self._stats_lock = threading.Lock()
+        self._in_use = 0
+        self._checkouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _record_checkout(self, waited: float):
+        with self._stats_lock:
+            self._in_use += 1
+            self._checkouts += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+
+    def _record_release(self):
+        with self._stats_lock:
+            self._in_use = max(0, self._in_use - 1)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of pool usage for sizing against expected concurrency."""
+        with self._stats_lock:
+            created = len(getattr(self, "_connections", []))
+            return {
+                "max_connections": self.max_connections,
+                "created": created,
+                "in_use": self._in_use,
+                "idle": max(0, created - self._in_use),
+                "checkouts": self._checkouts,
+                "avg_wait_ms": (self._total_wait / self._checkouts) * 1000
+                if self._checkouts
+                else 0.0,
+                "max_wait_ms": self._max_wait * 1000,
+            }
+
+
+class InstrumentedConnectionPool(_PoolStatsMixin, redis.BlockingConnectionPool):
+    """Blocking connection pool that records wait time and usage."""
+
+    def __init__(self, *args, **kwargs):
+        self._init_stats()
+        super().__init__(*args, **kwargs)
+
+    def get_connection(self, *args, **kwargs):
+        start = time.perf_counter()
+        connection = super().get_connection(*args, **kwargs)
+        self._record_checkout(time.perf_counter() - start)
+        return connection
+
+    def release(self, connection):
+        self._record_release()
+        super().release(connection)
+
+
+class AsyncInstrumentedConnectionPool(
+    _PoolStatsMixin, redis.asyncio.BlockingConnectionPool
+):
+    """asyncio counterpart of InstrumentedConnectionPool."""
+
+    def __init__(self, *args, **kwargs):
+        self._init_stats()
+        super().__init__(*args, **kwargs)
+
+    async def get_connection(self, *args, **kwargs):
+        start = time.perf_counter()
+        connection = await super().get_connection(*args, **kwargs)
+        self._record_checkout(time.perf_counter() - start)
+        return connection
+
+    async def release(self, connection):
+        self._record_release()
+        await super().release(connection)
+
 
 class RedisConfig:
     """Redis configuration management."""
@@ -23,72 +106,211 @@ class RedisConfig:
         redis_url: Optional[str] = None,
         vector_index_name: str = "course_catalog",
         checkpoint_namespace: str = "class_agent",
+        use_embedding_cache: bool = True,
+        embedding_cache_path: Optional[str] = None,
+        use_asyncio: bool = False,
+        max_connections: Optional[int] = None,
+        pool_timeout: float = 20.0,
+        socket_timeout: Optional[float] = None,
+        socket_connect_timeout: Optional[float] = None,
+        health_check_interval: int = 30,
+        socket_keepalive: bool = True,
     ):
+        """
+        Initialize Redis configuration.
+
+        Every consumer of this config (redis_client, checkpointer, embedding
+        cache, HierarchicalCourseManager) shares one connection pool built from
+        the pool settings below. The RedisVL vector indexes get a second pool
+        with the same settings but without response decoding, because search
+        results may contain binary fields such as content_vector.
+
+        Args:
+            redis_url: Redis connection URL (defaults to env var REDIS_URL)
+            vector_index_name: Name of the course vector index
+            checkpoint_namespace: Namespace for LangGraph checkpoints
+            use_embedding_cache: Wrap embeddings with the embedding cache
+            embedding_cache_path: Optional SQLite file for the local cache tier
+            use_asyncio: Use redis.asyncio clients in CourseManager
+            max_connections: Pool size (defaults to env var REDIS_MAX_CONNECTIONS or 50)
+            pool_timeout: Seconds to wait for a free connection before erroring
+            socket_timeout: Socket read/write timeout in seconds
+            socket_connect_timeout: Socket connect timeout in seconds
+            health_check_interval: Seconds between PINGs on idle connections
+            socket_keepalive: Enable TCP keep-alive on pooled connections
+        """
         self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://redis:6379")
         # Allow override via environment variable for progressive agents
         self.vector_index_name = os.getenv("COURSE_INDEX_NAME", vector_index_name)
         self.checkpoint_namespace = checkpoint_namespace
+        self.use_embedding_cache = use_embedding_cache
+        # Optional local tier for the embedding cache (SQLite file)
+        self.embedding_cache_path = embedding_cache_path or os.getenv(
+            "EMBEDDING_CACHE_PATH"
+        )
+
+        # When True, CourseManager awaits redis.asyncio / AsyncSearchIndex calls
+        # instead of blocking the event loop with the synchronous client
+        self.use_asyncio = use_asyncio
+
+        # Connection pool settings
+        self.max_connections = max_connections or int(
+            os.getenv("REDIS_MAX_CONNECTIONS", "50")
+        )
+        self.pool_timeout = pool_timeout
+        self.socket_timeout = socket_timeout
+        self.socket_connect_timeout = socket_connect_timeout
+        self.health_check_interval = health_check_interval
+        self.socket_keepalive = socket_keepalive
 
         # Initialize connections
+        self._connection_pool = None
+        self._async_connection_pool = None
+        self._index_connection_pool = None
+        self._async_index_connection_pool = None
         self._redis_client = None
+        self._index_redis_client = None
+        self._async_index_redis_client = None
         self._vector_index = None
+        self._async_redis_client = None
+        self._async_vector_index = None
         self._checkpointer = None
         self._embeddings = None
+        self._embedding_cache = None
+
+    def _pool_kwargs(self, decode_responses: bool = True) -> Dict[str, Any]:
+        return {
+            "max_connections": self.max_connections,
+            "timeout": self.pool_timeout,
+            "socket_timeout": self.socket_timeout,
+            "socket_connect_timeout": self.socket_connect_timeout,
+            "health_check_interval": self.health_check_interval,
+            "socket_keepalive": self.socket_keepalive,
+            "decode_responses": decode_responses,
+        }
+
+    @property
+    def connection_pool(self) -> InstrumentedConnectionPool:
+        """Get the connection pool shared by every synchronous consumer."""
+        if self._connection_pool is None:
+            self._connection_pool = InstrumentedConnectionPool.from_url(
+                self.redis_url, **self._pool_kwargs()
+            )
+        return self._connection_pool
+
+    @property
+    def async_connection_pool(self) -> AsyncInstrumentedConnectionPool:
+        """Get the connection pool shared by every asyncio consumer."""
+        if self._async_connection_pool is None:
+            self._async_connection_pool = AsyncInstrumentedConnectionPool.from_url(
+                self.redis_url, **self._pool_kwargs()
+            )
+        return self._async_connection_pool
+
+    def pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get usage statistics for the shared pools.
+
+        Returns:
+            Dictionary with "sync" (and "async" if used) entries containing
+            max_connections, created, in_use, idle, checkouts, avg_wait_ms
+            and max_wait_ms; "index"/"async_index" entries cover the vector
+            index pools once used
+        """
+        stats = {"sync": self.connection_pool.stats()}
+        if self._async_connection_pool is not None:
+            stats["async"] = self._async_connection_pool.stats()
+        if self._index_connection_pool is not None:
+            stats["index"] = self._index_connection_pool.stats()
+        if self._async_index_connection_pool is not None:
+            stats["async_index"] = self._async_index_connection_pool.stats()
+        return stats
 
     @property
     def redis_client(self) -> redis.Redis:
-        """Get Redis client instance."""
+        """Get Redis client instance (backed by the shared pool)."""
         if self._redis_client is None:
-            self._redis_client = redis.from_url(self.redis_url, decode_responses=True)
+            self._redis_client = redis.Redis(connection_pool=self.connection_pool)
         return self._redis_client
 
     @property
-    def embeddings(self) -> OpenAIEmbeddings:
-        """Get OpenAI embeddings instance."""
+    def index_redis_client(self) -> redis.Redis:
+        """Get the non-decoding Redis client used by the RedisVL vector index."""
+        if self._index_redis_client is None:
+            self._index_connection_pool = InstrumentedConnectionPool.from_url(
+                self.redis_url, **self._pool_kwargs(decode_responses=False)
+            )
+            self._index_redis_client = redis.Redis(
+                connection_pool=self._index_connection_pool
+            )
+        return self._index_redis_client
+
+    @property
+    def embedding_cache(self) -> EmbeddingCache:
+        """Get the content-addressed embedding cache shared by this config."""
+        if self._embedding_cache is None:
+            self._embedding_cache = EmbeddingCache(
+                redis_client=self.redis_client,
+                disk_path=self.embedding_cache_path,
+            )
+        return self._embedding_cache
+
+    @property
+    def embeddings(self) -> Union[OpenAIEmbeddings, CachedEmbeddings]:
+        """Get OpenAI embeddings instance (cached unless disabled)."""
         if self._embeddings is None:
-            self._embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
+            embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
+            if self.use_embedding_cache:
+                embeddings = CachedEmbeddings(embeddings, self.embedding_cache)
+            self._embeddings = embeddings
         return self._embeddings
 
+    def course_index_schema(self) -> IndexSchema:
+        """Build the course catalog index schema (shared by sync and async indexes)."""
+        return IndexSchema.from_dict(
+            {
+                "index": {
+                    "name": self.vector_index_name,
+                    "prefix": f"{self.vector_index_name}:",
+                    "storage_type": "hash",
+                },
+                "fields": [
+                    {"name": "id", "type": "tag"},
+                    {"name": "course_code", "type": "tag"},
+                    {"name": "title", "type": "text"},
+                    {"name": "description", "type": "text"},
+                    {"name": "department", "type": "tag"},
+                    {"name": "major", "type": "tag"},
+                    {"name": "difficulty_level", "type": "tag"},
+                    {"name": "format", "type": "tag"},
+                    {"name": "semester", "type": "tag"},
+                    {"name": "year", "type": "numeric"},
+                    {"name": "credits", "type": "numeric"},
+                    {"name": "tags", "type": "tag"},
+                    {
+                        "name": "content_vector",
+                        "type": "vector",
+                        "attrs": {
+                            "dims": 1536,
+                            "distance_metric": "cosine",
+                            "algorithm": "hnsw",
+                            "datatype": "float32",
+                        },
+                    },
+                ],
+            }
+        )
+
     @property
     def vector_index(self) -> SearchIndex:
         """Get or create vector search index for courses."""
         if self._vector_index is None:
-            schema = IndexSchema.from_dict(
-                {
-                    "index": {
-                        "name": self.vector_index_name,
-                        "prefix": f"{self.vector_index_name}:",
-                        "storage_type": "hash",
-                    },
-                    "fields": [
-                        {"name": "id", "type": "tag"},
-                        {"name": "course_code", "type": "tag"},
-                        {"name": "title", "type": "text"},
-                        {"name": "description", "type": "text"},
-                        {"name": "department", "type": "tag"},
-                        {"name": "major", "type": "tag"},
-                        {"name": "difficulty_level", "type": "tag"},
-                        {"name": "format", "type": "tag"},
-                        {"name": "semester", "type": "tag"},
-                        {"name": "year", "type": "numeric"},
-                        {"name": "credits", "type": "numeric"},
-                        {"name": "tags", "type": "tag"},
-                        {
-                            "name": "content_vector",
-                            "type": "vector",
-                            "attrs": {
-                                "dims": 1536,
-                                "distance_metric": "cosine",
-                                "algorithm": "hnsw",
-                                "datatype": "float32",
-                            },
-                        },
-                    ],
-                }
-            )
+            schema = self.course_index_schema()
 
-            # Initialize index with connection params (avoid deprecated .connect())
-            self._vector_index = SearchIndex(schema, redis_url=self.redis_url)
+            # Pooled, but not decoding: results may carry binary vector fields
+            self._vector_index = SearchIndex(
+                schema, redis_client=self.index_redis_client
+            )
 
             # Create index if it doesn't exist
             try:
@@ -99,6 +321,41 @@ class RedisConfig:
 
         return self._vector_index
 
+    @property
+    def async_redis_client(self) -> AsyncRedis:
+        """Get asyncio Redis client instance (used when use_asyncio is True)."""
+        if self._async_redis_client is None:
+            self._async_redis_client = AsyncRedis(
+                connection_pool=self.async_connection_pool
+            )
+        return self._async_redis_client
+
+    @property
+    def async_index_redis_client(self) -> AsyncRedis:
+        """Get the non-decoding asyncio client used by the async vector index."""
+        if self._async_index_redis_client is None:
+            self._async_index_connection_pool = AsyncInstrumentedConnectionPool.from_url(
+                self.redis_url, **self._pool_kwargs(decode_responses=False)
+            )
+            self._async_index_redis_client = AsyncRedis(
+                connection_pool=self._async_index_connection_pool
+            )
+        return self._async_index_redis_client
+
+    @property
+    def async_vector_index(self) -> AsyncSearchIndex:
+        """
+        Get asyncio vector search index for courses.
+
+        The index itself is created by ``vector_index`` (once, at setup time);
+        this handle only issues non-blocking FT.SEARCH calls against it.
+        """
+        if self._async_vector_index is None:
+            self._async_vector_index = AsyncSearchIndex(
+                self.course_index_schema(), redis_client=self.async_index_redis_client
+            )
+        return self._async_vector_index
+
     @property
     def checkpointer(self) -> RedisSaver:
         """Get Redis checkpointer for LangGraph state management."""
@@ -121,6 +378,23 @@ class RedisConfig:
             self._redis_client.close()
         if self._vector_index:
             self._vector_index.disconnect()
+        if self._connection_pool:
+            self._connection_pool.disconnect()
+        if self._index_connection_pool:
+            self._index_connection_pool.disconnect()
+
+    # EXPERIMENTAL: Not currently used in notebooks or progressive_agents but available for external use
+    async def acleanup(self):
+        """Clean up asyncio connections (must run on the loop that used them)."""
+        if self._async_vector_index:
+            await self._async_vector_index.disconnect()
+        if self._async_redis_client:
+            await self._async_redis_client.aclose()
+        if self._async_connection_pool:
+            await self._async_connection_pool.disconnect()
+        if self._async_index_connection_pool:
+            await self._async_index_connection_pool.disconnect()
+        self.cleanup()
 
 
 # Global configuration instance
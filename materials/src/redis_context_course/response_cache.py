@@ -0,0 +1,211 @@
+"""
+Two-tier exact-match response cache.
+
+A large share of agent traffic is the same question asked verbatim. Such
+repeats do not need an embedding (semantic cache) or an LLM call, only a
+lookup by a normalized form of the query:
+
+- casefolded, Unicode-normalized, whitespace collapsed, trailing punctuation
+  dropped
+- course codes canonicalized ("cs 002", "Cs-002" and "CS002" all become
+  "CS002")
+
+Entries are scoped by the local catalog file version and by the ingested
+catalog version from the Redis manifest (see catalog_manifest), so a new
+catalog never serves stale answers, and record the intent they were answered under so a hit can skip
+intent classification too. Answers that depend on who is asking (memories,
+preferences) are stored under an optional ``scope`` such as the student id,
+so they are only repeated to the same student.
+
+Tiers:
+1. L1 - in-process LRU, no network round trip
+2. L2 - Redis strings with a TTL, shared across processes; L2 hits are
+   promoted into L1
+
+Usage:
+    from redis_context_course.response_cache import ResponseCache
+
+    cache = ResponseCache(redis_client, catalog_version=catalog.version)
+    entry = cache.get("what are the prerequisites for cs 002", scope=student_id)
+    if entry is None:
+        cache.set(
+            "What are the prerequisites for CS002?", answer,
+            intent="PREREQUISITES", scope=student_id,
+        )
+    print(cache.stats())
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple, Union
+
+from redis import Redis
+
+from .catalog_manifest import CatalogManifest
+from .redis_config import RedisConfig, redis_config
+
+logger = logging.getLogger(__name__)
+
+# Department letters and a three-digit number, optionally separated
+_COURSE_CODE = re.compile(r"\b([a-z]{2,4})[\s-]?(\d{3})\b")
+_TRAILING_PUNCTUATION = re.compile(r"[\s?!.]+$")
+
+
+def normalize_query(query: str) -> str:
+    """Canonical form of a query used as the exact-match cache key."""
+    text = unicodedata.normalize("NFKC", query).casefold()
+    text = " ".join(text.split())
+    text = _COURSE_CODE.sub(lambda m: f"{m.group(1).upper()}{m.group(2)}", text)
+    return _TRAILING_PUNCTUATION.sub("", text)
+
+
+class ResponseCache:
+    """
+    Exact-match response cache with an in-process L1 and a Redis L2.
+
+    Hit/miss counters are kept per instance for ``stats()``.
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[Redis] = None,
+        namespace: str = "response_cache",
+        catalog_version: Optional[str] = None,
+        ttl: int = 3600,
+        max_local_entries: int = 1024,
+        config: Optional[RedisConfig] = None,
+        manifest: Optional[CatalogManifest] = None,
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            redis_client: Redis client (uses default if None)
+            namespace: Key prefix for L2 entries
+            catalog_version: Catalog version entries are scoped to
+            ttl: Seconds before an entry expires (both tiers)
+            max_local_entries: Maximum L1 entries (least recently used are evicted)
+            config: RedisConfig whose shared connection pool to use
+                (uses global redis_config if None)
+            manifest: Catalog manifest whose version scopes entries (reads
+                the default manifest on the same Redis if None)
+        """
+        self.redis = redis_client or (config or redis_config).redis_client
+        self.namespace = namespace
+        self.catalog_version = catalog_version
+        self.manifest = manifest or CatalogManifest(self.redis)
+        self.ttl = ttl
+        self.max_local_entries = max_local_entries
+
+        self._local: "OrderedDict[str, Tuple[float, Dict[str, str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+
+    def key(self, query: str, scope: Optional[str] = None) -> str:
+        """L2 key for a query (in a scope) under the current catalog versions."""
+        digest = hashlib.sha256(normalize_query(query).encode("utf-8")).hexdigest()
+        if scope is not None:
+            digest = f"{scope}:{digest}"
+        return (
+            f"{self.namespace}:{self.catalog_version or 'unversioned'}:"
+            f"{self.manifest.version}:{digest}"
+        )
+
+    def get(
+        self, query: str, intent: Optional[str] = None, scope: Optional[str] = None
+    ) -> Optional[Dict[str, str]]:
+        """
+        Look a query up, L1 first.
+
+        Args:
+            query: User query (normalized internally)
+            intent: If given, only entries answered under this intent are returned
+            scope: If given, only entries stored under this scope (e.g. a
+                student id) are returned
+
+        Returns:
+            {"response": ..., "intent": ..., "tier": "l1" | "l2"} or None
+        """
+        key = self.key(query, scope)
+        entry = self._get_local(key)
+        tier = "l1"
+        if entry is None:
+            tier = "l2"
+            try:
+                raw = self.redis.get(key)
+            except Exception as e:
+                logger.warning(f"Response cache lookup failed: {e}")
+                raw = None
+            if raw is not None:
+                entry = json.loads(raw)
+                self._set_local(key, entry)
+
+        if entry is None or (intent is not None and entry.get("intent") != intent):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            if tier == "l1":
+                self.l1_hits += 1
+            else:
+                self.l2_hits += 1
+        return {**entry, "tier": tier}
+
+    def set(self, query: str, response: str, intent: str, scope: Optional[str] = None):
+        """Store a response in both tiers, optionally under a scope such as a student id."""
+        key = self.key(query, scope)
+        entry = {"response": response, "intent": intent}
+        self._set_local(key, entry)
+        try:
+            self.redis.set(key, json.dumps(entry), ex=self.ttl or None)
+        except Exception as e:
+            logger.warning(f"Response cache store failed: {e}")
+
+    def _get_local(self, key: str) -> Optional[Dict[str, str]]:
+        with self._lock:
+            item = self._local.get(key)
+            if item is None:
+                return None
+            expires_at, entry = item
+            if expires_at and expires_at < time.monotonic():
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+            return entry
+
+    def _set_local(self, key: str, entry: Dict[str, str]):
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0.0
+        with self._lock:
+            self._local[key] = (expires_at, entry)
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_local_entries:
+                self._local.popitem(last=False)
+
+    def clear_local(self):
+        """Drop L1 entries (L2 entries expire by TTL)."""
+        with self._lock:
+            self._local.clear()
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Hit ratios per tier for this process."""
+        with self._lock:
+            lookups = self.l1_hits + self.l2_hits + self.misses
+            return {
+                "l1_hits": self.l1_hits,
+                "l2_hits": self.l2_hits,
+                "misses": self.misses,
+                "local_entries": len(self._local),
+                "l1_hit_rate": self.l1_hits / lookups if lookups else 0.0,
+                "l2_hit_rate": self.l2_hits / lookups if lookups else 0.0,
+                "hit_rate": (self.l1_hits + self.l2_hits) / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark hierarchical catalog startup paths.
+
+Measures the time from loading the catalog to answering the first query (looking
+up one course with full details) for:
+
+1. full validation  - json.load + HierarchicalCourse(**c) for every course
+                      (what the agent stages did before the shared catalog)
+2. JSON catalog     - json.load + summary validation, details on demand
+3. snapshot catalog - memory-mapped msgpack snapshot, courses decoded on demand
+
+Each path runs in a fresh interpreter so in-process caches do not hide the
+cost; interpreter start-up and package imports are excluded from the timing.
+
+Usage:
+    python -m redis_context_course.scripts.benchmark_catalog_startup
+    python -m redis_context_course.scripts.benchmark_catalog_startup \
+        -i path/to/hierarchical_courses.json --runs 20
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+import click
+
+from redis_context_course.catalog import DEFAULT_CATALOG_PATH, write_snapshot
+
+_TIMER = """
+import json, sys, time
+from redis_context_course.catalog import HierarchicalCatalog, load_snapshot
+from redis_context_course.hierarchical_models import HierarchicalCourse
+path, mode, code = sys.argv[1], sys.argv[2], sys.argv[3]
+start = time.perf_counter()
+if mode == "full":
+    with open(path) as f:
+        courses = [HierarchicalCourse(**c) for c in json.load(f)["courses"]]
+    course = next(c for c in courses if c.summary.course_code == code)
+elif mode == "json":
+    course = HierarchicalCatalog.from_file(path).get(code)
+else:
+    course = load_snapshot(path).get(code)
+assert course is not None and course.details.course_code == code
+print(json.dumps({"seconds": time.perf_counter() - start}))
+"""
+
+PATHS = [
+    ("full", "full validation"),
+    ("json", "JSON catalog"),
+    ("snapshot", "snapshot catalog"),
+]
+
+
+def _time_once(json_path: Path, mode: str, course_code: str) -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", _TIMER, str(json_path), mode, course_code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])["seconds"]
+
+
+@click.command()
+@click.option(
+    "--input-file",
+    "-i",
+    type=click.Path(exists=True),
+    default=str(DEFAULT_CATALOG_PATH),
+    show_default=True,
+    help="Hierarchical courses JSON file",
+)
+@click.option("--runs", default=10, show_default=True, help="Fresh processes per path")
+def main(input_file: str, runs: int):
+    """Compare time-to-first-query for JSON and snapshot catalog loading."""
+    json_path = Path(input_file).resolve()
+    with open(json_path) as f:
+        courses = json.load(f)["courses"]
+    # Look up the last course so list scans pay their full cost
+    course_code = courses[-1]["summary"]["course_code"]
+
+    snapshot = write_snapshot(json_path)
+    print(f"📦 Catalog: {json_path} ({len(courses)} courses)")
+    print(f"   Snapshot: {snapshot} ({snapshot.stat().st_size / 1024:.1f} KiB)")
+    print(f"   First query: {course_code}, {runs} fresh processes per path\n")
+
+    results = {}
+    for mode, label in PATHS:
+        timings = [_time_once(json_path, mode, course_code) for _ in range(runs)]
+        results[mode] = statistics.median(timings)
+        print(
+            f"   {label:<18} median {results[mode] * 1000:8.2f} ms  "
+            f"(min {min(timings) * 1000:.2f} ms, max {max(timings) * 1000:.2f} ms)"
+        )
+
+    print(
+        f"\n⚡ Snapshot is {results['full'] / results['snapshot']:.1f}x faster than full "
+        f"validation and {results['json'] / results['snapshot']:.1f}x faster than the "
+        f"JSON catalog"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark hierarchical context assembly.
+
+Assembles the same kind of context the agent stages build for every search
+(summaries for the top matches, full or filtered details for the top three)
+over random course selections from the catalog, and compares:
+
+1. uncached  - every summary and detail section rendered on each query, with
+               filtered queries copying CourseDetails first (the previous
+               stage 4-6 behaviour)
+2. cached    - rendered fragments reused per (catalog version, course, sections)
+
+Usage:
+    python -m redis_context_course.scripts.benchmark_context_assembly
+    python -m redis_context_course.scripts.benchmark_context_assembly \
+        -i path/to/hierarchical_courses.json --queries 5000
+"""
+
+import random
+import time
+
+import click
+
+from redis_context_course.catalog import DEFAULT_CATALOG_PATH, HierarchicalCatalog
+from redis_context_course.hierarchical_context import HierarchicalContextAssembler
+
+INFO_TYPES = [[], [], ["assignments"], ["syllabus"], ["prerequisites", "overview"]]
+
+
+def _copy_filtered(details, info_types):
+    """Per-call model copy with unrequested sections blanked (old behaviour)."""
+    sections = HierarchicalContextAssembler.sections_for(info_types)
+    if sections is None:
+        return details
+    return [
+        d.model_copy(
+            update={
+                "full_description": d.full_description
+                if "description" in sections
+                else "",
+                "prerequisites": d.prerequisites if "prerequisites" in sections else [],
+                "learning_objectives": d.learning_objectives
+                if "objectives" in sections
+                else [],
+                "assignments": d.assignments if "assignments" in sections else [],
+            },
+            deep=True,
+        )
+        for d in details
+    ]
+
+
+def _run(assembler, catalog, workload, copy_models: bool) -> float:
+    start = time.perf_counter()
+    for query, codes, info_types in workload:
+        courses = catalog.get_many(codes)
+        details = [c.details for c in courses[:3]]
+        if copy_models:
+            details = _copy_filtered(details, info_types)
+            sections = None
+        else:
+            sections = assembler.sections_for(info_types)
+        assembler.assemble_hierarchical_context(
+            summaries=[c.summary for c in courses],
+            details=details,
+            query=query,
+            detail_sections=sections,
+        )
+    return time.perf_counter() - start
+
+
+@click.command()
+@click.option(
+    "--input-file",
+    "-i",
+    type=click.Path(exists=True),
+    default=str(DEFAULT_CATALOG_PATH),
+    show_default=True,
+    help="Hierarchical courses JSON file",
+)
+@click.option("--queries", default=2000, show_default=True, help="Queries to assemble")
+@click.option("--top-k", default=5, show_default=True, help="Courses per query")
+@click.option("--seed", default=42, show_default=True, help="Random seed for the workload")
+def main(input_file: str, queries: int, top_k: int, seed: int):
+    """Compare uncached and fragment-cached context assembly."""
+    catalog = HierarchicalCatalog.from_file(input_file)
+    codes = catalog.course_codes
+    rng = random.Random(seed)
+    workload = [
+        (f"query {i}", rng.sample(codes, min(top_k, len(codes))), rng.choice(INFO_TYPES))
+        for i in range(queries)
+    ]
+    # Validate every course up front so only assembly is timed
+    catalog.get_many(codes)
+
+    print(f"📦 Catalog: {input_file} ({len(codes)} courses)")
+    print(f"   {queries} queries, top {top_k} summaries + 3 details each\n")
+
+    uncached = _run(HierarchicalContextAssembler(), catalog, workload, copy_models=True)
+    cached_assembler = HierarchicalContextAssembler(catalog_version=catalog.version)
+    cached = _run(cached_assembler, catalog, workload, copy_models=False)
+
+    for label, seconds in [("uncached", uncached), ("cached", cached)]:
+        print(
+            f"   {label:<10} {seconds * 1000:8.1f} ms total  "
+            f"{seconds / queries * 1e6:8.1f} µs/query"
+        )
+    stats = cached_assembler.fragment_cache_stats()
+    print(
+        f"\n   Fragment cache: {stats['entries']} entries, "
+        f"hit rate {stats['hit_rate']:.1%}"
+    )
+    print(f"⚡ Cached assembly is {uncached / cached:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ import asyncio
 import json
 import os
 import sys
+import time
 from datetime import datetime
 from typing import Any, Dict, List
 
@@ -45,6 +46,7 @@ class CourseIngestionPipeline:
         self._config = config or redis_config
         self.course_manager = CourseManager(config=self._config)
         self.redis_client = self._config.redis_client
+        self.manifest = self.course_manager.catalog_manifest
 
     def load_catalog_from_json(self, filename: str) -> Dict[str, List[Dict[str, Any]]]:
         """Load course catalog data from JSON file."""
@@ -119,32 +121,68 @@ class CourseIngestionPipeline:
             career_paths=major_data.get("career_paths", []),
         )
 
-    async def ingest_courses(self, courses_data: List[Dict[str, Any]]) -> int:
-        """Ingest courses into Redis with progress tracking."""
-        ingested_count = 0
+    async def ingest_courses(
+        self,
+        courses_data: List[Dict[str, Any]],
+        batch_size: int = 64,
+        max_concurrency: int = 4,
+    ) -> int:
+        """Ingest courses into Redis in embedding batches with progress tracking."""
+        courses = []
+        for course_data in courses_data:
+            try:
+                courses.append(self._dict_to_course(course_data))
+            except Exception as e:
+                console.print(
+                    f"[red]❌ Failed to ingest course {course_data.get('course_code', 'unknown')}: {e}[/red]"
+                )
 
         with Progress() as progress:
             task = progress.add_task(
                 "[green]Ingesting courses...", total=len(courses_data)
             )
+            progress.update(task, advance=len(courses_data) - len(courses))
+
+            stored_batches = []
+
+            def report_batch(stats: Dict[str, Any]):
+                stored_batches.append(stats["batch"])
+                progress.update(task, advance=stats["size"])
+                progress.console.print(
+                    f"   Batch {stats['batch'] + 1}: {stats['size']} courses "
+                    f"(embed {stats['embed_seconds']:.2f}s, write {stats['write_seconds']:.2f}s, "
+                    f"{stats['courses_per_sec']:.1f} courses/sec)"
+                )
+
+            start = time.perf_counter()
+            stored_ids = await self.course_manager.store_courses(
+                courses,
+                batch_size=batch_size,
+                max_concurrency=max_concurrency,
+                on_batch=report_batch,
+            )
+            elapsed = time.perf_counter() - start
 
-            for course_data in courses_data:
-                try:
-                    course = self._dict_to_course(course_data)
-                    await self.course_manager.store_course(course)
-                    ingested_count += 1
-                    progress.update(task, advance=1)
-                except Exception as e:
-                    console.print(
-                        f"[red]❌ Failed to ingest course {course_data.get('course_code', 'unknown')}: {e}[/red]"
-                    )
-                    
             # Ensure progress bar completes to 100% and give it time to render
             progress.update(task, completed=len(courses_data))
             progress.refresh()
             await asyncio.sleep(0.5)
 
-        return ingested_count
+        if stored_ids:
+            console.print(
+                f"[blue]⚡ {len(stored_ids) / max(elapsed, 1e-9):.1f} courses/sec overall[/blue]"
+            )
+
+        # Batches that failed to embed or write never report stats
+        total_batches = -(-len(courses) // batch_size)
+        failed_batches = total_batches - len(stored_batches)
+        if failed_batches:
+            console.print(
+                f"[red]❌ {failed_batches}/{total_batches} batches failed "
+                f"({len(courses) - len(stored_ids)} courses not stored)[/red]"
+            )
+
+        return len(stored_ids)
 
     def ingest_majors(self, majors_data: List[Dict[str, Any]]) -> int:
         """Ingest majors into Redis."""
@@ -190,6 +228,10 @@ class CourseIngestionPipeline:
             self.redis_client.delete(*course_keys)
             console.print(f"   Cleared {len(course_keys)} course records")
 
+        # Clear prerequisite edges, so removed or renamed courses leave no stale edges
+        if self.redis_client.delete(self.course_manager.prerequisite_graph_key):
+            console.print("   Cleared prerequisite graph")
+
         # Clear major data
         major_keys = self.redis_client.keys("major:*")
         if major_keys:
@@ -208,7 +250,13 @@ class CourseIngestionPipeline:
 
         return {"courses": course_count, "majors": major_count}
 
-    async def run_ingestion(self, catalog_file: str, clear_existing: bool = False):
+    async def run_ingestion(
+        self,
+        catalog_file: str,
+        clear_existing: bool = False,
+        batch_size: int = 64,
+        max_concurrency: int = 4,
+    ):
         """Run the complete ingestion pipeline."""
         console.print("[bold blue]🚀 Starting Course Catalog Ingestion[/bold blue]")
 
@@ -238,17 +286,43 @@ class CourseIngestionPipeline:
             console.print(f"[green]✅ Ingested {major_count} majors[/green]")
 
         # Ingest courses
+        failed_count = 0
         courses_data = catalog_data.get("courses", [])
         if courses_data:
-            course_count = await self.ingest_courses(courses_data)
+            course_count = await self.ingest_courses(
+                courses_data, batch_size=batch_size, max_concurrency=max_concurrency
+            )
             console.print(f"[green]✅ Ingested {course_count} courses[/green]")
 
+            failed_count = len(courses_data) - course_count
+            if failed_count:
+                # Caches must not be pinned to a partially ingested catalog
+                console.print(
+                    f"[red]❌ {failed_count} courses failed to ingest, "
+                    f"catalog version not published[/red]"
+                )
+            else:
+                # Bump the catalog version so caches of course-derived data move on
+                manifest = self.manifest.publish(
+                    courses_data, count=course_count, source=catalog_file
+                )
+                console.print(
+                    f"[blue]🏷️  Catalog version {manifest.get('version')} "
+                    f"({manifest.get('content_hash', '')[:12]})[/blue]"
+                )
+
         # Verify ingestion
         verification = self.verify_ingestion()
         console.print(
             f"[blue]📊 Verification - Courses: {verification['courses']}, Majors: {verification['majors']}[/blue]"
         )
 
+        if failed_count:
+            console.print(
+                f"[bold red]❌ Ingestion incomplete: {failed_count} courses failed[/bold red]"
+            )
+            return False
+
         console.print("[bold green]🎉 Ingestion completed successfully![/bold green]")
         return True
 
@@ -264,7 +338,26 @@ class CourseIngestionPipeline:
     default="course_catalog",
     help="Redis index name (default: course_catalog)",
 )
-def main(catalog: str, clear: bool, redis_url: str, index_name: str):
+@click.option(
+    "--batch-size",
+    default=64,
+    show_default=True,
+    help="Courses per embedding request and Redis pipeline",
+)
+@click.option(
+    "--concurrency",
+    default=4,
+    show_default=True,
+    help="Maximum number of embedding batches in flight",
+)
+def main(
+    catalog: str,
+    clear: bool,
+    redis_url: str,
+    index_name: str,
+    batch_size: int,
+    concurrency: int,
+):
     """Ingest course catalog data into Redis for the Class Agent."""
 
     # Set Redis URL if provided
@@ -292,7 +385,11 @@ def main(catalog: str, clear: bool, redis_url: str, index_name: str):
     pipeline = CourseIngestionPipeline(config=config)
 
     try:
-        success = asyncio.run(pipeline.run_ingestion(catalog, clear))
+        success = asyncio.run(
+            pipeline.run_ingestion(
+                catalog, clear, batch_size=batch_size, max_concurrency=concurrency
+            )
+        )
         if not success:
             sys.exit(1)
     except KeyboardInterrupt:
@@ -17,6 +17,7 @@ Usage:
 
 import asyncio
 import json
+import time
 import click
 from pathlib import Path
 from datetime import datetime
@@ -30,6 +31,7 @@ from redis_context_course.hierarchical_models import (
     CourseDetails,
     HierarchicalCourse,
 )
+from redis_context_course.catalog_manifest import CatalogManifest
 from redis_context_course.hierarchical_manager import HierarchicalCourseManager
 from redis_context_course.redis_config import redis_config
 
@@ -62,7 +64,12 @@ def clear_existing_data(summary_index: str, details_prefix: str):
     return len(summary_keys), len(detail_keys)
 
 
-async def load_courses_from_json(json_file: Path, manager: HierarchicalCourseManager):
+async def load_courses_from_json(
+    json_file: Path,
+    manager: HierarchicalCourseManager,
+    batch_size: int = 100,
+    max_concurrency: int = 4,
+):
     """Load courses from JSON file into Redis."""
     
     print(f"📖 Loading courses from {json_file}...")
@@ -73,7 +80,7 @@ async def load_courses_from_json(json_file: Path, manager: HierarchicalCourseMan
     courses_data = data.get("courses", [])
     print(f"Found {len(courses_data)} courses in file")
     
-    loaded = 0
+    courses = []
     failed = 0
     
     for course_data in courses_data:
@@ -82,29 +89,51 @@ async def load_courses_from_json(json_file: Path, manager: HierarchicalCourseMan
             summary = CourseSummary(**course_data["summary"])
             details = CourseDetails(**course_data["details"])
             
-            course = HierarchicalCourse(
-                id=course_data["id"],
-                summary=summary,
-                details=details,
-                created_at=datetime.fromisoformat(course_data["created_at"]),
+            courses.append(
+                HierarchicalCourse(
+                    id=course_data["id"],
+                    summary=summary,
+                    details=details,
+                    created_at=datetime.fromisoformat(course_data["created_at"]),
+                )
             )
-            
-            # Add to Redis
-            success = await manager.add_course(course)
-            if success:
-                loaded += 1
-                if loaded % 10 == 0:
-                    print(f"  Loaded {loaded}/{len(courses_data)} courses...")
-            else:
-                failed += 1
                 
         except Exception as e:
             print(f"  ❌ Error loading course: {e}")
             failed += 1
     
+    def report_batch(stats):
+        print(
+            f"  Batch {stats['batch'] + 1}: {stats['size']} courses "
+            f"(embed {stats['embed_seconds']:.2f}s, write {stats['write_seconds']:.2f}s, "
+            f"{stats['courses_per_sec']:.1f} courses/sec)"
+        )
+    
+    # Embed in batches through the shared embedding cache and pipeline the writes
+    start = time.perf_counter()
+    loaded = await manager.add_courses(
+        courses,
+        batch_size=batch_size,
+        max_concurrency=max_concurrency,
+        on_batch=report_batch,
+    )
+    elapsed = time.perf_counter() - start
+    failed += len(courses) - loaded
+    
     print(f"\n✅ Loading complete!")
     print(f"   Loaded: {loaded}")
     print(f"   Failed: {failed}")
+    print(f"   ⚡ {loaded / max(elapsed, 1e-9):.1f} courses/sec ({elapsed:.2f}s)")
+    
+    if failed:
+        # Caches must not be pinned to a partially loaded catalog
+        print(f"   ⚠️  {failed} courses failed, catalog version not published")
+    elif loaded > 0:
+        # Bump the summary index's catalog version so caches of its data move on
+        manifest = CatalogManifest(
+            manager.redis, index_name=manager.summary_index_name
+        ).publish(courses_data, count=loaded, source=str(json_file))
+        print(f"   🏷️  Catalog version: {manifest.get('version')}")
     
     return loaded, failed
 
@@ -136,7 +165,34 @@ async def load_courses_from_json(json_file: Path, manager: HierarchicalCourseMan
     default=False,
     help='Clear existing data before loading (force reload)'
 )
-def main(input_file: str, summary_index: str, details_prefix: str, force: bool):
+@click.option(
+    '--details-storage',
+    type=click.Choice(['string', 'json']),
+    default='string',
+    show_default=True,
+    help='Store details as JSON strings or as RedisJSON documents (section-addressable)'
+)
+@click.option(
+    '--batch-size',
+    default=100,
+    show_default=True,
+    help='Courses per embedding request and Redis pipeline'
+)
+@click.option(
+    '--concurrency',
+    default=4,
+    show_default=True,
+    help='Maximum number of embedding batches in flight'
+)
+def main(
+    input_file: str,
+    summary_index: str,
+    details_prefix: str,
+    force: bool,
+    details_storage: str,
+    batch_size: int,
+    concurrency: int,
+):
     """Load hierarchical courses into Redis.
 
     By default, appends to existing data. Use --force to clear existing
@@ -155,6 +211,7 @@ def main(input_file: str, summary_index: str, details_prefix: str, force: bool):
     manager = HierarchicalCourseManager(
         summary_index_name=summary_index,
         details_prefix=details_prefix,
+        details_storage=details_storage,
     )
 
     # Ensure index is created before loading data
@@ -162,12 +219,16 @@ def main(input_file: str, summary_index: str, details_prefix: str, force: bool):
 
     # Load courses
     input_path = Path(input_file)
-    loaded, failed = asyncio.run(load_courses_from_json(input_path, manager))
+    loaded, failed = asyncio.run(
+        load_courses_from_json(
+            input_path, manager, batch_size=batch_size, max_concurrency=concurrency
+        )
+    )
 
     if loaded > 0:
         print(f"\n📊 Redis Storage:")
         print(f"   Summary index: {summary_index}")
-        print(f"   Details prefix: {details_prefix}")
+        print(f"   Details prefix: {details_prefix} ({details_storage})")
         print(f"\n💡 You can now use HierarchicalCourseManager to search courses!")
 
 
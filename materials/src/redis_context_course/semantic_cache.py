@@ -0,0 +1,145 @@
+"""
+Semantic answer cache for the agent stages.
+
+Questions such as "What are the prerequisites for CS002?" are asked again and
+again, in slightly different words. The stages store course search results in
+a RedisVL ``SemanticCache`` and look each new search query up by vector
+distance, so the agent's search for a paraphrase of an earlier query is
+answered from Redis without running course search.
+
+Prompts are embedded with the same (cached) embeddings model the course
+index uses, wrapped in a RedisVL ``CustomTextVectorizer``.
+
+Entries are tagged with the ingested catalog version (see catalog_manifest)
+and lookups filter on the current one, so answers about a previous catalog
+are never returned after re-ingestion; they expire by TTL.
+
+Usage:
+    from redis_context_course.semantic_cache import create_semantic_cache
+
+    cache = create_semantic_cache(distance_threshold=0.1, ttl=3600)
+    cache.store(prompt="What are the prerequisites for CS002?", response=answer)
+    hits = cache.check("Which courses do I need before CS002?", num_results=1)
+"""
+
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from langchain_core.embeddings import Embeddings
+from redis import Redis
+from redisvl.extensions.cache.llm import SemanticCache
+from redisvl.query.filter import FilterExpression, Tag
+from redisvl.utils.vectorize import CustomTextVectorizer
+
+from .catalog_manifest import CatalogManifest
+from .redis_config import RedisConfig, redis_config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_NAME = "course_qa_cache"
+# Cosine distance below which a cached prompt counts as the same question
+DEFAULT_DISTANCE_THRESHOLD = 0.1
+# Seconds before a cached answer expires (course data changes between terms)
+DEFAULT_TTL = 3600
+# Tag field holding the catalog version an entry was answered under
+CATALOG_VERSION_FIELD = "catalog_version"
+
+
+def embeddings_vectorizer(embeddings: Embeddings) -> CustomTextVectorizer:
+    """Wrap a LangChain embeddings model as a RedisVL vectorizer."""
+    return CustomTextVectorizer(
+        embed=embeddings.embed_query,
+        embed_many=embeddings.embed_documents,
+        aembed=embeddings.aembed_query,
+        aembed_many=embeddings.aembed_documents,
+    )
+
+
+class CatalogVersionedSemanticCache(SemanticCache):
+    """
+    SemanticCache whose entries are scoped to the current catalog version.
+
+    ``store`` tags every entry with the manifest version and ``check`` only
+    matches entries carrying it; callers use the plain SemanticCache API.
+    """
+
+    def __init__(self, *args, manifest: CatalogManifest, **kwargs):
+        filterable_fields = list(kwargs.pop("filterable_fields", None) or [])
+        filterable_fields.append({"name": CATALOG_VERSION_FIELD, "type": "tag"})
+        super().__init__(*args, filterable_fields=filterable_fields, **kwargs)
+        self.manifest = manifest
+
+    def _scope(self, filter_expression: Optional[FilterExpression]) -> FilterExpression:
+        version_filter = Tag(CATALOG_VERSION_FIELD) == self.manifest.version
+        return version_filter if filter_expression is None else version_filter & filter_expression
+
+    def _tag(self, filters: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        return {**(filters or {}), CATALOG_VERSION_FIELD: self.manifest.version}
+
+    def check(self, *args, filter_expression=None, **kwargs) -> List[Dict[str, Any]]:
+        return super().check(*args, filter_expression=self._scope(filter_expression), **kwargs)
+
+    async def acheck(self, *args, filter_expression=None, **kwargs) -> List[Dict[str, Any]]:
+        return await super().acheck(
+            *args, filter_expression=self._scope(filter_expression), **kwargs
+        )
+
+    def store(self, *args, filters=None, **kwargs) -> str:
+        return super().store(*args, filters=self._tag(filters), **kwargs)
+
+    async def astore(self, *args, filters=None, **kwargs) -> str:
+        return await super().astore(*args, filters=self._tag(filters), **kwargs)
+
+
+def create_semantic_cache(
+    name: Optional[str] = None,
+    distance_threshold: Optional[float] = None,
+    ttl: Optional[int] = None,
+    embeddings: Optional[Embeddings] = None,
+    redis_client: Optional[Redis] = None,
+    config: Optional[RedisConfig] = None,
+    manifest: Optional[CatalogManifest] = None,
+) -> SemanticCache:
+    """
+    Create (or connect to) the semantic answer cache.
+
+    Args:
+        name: Cache index name (defaults to env var SEMANTIC_CACHE_NAME or
+              "course_qa_cache")
+        distance_threshold: Maximum cosine distance for a hit (defaults to env
+              var SEMANTIC_CACHE_DISTANCE_THRESHOLD or 0.1)
+        ttl: Seconds before entries expire (defaults to env var
+              SEMANTIC_CACHE_TTL or 3600; 0 disables expiry)
+        embeddings: Embeddings model (uses the config's cached embeddings if None)
+        redis_client: Redis client (uses the config's shared pool if None)
+        config: RedisConfig to take defaults from (uses global redis_config if None)
+        manifest: Catalog manifest whose version scopes entries (reads the
+              default manifest on the same Redis if None)
+
+    Returns:
+        RedisVL SemanticCache scoped to the current catalog version
+    """
+    config = config or redis_config
+    redis_client = redis_client or config.redis_client
+    name = name or os.getenv("SEMANTIC_CACHE_NAME", DEFAULT_CACHE_NAME)
+    if distance_threshold is None:
+        distance_threshold = float(
+            os.getenv("SEMANTIC_CACHE_DISTANCE_THRESHOLD", DEFAULT_DISTANCE_THRESHOLD)
+        )
+    if ttl is None:
+        ttl = int(os.getenv("SEMANTIC_CACHE_TTL", DEFAULT_TTL))
+
+    cache = CatalogVersionedSemanticCache(
+        name=name,
+        distance_threshold=distance_threshold,
+        ttl=ttl or None,
+        vectorizer=embeddings_vectorizer(embeddings or config.embeddings),
+        redis_client=redis_client,
+        manifest=manifest or CatalogManifest(redis_client),
+    )
+    logger.info(
+        f"Semantic cache ready: {name} (distance threshold {distance_threshold}, "
+        f"ttl {ttl or 'none'})"
+    )
+    return cache
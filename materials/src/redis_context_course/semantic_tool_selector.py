@@ -11,22 +11,38 @@ Key Features:
 - Fallback strategies for ambiguous queries
 - Integration with existing tool system
 
+Tool descriptions and examples are embedded once, in a single batch, and kept
+as a normalized matrix (one row per description/example). Scoring a query is
+one matrix-vector product followed by a per-tool max. Embeddings go through
+the shared EmbeddingCache (redis_config.embedding_cache unless another cache
+is passed), so tool vectors survive restarts and are never re-embedded.
+
+For large tool catalogs, pass a RedisToolIndex: vectors then live in a shared
+RedisVL index and each query is a KNN search filtered by tool group and
+permission scope. Tools can carry their own routing information in
+``tool.metadata`` ("examples", "keywords", "group", "scope").
+
 Usage:
     from redis_context_course.semantic_tool_selector import SemanticToolSelector
 
-    selector = SemanticToolSelector(available_tools)
+    selector = SemanticToolSelector(available_tools, embedding_cache=cache)
     selected_tools = await selector.select_tools(user_query, max_tools=3)
+    per_query = await selector.select_tools_many(queries, max_tools=3)
 """
 
 import asyncio
 import logging
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
+from langchain_core.embeddings import Embeddings
 from langchain_core.tools import BaseTool
 from langchain_openai import OpenAIEmbeddings
-from sklearn.metrics.pairwise import cosine_similarity
+
+from .embedding_cache import CachedEmbeddings, EmbeddingCache
+from .redis_config import redis_config
+from .tool_index import RedisToolIndex, ToolDocument
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +56,16 @@ class ToolIntent:
     examples: List[str]
     keywords: List[str]
     embedding: Optional[np.ndarray] = None
+    example_embeddings: List[np.ndarray] = field(default_factory=list)
     confidence_threshold: float = 0.6
+    group: str = "default"
+    scope: str = "public"
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length so dot products are cosine similarities."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
 
 
 # EXPERIMENTAL: Not currently used in notebooks or progressive_agents but available for external use
@@ -52,23 +77,54 @@ class SemanticToolSelector:
     This replaces keyword-based tool selection with embedding-based matching,
     providing more accurate tool selection for complex queries.
 
+    A tool's similarity to a query is the maximum cosine similarity over its
+    description and each of its examples (not the description alone), so a
+    query phrased like one of the examples matches that tool strongly.
+
     Note: This class is experimental API surface. Notebooks implement their own
     inline version for educational purposes.
     """
 
     def __init__(
-        self, tools: List[BaseTool], embeddings_model: Optional[OpenAIEmbeddings] = None
+        self,
+        tools: List[BaseTool],
+        embeddings_model: Optional[Embeddings] = None,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        tool_index: Optional[RedisToolIndex] = None,
     ):
         """
         Initialize semantic tool selector.
 
         Args:
             tools: List of available tools
-            embeddings_model: OpenAI embeddings model (optional)
+            embeddings_model: Embeddings model (defaults to OpenAIEmbeddings)
+            embedding_cache: Cache so tool and query embeddings are reused
+                            across restarts (defaults to
+                            redis_config.embedding_cache unless the config
+                            disables embedding caching)
+            tool_index: Optional shared Redis index; tools are registered in it
+                        and selected by KNN instead of scoring every tool locally
         """
-        self.embeddings_model = embeddings_model or OpenAIEmbeddings()
+        embeddings_model = embeddings_model or OpenAIEmbeddings()
+        if embedding_cache is None and redis_config.use_embedding_cache:
+            embedding_cache = redis_config.embedding_cache
+        if embedding_cache is not None and not isinstance(embeddings_model, CachedEmbeddings):
+            embeddings_model = CachedEmbeddings(embeddings_model, embedding_cache)
+        self.embeddings_model = embeddings_model
+        self.tool_index = tool_index
         self.tool_intents: List[ToolIntent] = []
+        self._by_name: Dict[str, int] = {}
+
+        # Scoring state built by _build_matrices
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._row_starts = np.zeros(0, dtype=np.intp)
+        self._scored: List[ToolIntent] = []
+        self._scored_rows = np.zeros(0, dtype=np.intp)
+        self._keywords: List[str] = []
+        self._keyword_matrix = np.zeros((0, 0), dtype=np.float32)
+
         self._initialize_tool_intents(tools)
+        self._build_matrices()
 
     def _initialize_tool_intents(self, tools: List[BaseTool]):
         """Initialize tool intents with semantic information."""
@@ -170,38 +226,221 @@ class SemanticToolSelector:
             },
         }
 
-        # Create tool intents with embeddings
+        # Collect tool intents, then embed every description and example in
+        # one batch
+        texts: List[str] = []
         for tool in tools:
             tool_name = tool.name
-            if tool_name in tool_semantics:
-                semantics = tool_semantics[tool_name]
+            metadata = tool.metadata or {}
+            semantics = dict(tool_semantics.get(tool_name, {}))
+            # Routing info attached to the tool itself takes precedence
+            for key in ("examples", "keywords"):
+                if key in metadata:
+                    semantics[key] = list(metadata[key])
+            if "examples" not in semantics:
+                logger.warning(f"No semantic information defined for tool: {tool_name}")
+                continue
+
+            description = semantics.get("description") or tool.description
+            tool_intent = ToolIntent(
+                tool=tool,
+                description=description,
+                examples=semantics["examples"],
+                keywords=semantics.get("keywords", []),
+                group=metadata.get("group", "default"),
+                scope=metadata.get("scope", "public"),
+            )
+            self._by_name[tool_name] = len(self.tool_intents)
+            self.tool_intents.append(tool_intent)
+            # Create semantic text for embedding
+            texts.append(self._semantic_text(tool_intent))
+            texts.extend(tool_intent.examples)
+
+        if self.tool_index is not None:
+            # Vectors live in the shared index; only new or edited texts are embedded
+            try:
+                self.tool_index.upsert(
+                    [
+                        ToolDocument(
+                            name=ti.tool.name,
+                            texts=[self._semantic_text(ti), *ti.examples],
+                            group=ti.group,
+                            scope=ti.scope,
+                        )
+                        for ti in self.tool_intents
+                    ],
+                    self.embeddings_model,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to register tools in {self.tool_index.index_name}: {e}")
+            return
 
-                # Create semantic text for embedding
-                semantic_text = f"{semantics['description']}. Examples: {' '.join(semantics['examples'])}"
+        if not texts:
+            return
+        try:
+            vectors = _normalize(
+                np.asarray(self.embeddings_model.embed_documents(texts), dtype=np.float32)
+            )
+        except Exception as e:
+            logger.warning(f"Failed to generate tool embeddings: {e}")
+            return
+
+        row = 0
+        for tool_intent in self.tool_intents:
+            tool_intent.embedding = vectors[row]
+            tool_intent.example_embeddings = list(
+                vectors[row + 1 : row + 1 + len(tool_intent.examples)]
+            )
+            row += 1 + len(tool_intent.examples)
+
+    @staticmethod
+    def _semantic_text(tool_intent: ToolIntent) -> str:
+        return f"{tool_intent.description}. Examples: {' '.join(tool_intent.examples)}"
+
+    def _build_matrices(self):
+        """Stack tool vectors and keywords into matrices used for scoring."""
+        scored_rows = [
+            i for i, ti in enumerate(self.tool_intents) if ti.embedding is not None
+        ]
+        self._scored = [self.tool_intents[i] for i in scored_rows]
+        self._scored_rows = np.asarray(scored_rows, dtype=np.intp)
+        rows, starts = [], []
+        for tool_intent in self._scored:
+            starts.append(len(rows))
+            rows.append(tool_intent.embedding)
+            rows.extend(tool_intent.example_embeddings)
+        if rows:
+            self._matrix = np.vstack(rows).astype(np.float32)
+            self._row_starts = np.asarray(starts, dtype=np.intp)
+
+        # Keyword incidence (tools x unique keywords) for the keyword boost
+        self._keywords = list(
+            dict.fromkeys(kw for ti in self.tool_intents for kw in ti.keywords)
+        )
+        column = {kw: i for i, kw in enumerate(self._keywords)}
+        self._keyword_matrix = np.zeros(
+            (len(self.tool_intents), len(self._keywords)), dtype=np.float32
+        )
+        for i, tool_intent in enumerate(self.tool_intents):
+            for kw in tool_intent.keywords:
+                self._keyword_matrix[i, column[kw]] = 1.0
+
+    def _similarities(self, query_vectors: np.ndarray) -> np.ndarray:
+        """
+        Cosine similarity of each query to each tool (queries x scored tools).
+
+        A tool's similarity is its best match among its description and
+        examples.
+        """
+        scores = _normalize(query_vectors.astype(np.float32)) @ self._matrix.T
+        return np.maximum.reduceat(scores, self._row_starts, axis=1)
+
+    def _keyword_hits(self, queries: Sequence[str]) -> np.ndarray:
+        """Keyword matches per query and tool (queries x all tools)."""
+        present = np.asarray(
+            [[kw in query.lower() for kw in self._keywords] for query in queries],
+            dtype=np.float32,
+        ).reshape(len(queries), len(self._keywords))
+        return present @ self._keyword_matrix.T
+
+    async def _rank(
+        self,
+        queries: Sequence[str],
+        max_tools: int,
+        groups: Optional[List[str]] = None,
+        scopes: Optional[List[str]] = None,
+    ) -> List[List[Tuple[ToolIntent, float, float]]]:
+        """
+        Rank candidate tools for each query.
 
-                # Generate embedding
-                try:
-                    embedding = np.array(
-                        self.embeddings_model.embed_query(semantic_text)
+        Returns:
+            Per query, (tool intent, similarity, final score) best first.
+            Final score adds a keyword boost of 0.1 per keyword (max 0.3).
+        """
+        query_vectors = np.asarray(
+            await self.embeddings_model.aembed_documents(list(queries)),
+            dtype=np.float32,
+        )
+        boost = np.minimum(self._keyword_hits(queries) * 0.1, 0.3)
+
+        if self.tool_index is not None:
+            # RedisVL search is blocking: run the KNN queries in worker threads,
+            # fetching extra candidates so the keyword boost can re-rank them
+            hits_per_query = await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        self.tool_index.search,
+                        vector,
+                        k=max_tools * 3,
+                        groups=groups,
+                        scopes=scopes,
                     )
-                except Exception as e:
-                    logger.warning(f"Failed to generate embedding for {tool_name}: {e}")
-                    embedding = None
-
-                tool_intent = ToolIntent(
-                    tool=tool,
-                    description=semantics["description"],
-                    examples=semantics["examples"],
-                    keywords=semantics["keywords"],
-                    embedding=embedding,
+                    for vector in query_vectors
                 )
-
-                self.tool_intents.append(tool_intent)
-            else:
-                logger.warning(f"No semantic information defined for tool: {tool_name}")
+            )
+            ranked = []
+            for row, hits in enumerate(hits_per_query):
+                candidates = [
+                    (
+                        self.tool_intents[self._by_name[name]],
+                        similarity,
+                        similarity + float(boost[row, self._by_name[name]]),
+                    )
+                    for name, similarity in hits
+                    if name in self._by_name
+                ]
+                ranked.append(sorted(candidates, key=lambda c: c[2], reverse=True))
+            return ranked
+
+        if not self._scored:
+            raise ValueError("no tool embeddings available")
+        similarity = self._similarities(query_vectors)
+        final = similarity + boost[:, self._scored_rows]
+        allowed = [
+            (not groups or ti.group in groups) and (not scopes or ti.scope in scopes)
+            for ti in self._scored
+        ]
+        ranked = []
+        for row in range(len(queries)):
+            order = np.argsort(-final[row], kind="stable")
+            ranked.append(
+                [
+                    (self._scored[i], float(similarity[row, i]), float(final[row, i]))
+                    for i in order
+                    if allowed[i]
+                ]
+            )
+        return ranked
+
+    def _select(
+        self,
+        query: str,
+        ranked: List[Tuple[ToolIntent, float, float]],
+        max_tools: int,
+        min_confidence: float,
+    ) -> List[BaseTool]:
+        selected_tools = [
+            tool_intent.tool
+            for tool_intent, similarity, _ in ranked
+            if similarity >= min_confidence
+        ][:max_tools]
+
+        # Log selection for debugging
+        logger.info(f"Selected {len(selected_tools)} tools for query: '{query[:50]}...'")
+        for tool_intent, similarity, score in ranked[:max_tools]:
+            logger.debug(
+                f"  {tool_intent.tool.name}: similarity={similarity:.3f}, "
+                f"final_score={score:.3f}"
+            )
+        return selected_tools
 
     async def select_tools(
-        self, query: str, max_tools: int = 3, min_confidence: float = 0.5
+        self,
+        query: str,
+        max_tools: int = 3,
+        min_confidence: float = 0.5,
+        groups: Optional[List[str]] = None,
+        scopes: Optional[List[str]] = None,
     ) -> List[BaseTool]:
         """
         Select most relevant tools for a query using semantic similarity.
@@ -210,76 +449,80 @@ class SemanticToolSelector:
             query: User's query
             max_tools: Maximum number of tools to return
             min_confidence: Minimum confidence threshold
+            groups: Only consider tools in these groups
+            scopes: Only consider tools whose permission scope is listed
 
         Returns:
             List of selected tools ordered by relevance
         """
-        if not query.strip():
-            return []
+        (selected,) = await self.select_tools_many(
+            [query], max_tools, min_confidence, groups=groups, scopes=scopes
+        )
+        return selected
+
+    async def select_tools_many(
+        self,
+        queries: List[str],
+        max_tools: int = 3,
+        min_confidence: float = 0.5,
+        groups: Optional[List[str]] = None,
+        scopes: Optional[List[str]] = None,
+    ) -> List[List[BaseTool]]:
+        """
+        Select tools for many queries with one embedding request.
 
-        try:
-            # Get query embedding
-            query_embedding = np.array(self.embeddings_model.embed_query(query))
-
-            # Calculate similarities
-            tool_scores = []
-            for tool_intent in self.tool_intents:
-                if tool_intent.embedding is not None:
-                    similarity = cosine_similarity(
-                        query_embedding.reshape(1, -1),
-                        tool_intent.embedding.reshape(1, -1),
-                    )[0][0]
-
-                    # Boost score if keywords match
-                    keyword_boost = self._calculate_keyword_boost(
-                        query, tool_intent.keywords
-                    )
-                    final_score = similarity + keyword_boost
+        Locally all queries are scored with one matmul; with a tool index
+        each query is one filtered KNN search.
 
-                    tool_scores.append((tool_intent.tool, final_score, similarity))
+        Args:
+            queries: User queries
+            max_tools: Maximum number of tools per query
+            min_confidence: Minimum confidence threshold
+            groups: Only consider tools in these groups
+            scopes: Only consider tools whose permission scope is listed
 
-            # Sort by score and filter by confidence
-            tool_scores.sort(key=lambda x: x[1], reverse=True)
-            selected_tools = [
-                tool
-                for tool, score, similarity in tool_scores
-                if similarity >= min_confidence
-            ][:max_tools]
+        Returns:
+            Selected tools for each query, in input order
+        """
+        results: List[List[BaseTool]] = [[] for _ in queries]
+        active = [i for i, query in enumerate(queries) if query.strip()]
+        if not active:
+            return results
 
-            # Log selection for debugging
-            logger.info(
-                f"Selected {len(selected_tools)} tools for query: '{query[:50]}...'"
+        try:
+            ranked = await self._rank(
+                [queries[i] for i in active], max_tools, groups, scopes
             )
-            for tool, score, similarity in tool_scores[:max_tools]:
-                logger.debug(
-                    f"  {tool.name}: similarity={similarity:.3f}, final_score={score:.3f}"
+            for row, i in enumerate(active):
+                results[i] = self._select(
+                    queries[i], ranked[row], max_tools, min_confidence
                 )
-
-            return selected_tools
-
         except Exception as e:
             logger.error(f"Error in semantic tool selection: {e}")
             # Fallback to keyword-based selection
-            return self._fallback_keyword_selection(query, max_tools)
-
-    def _calculate_keyword_boost(self, query: str, keywords: List[str]) -> float:
-        """Calculate boost score based on keyword matches."""
-        query_lower = query.lower()
-        matches = sum(1 for keyword in keywords if keyword in query_lower)
-        return min(matches * 0.1, 0.3)  # Max boost of 0.3
-
-    def _fallback_keyword_selection(self, query: str, max_tools: int) -> List[BaseTool]:
+            for i in active:
+                results[i] = self._fallback_keyword_selection(
+                    queries[i], max_tools, groups, scopes
+                )
+        return results
+
+    def _fallback_keyword_selection(
+        self,
+        query: str,
+        max_tools: int,
+        groups: Optional[List[str]] = None,
+        scopes: Optional[List[str]] = None,
+    ) -> List[BaseTool]:
         """Fallback to simple keyword-based selection."""
-        query_lower = query.lower()
-        scored_tools = []
-
-        for tool_intent in self.tool_intents:
-            score = sum(1 for keyword in tool_intent.keywords if keyword in query_lower)
-            if score > 0:
-                scored_tools.append((tool_intent.tool, score))
-
-        scored_tools.sort(key=lambda x: x[1], reverse=True)
-        return [tool for tool, _ in scored_tools[:max_tools]]
+        scores = self._keyword_hits([query])[0]
+        order = np.argsort(-scores, kind="stable")
+        return [
+            self.tool_intents[i].tool
+            for i in order
+            if scores[i] > 0
+            and (not groups or self.tool_intents[i].group in groups)
+            and (not scopes or self.tool_intents[i].scope in scopes)
+        ][:max_tools]
 
     async def explain_selection(self, query: str, max_tools: int = 3) -> Dict[str, Any]:
         """
@@ -293,29 +536,23 @@ class SemanticToolSelector:
             Dictionary with selection explanation
         """
         try:
-            query_embedding = np.array(self.embeddings_model.embed_query(query))
+            (ranked,) = await self._rank([query], max_tools)
 
             explanations = []
-            for tool_intent in self.tool_intents:
-                if tool_intent.embedding is not None:
-                    similarity = cosine_similarity(
-                        query_embedding.reshape(1, -1),
-                        tool_intent.embedding.reshape(1, -1),
-                    )[0][0]
-
-                    keyword_matches = [
-                        kw for kw in tool_intent.keywords if kw in query.lower()
-                    ]
-
-                    explanations.append(
-                        {
-                            "tool_name": tool_intent.tool.name,
-                            "similarity_score": float(similarity),
-                            "keyword_matches": keyword_matches,
-                            "description": tool_intent.description,
-                            "selected": similarity >= 0.5,
-                        }
-                    )
+            for tool_intent, similarity, _ in ranked:
+                keyword_matches = [
+                    kw for kw in tool_intent.keywords if kw in query.lower()
+                ]
+
+                explanations.append(
+                    {
+                        "tool_name": tool_intent.tool.name,
+                        "similarity_score": similarity,
+                        "keyword_matches": keyword_matches,
+                        "description": tool_intent.description,
+                        "selected": similarity >= 0.5,
+                    }
+                )
 
             explanations.sort(key=lambda x: x["similarity_score"], reverse=True)
 
@@ -332,6 +569,7 @@ class SemanticToolSelector:
     def get_tool_coverage(self) -> Dict[str, Any]:
         """Get information about tool coverage and semantic setup."""
         return {
+            "backend": "redis" if self.tool_index is not None else "local",
             "total_tools": len(self.tool_intents),
             "tools_with_embeddings": sum(
                 1 for ti in self.tool_intents if ti.embedding is not None
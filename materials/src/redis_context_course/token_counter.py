@@ -0,0 +1,189 @@
+"""
+Shared, memoized token counting.
+
+Looking up a tiktoken encoding is far more expensive than encoding a short
+string, and the same strings (system prompts, tool descriptions, rendered
+course fragments) are counted over and over. ``TokenCounter`` keeps:
+
+- one encoding per model for the whole process
+- a bounded LRU of counts for repeated strings
+- a shared thread pool for batch counting (tiktoken releases the GIL while
+  encoding, so large batches scale across cores)
+
+Usage:
+    from redis_context_course.token_counter import get_token_counter
+
+    counter = get_token_counter("gpt-4o")
+    counter.count(system_prompt)
+    counter.count_many([tool.description for tool in tools])
+    counter.count(assembled_context, memoize=False)
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Dict, List, Optional, Sequence, Union
+
+import tiktoken
+
+
+@lru_cache(maxsize=None)
+def get_encoding(model: str) -> tiktoken.Encoding:
+    """Process-wide tiktoken encoding for a model (cl100k_base if unknown)."""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor(num_threads: int) -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=num_threads, thread_name_prefix="token-counter"
+            )
+        return _executor
+
+
+class TokenCounter:
+    """
+    Exact token counts for one model, memoized per distinct string.
+
+    Strings longer than ``max_memo_length`` are counted but not memoized, so
+    one-off text (assembled contexts, conversation transcripts) does not push
+    reusable entries out of the cache.
+    """
+
+    def __init__(
+        self,
+        model: str = "gpt-4o",
+        max_entries: int = 10_000,
+        max_memo_length: int = 16_384,
+        num_threads: int = 4,
+        min_parallel_batch: int = 64,
+    ):
+        """
+        Initialize the counter.
+
+        Args:
+            model: Model whose tokenizer to use
+            max_entries: Maximum memoized strings (least recently used are evicted)
+            max_memo_length: Longest string (in characters) that is memoized
+            num_threads: Worker threads for batch counting
+            min_parallel_batch: Smallest batch of uncached strings counted in
+                      parallel (smaller batches are counted inline)
+        """
+        self.model = model
+        self.max_entries = max_entries
+        self.max_memo_length = max_memo_length
+        self.num_threads = num_threads
+        self.min_parallel_batch = min_parallel_batch
+        self._encode = partial(get_encoding(model).encode, disallowed_special=())
+        self._counts: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def count(self, text: str, memoize: bool = True) -> int:
+        """Exact token count of ``text``."""
+        memoize = memoize and len(text) <= self.max_memo_length
+        if memoize:
+            with self._lock:
+                count = self._counts.get(text)
+                if count is not None:
+                    self._counts.move_to_end(text)
+                    self.hits += 1
+                    return count
+
+        count = len(self._encode(text))
+        if memoize:
+            self._store({text: count})
+        return count
+
+    def count_many(self, texts: Sequence[str], memoize: bool = True) -> List[int]:
+        """
+        Exact token counts for many strings.
+
+        Memoized strings are answered from the cache; the rest are encoded
+        once each (duplicates included), in parallel for large batches.
+        """
+        found: Dict[str, int] = {}
+        if memoize:
+            with self._lock:
+                for text in texts:
+                    count = self._counts.get(text)
+                    if count is not None:
+                        self._counts.move_to_end(text)
+                        found[text] = count
+                self.hits += sum(1 for text in texts if text in found)
+
+        missing = list(dict.fromkeys(text for text in texts if text not in found))
+        if len(missing) >= self.min_parallel_batch:
+            # Same work as Encoding.encode_batch, on a shared pool instead of
+            # creating one per call; one task per chunk keeps overhead low
+            size = -(-len(missing) // self.num_threads)
+            chunks = [missing[i : i + size] for i in range(0, len(missing), size)]
+            counts = [
+                count
+                for chunk_counts in _get_executor(self.num_threads).map(
+                    self._count_chunk, chunks
+                )
+                for count in chunk_counts
+            ]
+        else:
+            counts = self._count_chunk(missing)
+
+        computed = dict(zip(missing, counts))
+        if memoize:
+            self._store(
+                {t: c for t, c in computed.items() if len(t) <= self.max_memo_length}
+            )
+        found.update(computed)
+        return [found[text] for text in texts]
+
+    def _count_chunk(self, texts: List[str]) -> List[int]:
+        return [len(self._encode(text)) for text in texts]
+
+    def _store(self, counts: Dict[str, int]):
+        if not counts:
+            return
+        with self._lock:
+            self.misses += len(counts)
+            self._counts.update(counts)
+            while len(self._counts) > self.max_entries:
+                self._counts.popitem(last=False)
+
+    def clear(self):
+        """Drop memoized counts."""
+        with self._lock:
+            self._counts.clear()
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Memo hit/miss counters for this process."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._counts),
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+_counters: Dict[str, TokenCounter] = {}
+_counters_lock = threading.Lock()
+
+
+def get_token_counter(model: str = "gpt-4o") -> TokenCounter:
+    """Return the process-wide TokenCounter for ``model``."""
+    with _counters_lock:
+        counter = _counters.get(model)
+        if counter is None:
+            counter = _counters[model] = TokenCounter(model)
+        return counter
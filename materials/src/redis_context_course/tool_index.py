@@ -0,0 +1,264 @@
+"""
+Redis-backed tool routing index.
+
+Scoring every registered tool in Python is fine for a handful of tools but not
+for hundreds of tools and tool variants. ``RedisToolIndex`` stores one vector
+per tool description and per example in a RedisVL HNSW index, tagged with the
+tool name, tool group and required permission scope. Routing a query is then
+a KNN search with tag filters, and every process in a deployment shares the
+same index.
+
+Rows are keyed by tool name and position and carry a hash of their text, so
+re-registering unchanged tools embeds nothing; only new or edited
+descriptions/examples are sent to the embeddings model.
+
+Usage:
+    from redis_context_course.tool_index import RedisToolIndex, ToolDocument
+
+    index = RedisToolIndex(redis_client)
+    index.upsert(
+        [ToolDocument("search_courses", ["Find courses ...", "Show me ML courses"])],
+        embeddings_model,
+    )
+    index.search(query_vector, k=3, groups=["courses"], scopes=["public"])
+"""
+
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+from redis import Redis
+from redisvl.index import SearchIndex
+from redisvl.query import VectorQuery
+from redisvl.query.filter import Tag
+
+from .redis_config import RedisConfig, redis_config
+
+logger = logging.getLogger(__name__)
+
+
+def _decode(value: Optional[Union[str, bytes]]) -> Optional[str]:
+    """Normalize replies from clients with or without decode_responses."""
+    return value.decode() if isinstance(value, bytes) else value
+
+
+@dataclass
+class ToolDocument:
+    """Routing entry for one tool."""
+
+    name: str
+    # Description text first, then examples; each becomes one vector
+    texts: List[str]
+    group: str = "default"
+    # Permission scope a caller needs for the tool to be routable
+    scope: str = "public"
+
+
+class RedisToolIndex:
+    """
+    Shared KNN index over tool description and example vectors.
+
+    Each row is a hash ``{index_name}:{tool}:{position}``. A side hash
+    (outside the index prefix) records how many rows each tool has, so
+    shrinking a tool's examples removes the stale rows.
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[Redis] = None,
+        index_name: str = "tool_routing",
+        dims: int = 1536,
+        config: Optional[RedisConfig] = None,
+    ):
+        """
+        Initialize the tool index.
+
+        Args:
+            redis_client: Redis client (uses default if None)
+            index_name: Name of the vector index (also the key prefix)
+            dims: Embedding dimensions of the model used with the index
+            config: RedisConfig whose shared connection pool to use
+                (uses global redis_config if None)
+        """
+        self.redis = redis_client or (config or redis_config).redis_client
+        self.index_name = index_name
+        self.dims = dims
+        self.rows_key = f"{index_name}_rows"
+        self._index: Optional[SearchIndex] = None
+
+    def _get_index(self) -> SearchIndex:
+        """Get or create the routing index."""
+        if self._index is None:
+            schema = {
+                "index": {
+                    "name": self.index_name,
+                    "prefix": f"{self.index_name}:",
+                    "storage_type": "hash",
+                },
+                "fields": [
+                    {"name": "tool_name", "type": "tag"},
+                    {"name": "group", "type": "tag"},
+                    {"name": "scope", "type": "tag"},
+                    {"name": "text", "type": "text"},
+                    {
+                        "name": "embedding",
+                        "type": "vector",
+                        "attrs": {
+                            "dims": self.dims,
+                            "algorithm": "hnsw",
+                            "distance_metric": "cosine",
+                        },
+                    },
+                ],
+            }
+            self._index = SearchIndex.from_dict(schema, redis_client=self.redis)
+
+            # Create index if it doesn't exist
+            try:
+                self._index.create(overwrite=False)
+                logger.info(f"Created tool routing index: {self.index_name}")
+            except Exception as e:
+                if "Index already exists" not in str(e):
+                    logger.warning(f"Index creation note: {e}")
+
+        return self._index
+
+    def _row_key(self, tool_name: str, position: int) -> str:
+        return f"{self.index_name}:{tool_name}:{position}"
+
+    @staticmethod
+    def _text_hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def upsert(self, documents: Sequence[ToolDocument], embeddings_model: Embeddings) -> int:
+        """
+        Register or update tools.
+
+        Only texts that are new or changed are embedded (in one batch); tags
+        of unchanged rows are refreshed in place.
+
+        Returns:
+            Number of texts that were embedded
+        """
+        self._get_index()
+        rows = [
+            (doc, position, text)
+            for doc in documents
+            for position, text in enumerate(doc.texts)
+        ]
+        if not rows:
+            return 0
+
+        pipe = self.redis.pipeline(transaction=False)
+        for doc, position, _ in rows:
+            pipe.hget(self._row_key(doc.name, position), "text_hash")
+        pipe.hmget(self.rows_key, [doc.name for doc in documents])
+        *stored_hashes, old_counts = pipe.execute()
+
+        stale = [
+            (doc, position, text)
+            for (doc, position, text), stored in zip(rows, stored_hashes)
+            if _decode(stored) != self._text_hash(text)
+        ]
+        vectors = (
+            embeddings_model.embed_documents([text for _, _, text in stale])
+            if stale
+            else []
+        )
+        embedded = {
+            (doc.name, position): vector
+            for (doc, position, _), vector in zip(stale, vectors)
+        }
+
+        pipe = self.redis.pipeline(transaction=False)
+        for doc, position, text in rows:
+            mapping = {
+                "tool_name": doc.name,
+                "group": doc.group,
+                "scope": doc.scope,
+                "kind": "description" if position == 0 else "example",
+            }
+            vector = embedded.get((doc.name, position))
+            if vector is not None:
+                mapping.update(
+                    {
+                        "text": text,
+                        "text_hash": self._text_hash(text),
+                        "embedding": np.asarray(vector, dtype=np.float32).tobytes(),
+                    }
+                )
+            pipe.hset(self._row_key(doc.name, position), mapping=mapping)
+
+        # Drop rows left over from tools that now have fewer texts
+        for doc, old_count in zip(documents, old_counts):
+            for position in range(len(doc.texts), int(_decode(old_count) or 0)):
+                pipe.delete(self._row_key(doc.name, position))
+        pipe.hset(self.rows_key, mapping={doc.name: len(doc.texts) for doc in documents})
+        pipe.execute()
+
+        if stale:
+            logger.info(
+                f"Embedded {len(stale)} of {len(rows)} tool texts into {self.index_name}"
+            )
+        return len(stale)
+
+    def remove(self, tool_names: Sequence[str]):
+        """Remove tools and all their rows."""
+        counts = self.redis.hmget(self.rows_key, list(tool_names))
+        keys = [
+            self._row_key(name, position)
+            for name, count in zip(tool_names, counts)
+            for position in range(int(_decode(count) or 0))
+        ]
+        if keys:
+            self.redis.delete(*keys)
+        if tool_names:
+            self.redis.hdel(self.rows_key, *tool_names)
+
+    def search(
+        self,
+        query_vector: Sequence[float],
+        k: int = 3,
+        groups: Optional[List[str]] = None,
+        scopes: Optional[List[str]] = None,
+        oversample: int = 4,
+    ) -> List[Tuple[str, float]]:
+        """
+        Find the tools closest to a query vector.
+
+        Args:
+            query_vector: Query embedding
+            k: Number of tools to return
+            groups: Only route to tools in these groups
+            scopes: Only route to tools whose scope is in this list
+            oversample: Rows fetched per requested tool (a tool has several
+                        rows, so several hits may belong to one tool)
+
+        Returns:
+            (tool name, cosine similarity of its best row), best first
+        """
+        vector_query = VectorQuery(
+            vector=list(query_vector),
+            vector_field_name="embedding",
+            return_fields=["tool_name"],
+            num_results=k * oversample,
+        )
+        tool_filter = None
+        if groups:
+            tool_filter = Tag("group") == groups
+        if scopes:
+            scope_filter = Tag("scope") == scopes
+            tool_filter = scope_filter if tool_filter is None else tool_filter & scope_filter
+        if tool_filter is not None:
+            vector_query.set_filter(tool_filter)
+
+        best: Dict[str, float] = {}
+        for result in self._get_index().query(vector_query):
+            name = result["tool_name"]
+            similarity = 1.0 - float(result["vector_distance"])
+            if similarity > best.get(name, -1.0):
+                best[name] = similarity
+        return sorted(best.items(), key=lambda item: item[1], reverse=True)[:k]
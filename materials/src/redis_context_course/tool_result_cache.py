@@ -0,0 +1,214 @@
+"""
+Per-session tool result cache for ReAct loops.
+
+ReAct agents often repeat a tool call with the same or trivially different
+arguments, both across iterations of one turn and across turns of a
+session. Each repeat of ``search_courses`` re-embeds the query, re-queries
+Redis and re-assembles context. ``ToolResultCache`` stores tool results in
+Redis, keyed by:
+
+- session id
+- catalog version (see catalog_manifest), so re-ingestion retires results
+- tool name
+- sha256 of the canonicalized JSON arguments: keys sorted, None values
+  dropped, strings normalized like exact-match response cache queries
+  ("Machine  learning?" and "machine learning" are the same call)
+
+Tools with side effects are never cached. Instead they invalidate the
+tools whose results they change, e.g. ``store_memory`` invalidates
+``search_memories``. Invalidation bumps a per-session generation counter
+that is part of the key, so it is O(1) and old entries expire by TTL.
+
+Usage:
+    from redis_context_course.tool_result_cache import ToolResultCache
+
+    cache = ToolResultCache()
+    result, cached = await cache.call(
+        session_id, "search_courses", {"query": "ML courses"},
+        lambda: search_courses_tool.ainvoke({"query": "ML courses"}),
+    )
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, Iterable, Mapping, Optional, Tuple, Union
+
+from redis import Redis
+
+from .catalog_manifest import CatalogManifest
+from .redis_config import RedisConfig, redis_config
+from .response_cache import normalize_query
+
+logger = logging.getLogger(__name__)
+
+# Read-only tools whose results depend only on their arguments (and session)
+DEFAULT_CACHEABLE_TOOLS = {"search_courses", "search_courses_hybrid", "search_memories"}
+
+# Tools with side effects -> tools whose cached results they make stale
+DEFAULT_INVALIDATIONS: Dict[str, Iterable[str]] = {
+    "store_memory": ["search_memories"],
+}
+
+# Results produced by tool error handlers, never cached
+_ERROR_PREFIXES = ("Error", "❌")
+
+
+def canonical_args(args: Mapping[str, Any]) -> str:
+    """Canonical JSON form of tool arguments used in the cache key."""
+
+    def canonicalize(value: Any) -> Any:
+        if isinstance(value, str):
+            return normalize_query(value)
+        if isinstance(value, Mapping):
+            return {k: canonicalize(v) for k, v in value.items() if v is not None}
+        if isinstance(value, (list, tuple)):
+            return [canonicalize(v) for v in value]
+        return value
+
+    return json.dumps(canonicalize(args), sort_keys=True, separators=(",", ":"), default=str)
+
+
+class ToolResultCache:
+    """
+    Redis-backed tool result cache scoped to a session and catalog version.
+
+    Hit/miss counters are kept per tool for ``stats()``.
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[Redis] = None,
+        namespace: str = "tool_cache",
+        ttl: int = 1800,
+        cacheable: Optional[Iterable[str]] = None,
+        invalidations: Optional[Mapping[str, Iterable[str]]] = None,
+        config: Optional[RedisConfig] = None,
+        manifest: Optional[CatalogManifest] = None,
+    ):
+        """
+        Initialize the tool result cache.
+
+        Args:
+            redis_client: Redis client (uses default if None)
+            namespace: Key prefix in Redis
+            ttl: Seconds before a cached result expires (about a session)
+            cacheable: Names of tools whose results are cached
+                (defaults to DEFAULT_CACHEABLE_TOOLS)
+            invalidations: Tool name -> tools whose results it invalidates
+                (defaults to DEFAULT_INVALIDATIONS)
+            config: RedisConfig whose shared connection pool to use
+                (uses global redis_config if None)
+            manifest: Catalog manifest whose version scopes entries (reads
+                the default manifest on the same Redis if None)
+        """
+        self.redis = redis_client or (config or redis_config).redis_client
+        self.namespace = namespace
+        self.ttl = ttl
+        self.cacheable = set(DEFAULT_CACHEABLE_TOOLS if cacheable is None else cacheable)
+        self.invalidations = {
+            tool: list(targets)
+            for tool, targets in (
+                DEFAULT_INVALIDATIONS if invalidations is None else invalidations
+            ).items()
+        }
+        self.manifest = manifest or CatalogManifest(self.redis)
+
+        self._lock = threading.Lock()
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+
+    def _generation_key(self, session_id: str, tool_name: str) -> str:
+        return f"{self.namespace}:gen:{session_id}:{tool_name}"
+
+    def key(self, session_id: str, tool_name: str, args: Mapping[str, Any]) -> str:
+        """Redis key for a tool call in a session under the current catalog version."""
+        generation = self.redis.get(self._generation_key(session_id, tool_name)) or 0
+        if isinstance(generation, bytes):
+            generation = generation.decode()
+        digest = hashlib.sha256(canonical_args(args).encode("utf-8")).hexdigest()
+        return (
+            f"{self.namespace}:{self.manifest.version}:{session_id}:"
+            f"{tool_name}:{generation}:{digest}"
+        )
+
+    def get(self, session_id: str, tool_name: str, args: Mapping[str, Any]) -> Optional[str]:
+        """Cached result of a tool call, or None."""
+        try:
+            result = self.redis.get(self.key(session_id, tool_name, args))
+        except Exception as e:
+            logger.warning(f"Tool cache lookup failed for {tool_name}: {e}")
+            result = None
+        if isinstance(result, bytes):
+            result = result.decode()
+        with self._lock:
+            counter = self._misses if result is None else self._hits
+            counter[tool_name] = counter.get(tool_name, 0) + 1
+        return result
+
+    def set(self, session_id: str, tool_name: str, args: Mapping[str, Any], result: str):
+        """Store the result of a tool call."""
+        try:
+            self.redis.set(self.key(session_id, tool_name, args), result, ex=self.ttl or None)
+        except Exception as e:
+            logger.warning(f"Tool cache store failed for {tool_name}: {e}")
+
+    def invalidate(self, session_id: str, tool_name: str):
+        """Retire every cached result of a tool in a session."""
+        key = self._generation_key(session_id, tool_name)
+        try:
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.incr(key)
+            if self.ttl:
+                pipe.expire(key, self.ttl)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Tool cache invalidation failed for {tool_name}: {e}")
+
+    async def call(
+        self,
+        session_id: str,
+        tool_name: str,
+        args: Mapping[str, Any],
+        execute: Callable[[], Awaitable[str]],
+    ) -> Tuple[str, bool]:
+        """
+        Run a tool call through the cache.
+
+        Args:
+            session_id: Session the call belongs to
+            tool_name: Name of the tool
+            args: Tool arguments
+            execute: Runs the tool on a miss
+
+        Returns:
+            (result, True if it came from the cache)
+        """
+        if tool_name in self.cacheable:
+            cached = self.get(session_id, tool_name, args)
+            if cached is not None:
+                return cached, True
+
+        result = await execute()
+
+        if tool_name in self.cacheable:
+            if not str(result).startswith(_ERROR_PREFIXES):
+                self.set(session_id, tool_name, args, result)
+        for target in self.invalidations.get(tool_name, []):
+            self.invalidate(session_id, target)
+        return result, False
+
+    def stats(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """Hits, misses and hit rate per tool for this process."""
+        with self._lock:
+            tools = set(self._hits) | set(self._misses)
+            stats = {}
+            for tool in sorted(tools):
+                hits, misses = self._hits.get(tool, 0), self._misses.get(tool, 0)
+                stats[tool] = {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+                }
+            return stats
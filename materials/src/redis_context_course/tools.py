@@ -50,6 +50,14 @@ class CheckPrerequisitesInput(BaseModel):
     )
 
 
+class GetPrerequisiteGraphInput(BaseModel):
+    """Input schema for exploring the prerequisite graph."""
+
+    course_code: str = Field(
+        description="Course code to show the prerequisite chain and unlocks for"
+    )
+
+
 # EXPERIMENTAL: Not currently used in notebooks or progressive_agents but available for external use
 # Notebooks and agents create tools inline for educational clarity
 # Course Tools
@@ -84,7 +92,10 @@ def create_course_tools(course_manager: CourseManager):
         - "beginner programming" → finds CS101, CS102, etc.
         - "online data science courses" → finds online courses about data science
         """
-        results = await course_manager.search_courses(query, limit=limit)
+        # Only render summary fields, so skip the JSON-heavy "full" profile
+        results = await course_manager.search_courses(
+            query, limit=limit, profile="summary"
+        )
 
         if not results:
             return "No courses found matching your query."
@@ -158,28 +169,57 @@ Learning Objectives:
 
         Returns whether the student is eligible and which prerequisites are missing (if any).
         """
-        course = await course_manager.get_course(course_code)
+        graph = await course_manager.get_prerequisite_graph()
 
-        if not course:
+        if course_code not in graph:
             return f"Course {course_code} not found."
 
-        if not course.prerequisites:
+        if not graph.direct_edges(course_code):
             return f"✅ {course_code} has no prerequisites. You can take this course!"
 
         missing = []
-        for prereq in course.prerequisites:
-            if prereq.course_code not in completed_courses:
-                missing.append(f"{prereq.course_code} (min grade: {prereq.min_grade})")
+        for code in graph.missing_prerequisites(course_code, completed_courses):
+            min_grade = graph.min_grade(course_code, code)
+            missing.append(f"{code} (min grade: {min_grade})" if min_grade else code)
 
         if not missing:
             return f"✅ You meet all prerequisites for {course_code}!"
 
+        # Remaining courses anywhere in the chain, in the order to take them
+        remaining = [
+            code
+            for code in graph.prerequisite_chain(course_code)
+            if code not in completed_courses
+        ]
+
         return f"""❌ You're missing prerequisites for {course_code}:
 
 Missing:
-""" + "\n".join([f"- {p}" for p in missing])
+""" + "\n".join([f"- {p}" for p in missing]) + f"""
 
-    return [search_courses, get_course_details, check_prerequisites]
+Full path still to complete: {' → '.join(remaining)}"""
+
+    @tool(args_schema=GetPrerequisiteGraphInput)
+    async def explore_prerequisites(course_code: str) -> str:
+        """
+        Show the full prerequisite chain of a course and what it unlocks.
+
+        Use this tool when:
+        - Student asks "What is the full path to [course]?"
+        - Student asks "What can I take after [course]?"
+        - You need to plan a multi-semester sequence
+
+        Returns every course required (in the order to take them) and the
+        courses that list this course as a prerequisite.
+        """
+        graph = await course_manager.get_prerequisite_graph()
+
+        if course_code not in graph:
+            return f"Course {course_code} not found."
+
+        return graph.describe(course_code)
+
+    return [search_courses, get_course_details, check_prerequisites, explore_prerequisites]
 
 
 # EXPERIMENTAL: Not currently used in notebooks or progressive_agents but available for external use
@@ -310,7 +350,9 @@ def create_agent_tools(
                 filters["department"] = dept
                 break
 
-        courses = await course_manager.search_courses(query, filters=filters)
+        courses = await course_manager.search_courses(
+            query, filters=filters, profile="summary"
+        )
 
         if not courses:
             return "No courses found matching your criteria."
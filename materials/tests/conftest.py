@@ -0,0 +1,61 @@
+"""
+Shared fixtures for the redis_context_course unit tests.
+
+These tests run without a Redis server, API keys or network access: Redis
+is replaced by fakeredis, nothing here calls OpenAI, and token counting can
+use a deterministic stand-in for the tiktoken encoding.
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+
+import fakeredis
+import pytest
+
+# Import the package from the source tree without installing it
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+BUNDLED_CATALOG = (
+    SRC_DIR / "redis_context_course" / "data" / "hierarchical" / "hierarchical_courses.json"
+)
+
+
+@pytest.fixture
+def redis_client():
+    """In-memory Redis client (decoded responses, like redis_config)."""
+    return fakeredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def catalog_file(tmp_path):
+    """Small hierarchical catalog JSON file (the first courses of the bundled one)."""
+    with open(BUNDLED_CATALOG) as f:
+        courses = json.load(f)["courses"][:4]
+    path = tmp_path / "hierarchical_courses.json"
+    path.write_text(json.dumps({"courses": courses}))
+    return path
+
+
+class FakeEncoding:
+    """Deterministic stand-in for a tiktoken encoding (one token per word or symbol)."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, text, disallowed_special=()):
+        self.calls += 1
+        return re.findall(r"\s*\w+|\s*[^\w\s]", text)
+
+
+@pytest.fixture
+def fake_encoding(monkeypatch):
+    """Route every TokenCounter through a fresh FakeEncoding."""
+    from redis_context_course import token_counter
+
+    encoding = FakeEncoding()
+    monkeypatch.setattr(token_counter, "get_encoding", lambda model: encoding)
+    monkeypatch.setattr(token_counter, "_counters", {})
+    return encoding
@@ -0,0 +1,63 @@
+"""Tests for the shared indexed hierarchical catalog."""
+
+import hashlib
+import json
+
+from redis_context_course.catalog import HierarchicalCatalog, get_catalog
+
+
+def test_lookup_by_code(catalog_file):
+    catalog = HierarchicalCatalog.from_file(catalog_file)
+
+    assert len(catalog) == 4
+    assert catalog.course_codes == ["CS001", "CS002", "CS003", "CS004"]
+    assert "CS002" in catalog
+    assert catalog.get("CS002").summary.course_code == "CS002"
+    assert catalog.get("CS999") is None
+    assert catalog.get_details("CS001").course_code == "CS001"
+
+
+def test_get_is_built_once_and_reused(catalog_file):
+    catalog = HierarchicalCatalog.from_file(catalog_file)
+
+    course = catalog.get("CS001")
+    assert catalog.get("CS001") is course
+    assert course.summary is catalog.get_summary("CS001")
+
+
+def test_get_many_keeps_input_order_and_skips_unknown(catalog_file):
+    catalog = HierarchicalCatalog.from_file(catalog_file)
+
+    courses = catalog.get_many(["CS003", "MISSING", "CS001"])
+    assert [c.summary.course_code for c in courses] == ["CS003", "CS001"]
+
+
+def test_department_and_tag_indexes_are_case_insensitive(catalog_file):
+    catalog = HierarchicalCatalog.from_file(catalog_file)
+
+    in_department = catalog.by_department("computer science")
+    assert [s.course_code for s in in_department] == catalog.course_codes
+    assert {s.course_code for s in catalog.by_tag("PROGRAMMING")} >= {"CS001", "CS002"}
+    assert catalog.by_tag("no-such-tag") == []
+
+
+def test_invalid_summaries_are_skipped(catalog_file):
+    courses = json.loads(catalog_file.read_text())["courses"]
+    broken = dict(courses[0], id="broken", summary={"course_code": "BAD"})
+
+    catalog = HierarchicalCatalog.from_courses_data([broken] + courses[1:])
+
+    assert "BAD" not in catalog
+    assert len(catalog) == 3
+
+
+def test_version_is_file_sha256(catalog_file):
+    catalog = HierarchicalCatalog.from_file(catalog_file)
+    assert catalog.version == hashlib.sha256(catalog_file.read_bytes()).hexdigest()
+
+
+def test_get_catalog_is_shared_per_path(catalog_file):
+    first = get_catalog(catalog_file, use_snapshot=False)
+
+    assert get_catalog(catalog_file, use_snapshot=False) is first
+    assert get_catalog(catalog_file, reload=True, use_snapshot=False) is not first
@@ -0,0 +1,83 @@
+"""Tests for the per-index catalog version manifest."""
+
+import threading
+
+from redis_context_course.catalog_manifest import (
+    UNVERSIONED,
+    CatalogManifest,
+    catalog_content_hash,
+)
+
+COURSES = [{"course_code": "CS001"}, {"course_code": "CS002"}]
+
+
+def test_unpublished_catalog_is_unversioned(redis_client):
+    manifest = CatalogManifest(redis_client, index_name="course_catalog")
+
+    assert manifest.read() is None
+    assert manifest.version == UNVERSIONED
+
+
+def test_publish_bumps_version_only_when_content_changes(redis_client):
+    manifest = CatalogManifest(redis_client, index_name="course_catalog")
+
+    first = manifest.publish(COURSES, source="courses.json")
+    assert first["version"] == "1"
+    assert first["count"] == "2"
+    assert first["source"] == "courses.json"
+    assert manifest.version == "1"
+
+    # Same records in another order: same content, caches stay warm
+    assert manifest.publish(list(reversed(COURSES)))["version"] == "1"
+
+    changed = manifest.publish(COURSES + [{"course_code": "CS003"}])
+    assert changed["version"] == "2"
+    assert manifest.version == "2"
+
+
+def test_content_hash_ignores_order_but_not_content():
+    assert catalog_content_hash(COURSES) == catalog_content_hash(reversed(COURSES))
+    assert catalog_content_hash(COURSES) != catalog_content_hash(COURSES[:1])
+
+
+def test_each_index_has_its_own_manifest(redis_client):
+    courses = CatalogManifest(redis_client, index_name="course_catalog")
+    summaries = CatalogManifest(redis_client, index_name="hierarchical_courses")
+
+    courses.publish(COURSES)
+    courses.publish(COURSES[:1])
+    summaries.publish(COURSES)
+
+    assert courses.key == "catalog:manifest:course_catalog"
+    assert summaries.key == "catalog:manifest:hierarchical_courses"
+    assert courses.version == "2"
+    assert summaries.version == "1"
+
+
+def test_readers_poll_at_most_once_per_interval(redis_client):
+    publisher = CatalogManifest(redis_client, index_name="course_catalog")
+    reader = CatalogManifest(redis_client, index_name="course_catalog", refresh_interval=60)
+    publisher.publish(COURSES)
+    assert reader.version == "1"
+
+    publisher.publish(COURSES[:1])
+    assert reader.version == "1"
+    reader.refresh()
+    assert reader.version == "2"
+
+
+def test_concurrent_publishes_never_lose_a_bump(redis_client):
+    manifest = CatalogManifest(redis_client, index_name="course_catalog")
+    barrier = threading.Barrier(10)
+
+    def publish(i):
+        barrier.wait()
+        manifest.publish([{"course_code": f"CS{i:03d}"}])
+
+    threads = [threading.Thread(target=publish, args=(i,)) for i in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert manifest.read()["version"] == "10"
@@ -0,0 +1,75 @@
+"""Tests for pre-parsed catalog snapshots."""
+
+import json
+import os
+
+import pytest
+
+from redis_context_course import catalog as catalog_module
+from redis_context_course.catalog import (
+    HierarchicalCatalog,
+    get_catalog,
+    load_snapshot,
+    snapshot_path_for,
+    write_snapshot,
+)
+
+pytestmark = pytest.mark.skipif(
+    catalog_module.msgpack is None, reason="catalog snapshots require msgpack"
+)
+
+
+def test_round_trip_matches_json_catalog(catalog_file):
+    from_json = HierarchicalCatalog.from_file(catalog_file)
+    snapshot_path = write_snapshot(catalog_file)
+    from_snapshot = load_snapshot(catalog_file)
+
+    assert snapshot_path == snapshot_path_for(catalog_file)
+    assert from_snapshot is not None
+    assert from_snapshot.version == from_json.version
+    assert from_snapshot.course_codes == from_json.course_codes
+    for code in from_json:
+        assert from_snapshot.get_summary(code) == from_json.get_summary(code)
+        assert from_snapshot.get_details(code) == from_json.get_details(code)
+    assert [s.course_code for s in from_snapshot.by_tag("programming")] == [
+        s.course_code for s in from_json.by_tag("programming")
+    ]
+
+
+def test_missing_snapshot_returns_none(catalog_file):
+    assert load_snapshot(catalog_file) is None
+
+
+def test_edited_source_invalidates_snapshot(catalog_file):
+    write_snapshot(catalog_file)
+    data = json.loads(catalog_file.read_text())
+    data["courses"] = data["courses"][:2]
+    catalog_file.write_text(json.dumps(data))
+
+    assert load_snapshot(catalog_file) is None
+
+
+def test_touched_but_unchanged_source_keeps_snapshot(catalog_file):
+    write_snapshot(catalog_file)
+    stat = catalog_file.stat()
+    os.utime(catalog_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    snapshot = load_snapshot(catalog_file)
+    assert snapshot is not None
+    assert len(snapshot) == 4
+
+
+def test_corrupt_snapshot_is_ignored(catalog_file):
+    snapshot_path_for(catalog_file).write_bytes(b"not a snapshot")
+
+    assert load_snapshot(catalog_file) is None
+
+
+def test_get_catalog_writes_and_then_uses_snapshot(catalog_file):
+    first = get_catalog(catalog_file, reload=True)
+    assert snapshot_path_for(catalog_file).exists()
+    assert isinstance(first._records, dict)
+
+    reloaded = get_catalog(catalog_file, reload=True)
+    assert not isinstance(reloaded._records, dict)
+    assert reloaded.get_details("CS001") == first.get_details("CS001")
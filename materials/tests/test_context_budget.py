@@ -0,0 +1,73 @@
+"""Tests for token-budgeted hierarchical context assembly."""
+
+import pytest
+
+from redis_context_course.catalog import HierarchicalCatalog
+from redis_context_course.hierarchical_context import HierarchicalContextAssembler
+from redis_context_course.token_counter import get_token_counter
+
+QUERY = "python programming assignments"
+
+
+@pytest.fixture
+def courses(catalog_file):
+    catalog = HierarchicalCatalog.from_file(catalog_file)
+    summaries = [catalog.get_summary(code) for code in catalog]
+    details = [catalog.get_details(code) for code in catalog.course_codes[:2]]
+    return summaries, details
+
+
+def test_budget_is_never_exceeded(fake_encoding, courses):
+    summaries, details = courses
+    assembler = HierarchicalContextAssembler()
+    # The query heading is always included, so it is the smallest usable budget
+    _, floor = assembler.assemble_with_budget(summaries, details, QUERY, max_tokens=0)
+    full = assembler.assemble_hierarchical_context(summaries, details, QUERY)
+    full_tokens = get_token_counter().count(full)
+
+    for max_tokens in range(floor, full_tokens + 50, 7):
+        context, tokens = assembler.assemble_with_budget(
+            summaries, details, QUERY, max_tokens=max_tokens
+        )
+        assert tokens <= max_tokens
+        assert tokens == get_token_counter().count(context, memoize=False)
+        assert context.startswith(f"# Course Search Results for: {QUERY}")
+
+
+def test_larger_budget_adds_context(fake_encoding, courses):
+    summaries, details = courses
+    assembler = HierarchicalContextAssembler()
+
+    _, small = assembler.assemble_with_budget(summaries, details, QUERY, max_tokens=80)
+    _, large = assembler.assemble_with_budget(summaries, details, QUERY, max_tokens=800)
+
+    assert small < large
+
+
+def test_summaries_are_preferred_over_details(fake_encoding, courses):
+    summaries, details = courses
+    assembler = HierarchicalContextAssembler()
+    summary_only = assembler.assemble_summary_only_context(summaries, QUERY)
+    # Room for every summary plus the group headings, but not all details
+    budget = get_token_counter().count(summary_only) + 20
+
+    context, _ = assembler.assemble_with_budget(
+        summaries, details, QUERY, max_tokens=budget
+    )
+
+    for summary in summaries:
+        assert summary.course_code in context
+    assert context != assembler.assemble_hierarchical_context(summaries, details, QUERY)
+
+
+def test_generous_budget_matches_full_assembly(fake_encoding, courses):
+    summaries, details = courses
+    assembler = HierarchicalContextAssembler()
+    full = assembler.assemble_hierarchical_context(summaries, details, QUERY)
+
+    context, tokens = assembler.assemble_with_budget(
+        summaries, details, QUERY, max_tokens=100_000
+    )
+
+    assert context == full
+    assert tokens == get_token_counter().count(full)
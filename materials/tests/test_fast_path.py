@@ -0,0 +1,98 @@
+"""Tests for the rule-based trivial turn fast path."""
+
+import pytest
+
+from redis_context_course.fast_path import (
+    DEFAULT_RESPONSES,
+    TrivialTurnMatcher,
+    expects_reply,
+)
+
+OFFER = "I found 3 machine learning courses. Would you like me to:\n1. Compare them"
+
+
+@pytest.mark.parametrize(
+    "query, kind",
+    [
+        ("hi", "greeting"),
+        ("Hello there!", "greeting"),
+        ("good morning 👋", "greeting"),
+        ("Thanks so much!", "thanks"),
+        ("thank you for your help", "thanks"),
+        ("hi, thanks!", "thanks"),
+        ("bye", "farewell"),
+        ("ok thanks, bye", "thanks"),
+        ("ok, got it", "acknowledgement"),
+        ("Sounds good.", "acknowledgement"),
+    ],
+)
+def test_trivial_turns_are_matched(query, kind):
+    assert TrivialTurnMatcher().match(query) == kind
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "",
+        "   ",
+        "hi, what are the prerequisites for CS101?",
+        "thanks, and what about CS002?",
+        "ok so which course should I take",
+        "history",  # contains "hi" but is not a greeting
+        "oh well",  # filler only
+        "hi " * 30,  # longer than max_length
+    ],
+)
+def test_other_turns_fall_through(query):
+    assert TrivialTurnMatcher().respond(query) is None
+
+
+def test_respond_uses_templates_and_counts_hits():
+    matcher = TrivialTurnMatcher()
+
+    assert matcher.respond("thanks!") == DEFAULT_RESPONSES["thanks"]
+    assert matcher.respond("Find me a Python course") is None
+    assert matcher.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_acknowledgement_after_offer_needs_the_model():
+    matcher = TrivialTurnMatcher()
+
+    assert matcher.respond("sure", previous_response=OFFER) is None
+    assert matcher.respond("ok", previous_response="Which semester do you prefer?") is None
+    assert (
+        matcher.respond("sure", previous_response="CS001 has no prerequisites.")
+        == DEFAULT_RESPONSES["acknowledgement"]
+    )
+
+
+def test_thanks_and_farewell_after_offer_still_use_templates():
+    matcher = TrivialTurnMatcher()
+
+    assert matcher.respond("thanks!", previous_response=OFFER) == DEFAULT_RESPONSES["thanks"]
+    assert matcher.respond("bye", previous_response=OFFER) == DEFAULT_RESPONSES["farewell"]
+
+
+@pytest.mark.parametrize(
+    "previous, expected",
+    [
+        (None, False),
+        ("", False),
+        ("Here are the courses.", False),
+        ("Anything else?", True),
+        ("Do you want the syllabus too", True),
+        ("Shall I check prerequisites for you.", True),
+        ("Would you like details?" + " Course list." * 100, False),
+    ],
+)
+def test_expects_reply_looks_at_the_end_of_the_response(previous, expected):
+    assert expects_reply(previous) is expected
+
+
+def test_custom_phrases_and_responses():
+    matcher = TrivialTurnMatcher(
+        phrases={"greeting": ["aloha"]}, responses={"greeting": "Aloha!"}
+    )
+
+    assert matcher.respond("Aloha!") == "Aloha!"
+    assert matcher.respond("hello") is None
@@ -0,0 +1,140 @@
+"""Tests for the precomputed prerequisite graph."""
+
+from redis_context_course.models import (
+    Course,
+    CourseFormat,
+    DifficultyLevel,
+    Prerequisite,
+    Semester,
+)
+from redis_context_course.prerequisite_graph import PrerequisiteGraph
+
+
+def make_course(code, prereqs=(), concurrent=()):
+    """Minimal course with the given strict and concurrent prerequisites."""
+    return Course(
+        course_code=code,
+        title=f"Course {code}",
+        description="Test course",
+        credits=3,
+        difficulty_level=DifficultyLevel.BEGINNER,
+        format=CourseFormat.ONLINE,
+        department="Computer Science",
+        major="Computer Science",
+        semester=Semester.FALL,
+        year=2024,
+        instructor="Test Instructor",
+        max_enrollment=30,
+        prerequisites=[
+            Prerequisite(course_code=p, course_title=p) for p in prereqs
+        ]
+        + [
+            Prerequisite(course_code=p, course_title=p, can_be_concurrent=True)
+            for p in concurrent
+        ],
+    )
+
+
+def chain_graph():
+    """CS001 -> CS010 -> CS020 -> CS040, with CS030 also requiring CS001."""
+    return PrerequisiteGraph.from_courses(
+        [
+            make_course("CS001"),
+            make_course("CS010", ["CS001"]),
+            make_course("CS020", ["CS010"]),
+            make_course("CS030", ["CS001"]),
+            make_course("CS040", ["CS020", "CS030"]),
+        ]
+    )
+
+
+def test_acyclic_graph_has_no_cycles():
+    assert chain_graph().cycles == []
+
+
+def test_prerequisite_chain_is_transitive_and_take_first_ordered():
+    graph = chain_graph()
+    chain = graph.prerequisite_chain("CS040")
+
+    assert set(chain) == {"CS001", "CS010", "CS020", "CS030"}
+    assert chain.index("CS001") < chain.index("CS010") < chain.index("CS020")
+    assert graph.prerequisite_chain("CS001") == []
+    assert graph.prerequisite_chain("UNKNOWN") == []
+
+
+def test_unlocks_direct_and_transitive():
+    graph = chain_graph()
+
+    assert set(graph.unlocks("CS001")) == {"CS010", "CS030"}
+    assert set(graph.unlocks("CS001", transitive=True)) == {
+        "CS010",
+        "CS020",
+        "CS030",
+        "CS040",
+    }
+    assert graph.unlocks("CS040") == []
+
+
+def test_eligibility_uses_direct_prerequisites():
+    graph = chain_graph()
+
+    assert graph.is_eligible("CS001")
+    assert not graph.is_eligible("CS040", completed=["CS001", "CS010", "CS020"])
+    assert graph.missing_prerequisites("CS040", completed=["CS020"]) == ["CS030"]
+    assert graph.is_eligible("CS040", completed=["CS020", "CS030"])
+    assert graph.is_eligible("NOT_IN_CATALOG")
+
+
+def test_concurrent_prerequisite_accepts_current_enrollment():
+    graph = PrerequisiteGraph.from_courses(
+        [make_course("MATH101"), make_course("PHYS101", concurrent=["MATH101"])]
+    )
+
+    assert not graph.is_eligible("PHYS101")
+    assert graph.is_eligible("PHYS101", current=["MATH101"])
+    assert graph.eligible_courses(current=["MATH101"]) == ["PHYS101"]
+
+
+def test_cycle_is_detected_and_closure_still_terminates():
+    graph = PrerequisiteGraph.from_courses(
+        [
+            make_course("A", ["C"]),
+            make_course("B", ["A"]),
+            make_course("C", ["B"]),
+            make_course("D", ["A"]),
+        ]
+    )
+
+    assert len(graph.cycles) == 1
+    cycle = graph.cycles[0]
+    assert cycle[0] == cycle[-1]
+    assert set(cycle) == {"A", "B", "C"}
+
+    # Every course on the cycle transitively requires the whole cycle
+    assert set(graph.prerequisite_chain("A")) == {"A", "B", "C"}
+    assert set(graph.prerequisite_chain("D")) == {"A", "B", "C"}
+    assert not graph.is_eligible("A")
+
+
+def test_self_prerequisite_is_a_cycle():
+    graph = PrerequisiteGraph.from_courses([make_course("X", ["X"])])
+
+    assert graph.cycles == [["X", "X"]]
+
+
+def test_save_and_load_round_trip_replaces_stale_edges(redis_client):
+    key = "prerequisite_graph:test"
+    redis_client.hset(key, "STALE", "[]")
+
+    graph = chain_graph()
+    graph.save(redis_client, key)
+    loaded = PrerequisiteGraph.load(redis_client, key)
+
+    assert "STALE" not in loaded
+    assert loaded.codes == graph.codes
+    assert loaded.prerequisite_chain("CS040") == graph.prerequisite_chain("CS040")
+    assert loaded.min_grade("CS010", "CS001") == "C"
+
+
+def test_load_returns_none_when_nothing_is_stored(redis_client):
+    assert PrerequisiteGraph.load(redis_client, "prerequisite_graph:missing") is None
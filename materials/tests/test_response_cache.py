@@ -0,0 +1,82 @@
+"""Tests for the two-tier exact-match response cache."""
+
+import pytest
+
+from redis_context_course.catalog_manifest import CatalogManifest
+from redis_context_course.response_cache import ResponseCache, normalize_query
+
+
+@pytest.fixture
+def manifest(redis_client):
+    return CatalogManifest(redis_client, index_name="course_catalog")
+
+
+@pytest.fixture
+def cache(redis_client, manifest):
+    return ResponseCache(redis_client, catalog_version="v1", manifest=manifest)
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("What are the prerequisites for CS002?", "what are the prerequisites for CS002"),
+        ("what are the  prerequisites for cs 002", "what are the prerequisites for CS002"),
+        ("What are the prerequisites for Cs-002?!", "what are the prerequisites for CS002"),
+        ("  Tell me about\tMATH 101 ...  ", "tell me about MATH101"),
+        ("ＣＳ００２", "CS002"),  # full-width characters
+        ("Is CS0020 online?", "is cs0020 online"),  # not a course code
+    ],
+)
+def test_normalize_query(query, expected):
+    assert normalize_query(query) == expected
+
+
+def test_equivalent_queries_share_a_key(cache):
+    assert cache.key("Prerequisites for CS002?") == cache.key("prerequisites for cs-002")
+    assert cache.key("Prerequisites for CS002?") != cache.key("Prerequisites for CS003?")
+
+
+def test_keys_are_scoped_by_student(cache):
+    query = "What courses did I take?"
+
+    assert cache.key(query) != cache.key(query, scope="student_1")
+    assert cache.key(query, scope="student_1") != cache.key(query, scope="student_2")
+
+    cache.set(query, "You took CS001.", intent="MEMORY", scope="student_1")
+    assert cache.get(query, scope="student_1")["response"] == "You took CS001."
+    assert cache.get(query, scope="student_2") is None
+    assert cache.get(query) is None
+
+
+def test_keys_are_scoped_by_catalog_versions(redis_client, manifest, cache):
+    query = "List machine learning courses"
+    cache.set(query, "CS010, CS011", intent="COURSE_SEARCH")
+
+    other_file = ResponseCache(redis_client, catalog_version="v2", manifest=manifest)
+    assert other_file.get(query) is None
+
+    manifest.publish([{"course_code": "CS010"}])
+    assert cache.get(query) is None
+
+
+def test_l2_hits_are_shared_and_promoted(redis_client, manifest, cache):
+    cache.set("hello world", "answer", intent="GENERAL")
+
+    other_process = ResponseCache(redis_client, catalog_version="v1", manifest=manifest)
+    assert other_process.get("Hello world!")["tier"] == "l2"
+    assert other_process.get("Hello world!")["tier"] == "l1"
+    assert other_process.stats()["l2_hits"] == 1
+    assert other_process.stats()["l1_hits"] == 1
+
+
+def test_intent_filter(cache):
+    cache.set("CS002 syllabus", "Week 1 ...", intent="SYLLABUS")
+
+    assert cache.get("CS002 syllabus", intent="SYLLABUS")["intent"] == "SYLLABUS"
+    assert cache.get("CS002 syllabus", intent="PREREQUISITES") is None
+
+
+def test_entries_expire_with_ttl(redis_client, cache):
+    cache.set("expiring question", "answer", intent="GENERAL")
+
+    assert 0 < redis_client.ttl(cache.key("expiring question")) <= cache.ttl
@@ -0,0 +1,70 @@
+"""Tests for the shared memoized token counter."""
+
+from redis_context_course.token_counter import TokenCounter, get_token_counter
+
+
+def test_repeated_strings_are_encoded_once(fake_encoding):
+    counter = TokenCounter()
+
+    first = counter.count("Hello, world!")
+    second = counter.count("Hello, world!")
+
+    assert first == second == 4
+    assert fake_encoding.calls == 1
+    assert counter.stats()["hits"] == 1
+    assert counter.stats()["misses"] == 1
+
+
+def test_memoize_false_and_long_strings_skip_the_cache(fake_encoding):
+    counter = TokenCounter(max_memo_length=10)
+
+    counter.count("short text", memoize=False)
+    counter.count("short text", memoize=False)
+    counter.count("this string is too long to memoize")
+    counter.count("this string is too long to memoize")
+
+    assert fake_encoding.calls == 4
+    assert counter.stats()["entries"] == 0
+
+
+def test_lru_evicts_least_recently_used(fake_encoding):
+    counter = TokenCounter(max_entries=2)
+
+    counter.count("a")
+    counter.count("b")
+    counter.count("a")
+    counter.count("c")  # evicts "b"
+    calls = fake_encoding.calls
+    counter.count("a")
+    counter.count("b")
+
+    assert fake_encoding.calls == calls + 1
+
+
+def test_count_many_keeps_input_order_with_duplicates(fake_encoding):
+    counter = TokenCounter()
+    counter.count("one")
+    texts = ["two words", "one", "three word string", "two words", ""]
+
+    counts = counter.count_many(texts)
+
+    assert counts == [2, 1, 3, 2, 0]
+    # "one" was cached; the duplicate "two words" is encoded once
+    assert fake_encoding.calls == 1 + 3
+    assert counts == [counter.count(text) for text in texts]
+
+
+def test_count_many_parallel_matches_sequential(fake_encoding):
+    counter = TokenCounter(num_threads=4, min_parallel_batch=8)
+    texts = [f"text number {i} " * (i % 5 + 1) for i in range(100)]
+
+    counts = counter.count_many(texts)
+
+    assert counts == [len(fake_encoding.encode(text)) for text in texts]
+    assert counter.count_many(texts) == counts
+    assert counter.stats()["hits"] == len(texts)
+
+
+def test_get_token_counter_is_shared_per_model(fake_encoding):
+    assert get_token_counter("gpt-4o") is get_token_counter("gpt-4o")
+    assert get_token_counter("gpt-4o") is not get_token_counter("gpt-4o-mini")
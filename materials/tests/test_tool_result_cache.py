@@ -0,0 +1,111 @@
+"""Tests for the per-session ReAct tool result cache."""
+
+import asyncio
+
+import pytest
+
+from redis_context_course.catalog_manifest import CatalogManifest
+from redis_context_course.tool_result_cache import ToolResultCache, canonical_args
+
+
+class FakeTool:
+    """Records executions and returns a fresh result for each one."""
+
+    def __init__(self, name, prefix="result"):
+        self.name = name
+        self.prefix = prefix
+        self.runs = 0
+
+    def __call__(self):
+        async def execute():
+            self.runs += 1
+            return f"{self.prefix} {self.runs}"
+
+        return execute()
+
+
+@pytest.fixture
+def manifest(redis_client):
+    return CatalogManifest(redis_client, index_name="course_catalog")
+
+
+@pytest.fixture
+def cache(redis_client, manifest):
+    return ToolResultCache(redis_client, manifest=manifest)
+
+
+def call(cache, session_id, tool, args):
+    return asyncio.run(cache.call(session_id, tool.name, args, tool))
+
+
+def test_canonical_args_normalizes_queries_and_drops_none():
+    assert canonical_args({"query": "Machine  learning?", "limit": None}) == canonical_args(
+        {"query": "machine learning"}
+    )
+    assert canonical_args({"b": 1, "a": 2}) == canonical_args({"a": 2, "b": 1})
+
+
+def test_repeated_call_is_served_from_cache(cache):
+    search = FakeTool("search_courses")
+
+    assert call(cache, "s1", search, {"query": "ML courses"}) == ("result 1", False)
+    assert call(cache, "s1", search, {"query": "ml courses?"}) == ("result 1", True)
+    assert search.runs == 1
+    assert cache.stats()["search_courses"]["hits"] == 1
+
+
+def test_results_are_scoped_per_session(cache):
+    search = FakeTool("search_courses")
+
+    call(cache, "s1", search, {"query": "ML courses"})
+    assert call(cache, "s2", search, {"query": "ML courses"}) == ("result 2", False)
+
+
+def test_store_memory_invalidates_search_memories(cache):
+    search_memories = FakeTool("search_memories")
+    store_memory = FakeTool("store_memory", prefix="stored")
+    args = {"query": "my preferences"}
+
+    call(cache, "s1", search_memories, args)
+    assert call(cache, "s1", search_memories, args)[1] is True
+
+    assert call(cache, "s1", store_memory, {"text": "I prefer online courses"}) == (
+        "stored 1",
+        False,
+    )
+    assert call(cache, "s1", search_memories, args) == ("result 2", False)
+    assert call(cache, "s1", search_memories, args) == ("result 2", True)
+
+
+def test_invalidation_is_per_session_and_tool(cache):
+    search_memories = FakeTool("search_memories")
+    search_courses = FakeTool("search_courses")
+    store_memory = FakeTool("store_memory")
+
+    call(cache, "s1", search_memories, {"query": "prefs"})
+    call(cache, "s2", search_memories, {"query": "prefs"})
+    call(cache, "s1", search_courses, {"query": "ML"})
+    call(cache, "s1", store_memory, {"text": "note"})
+
+    assert call(cache, "s2", search_memories, {"query": "prefs"})[1] is True
+    assert call(cache, "s1", search_courses, {"query": "ML"})[1] is True
+    assert call(cache, "s1", search_memories, {"query": "prefs"})[1] is False
+
+
+def test_side_effect_tools_and_errors_are_never_cached(cache):
+    store_memory = FakeTool("store_memory")
+    failing = FakeTool("search_courses", prefix="Error: search failed")
+
+    call(cache, "s1", store_memory, {"text": "note"})
+    assert call(cache, "s1", store_memory, {"text": "note"}) == ("result 2", False)
+    call(cache, "s1", failing, {"query": "ML"})
+    assert call(cache, "s1", failing, {"query": "ML"}) == ("Error: search failed 2", False)
+
+
+def test_new_catalog_version_retires_results(cache, manifest):
+    search = FakeTool("search_courses")
+
+    call(cache, "s1", search, {"query": "ML"})
+    manifest.publish([{"course_code": "CS010"}])
+
+    assert call(cache, "s1", search, {"query": "ML"}) == ("result 2", False)